@@ -0,0 +1,26 @@
+"""Composite (name, id) index for keyset pagination
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves ORDER BY name, id and the (name, id) > (:name, :id) cursor seek
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_places_name_id ON places (name, id)')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_places_name_id')
@@ -0,0 +1,208 @@
+"""Trigram-indexed multilingual search key on places
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+
+"""
+import re
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Search key normalization as of this revision, frozen here so the
+# backfill does not change when app.services.search does
+
+# The Indic blocks from Devanagari (U+0900) to Malayalam (U+0D7F) share the
+# ISCII layout, so one table indexed by offset within the 128 code point
+# block covers Bengali, Gurmukhi, Gujarati, Oriya, Tamil, Telugu, Kannada
+# and Malayalam too.
+INDIC_START = 0x0900
+INDIC_END = 0x0D7F
+
+VIRAMA = 0x4D
+NUKTA = 0x3C
+
+VOWELS = {
+    0x05: "a", 0x06: "aa", 0x07: "i", 0x08: "ii", 0x09: "u", 0x0A: "uu",
+    0x0B: "ri", 0x0C: "li", 0x0D: "e", 0x0E: "e", 0x0F: "e", 0x10: "ai",
+    0x11: "o", 0x12: "o", 0x13: "o", 0x14: "au", 0x60: "rii", 0x61: "lii",
+}
+
+VOWEL_SIGNS = {
+    0x3E: "aa", 0x3F: "i", 0x40: "ii", 0x41: "u", 0x42: "uu", 0x43: "ri",
+    0x44: "rii", 0x45: "e", 0x46: "e", 0x47: "e", 0x48: "ai", 0x49: "o",
+    0x4A: "o", 0x4B: "o", 0x4C: "au", 0x62: "li", 0x63: "lii",
+}
+
+CONSONANTS = {
+    0x15: "k", 0x16: "kh", 0x17: "g", 0x18: "gh", 0x19: "n",
+    0x1A: "ch", 0x1B: "chh", 0x1C: "j", 0x1D: "jh", 0x1E: "n",
+    0x1F: "t", 0x20: "th", 0x21: "d", 0x22: "dh", 0x23: "n",
+    0x24: "t", 0x25: "th", 0x26: "d", 0x27: "dh", 0x28: "n", 0x29: "n",
+    0x2A: "p", 0x2B: "ph", 0x2C: "b", 0x2D: "bh", 0x2E: "m",
+    0x2F: "y", 0x30: "r", 0x31: "r", 0x32: "l", 0x33: "l", 0x34: "l",
+    0x35: "v", 0x36: "sh", 0x37: "sh", 0x38: "s", 0x39: "h",
+    0x58: "q", 0x59: "kh", 0x5A: "g", 0x5B: "z", 0x5C: "r", 0x5D: "rh",
+    0x5E: "f", 0x5F: "y",
+}
+
+MODIFIERS = {0x01: "n", 0x02: "n", 0x03: "h"}
+
+# Applied in order to the Latin text; collapses spelling variants that
+# transliteration commonly produces (aspirates, long vowels, w/v, ...)
+PHONETIC_RULES = [
+    (re.compile(r"([kgcjtdpb])h+"), r"\1"),
+    (re.compile(r"sh"), "s"),
+    (re.compile(r"ph"), "f"),
+    (re.compile(r"w"), "v"),
+    (re.compile(r"z"), "j"),
+    (re.compile(r"q"), "k"),
+    (re.compile(r"x"), "ks"),
+    (re.compile(r"ee"), "i"),
+    (re.compile(r"oo"), "u"),
+    (re.compile(r"m(?=[bp])"), "n"),
+    (re.compile(r"([a-z])\1+"), r"\1"),
+]
+
+NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def _indic_offset(char: str) -> int | None:
+    code = ord(char)
+    if INDIC_START <= code <= INDIC_END:
+        return (code - INDIC_START) % 0x80
+    return None
+
+
+def transliterate(text: str) -> str:
+    """
+    Transliterate Indic script runs to plain Latin, leaving other text as is.
+    """
+    out = []
+    chars = list(text)
+
+    for i, char in enumerate(chars):
+        offset = _indic_offset(char)
+        if offset is None:
+            out.append(char)
+            continue
+
+        if offset in CONSONANTS:
+            out.append(CONSONANTS[offset])
+
+            # Inherent vowel, unless suppressed by a virama or replaced by
+            # a vowel sign; dropped at the end of a word (schwa deletion)
+            j = i + 1
+            if j < len(chars) and _indic_offset(chars[j]) == NUKTA:
+                j += 1
+            following = _indic_offset(chars[j]) if j < len(chars) else None
+            if following is None:
+                continue
+            if following == VIRAMA or following in VOWEL_SIGNS:
+                continue
+            if following in CONSONANTS or following in MODIFIERS \
+                    or following in VOWELS:
+                out.append("a")
+        elif offset in VOWEL_SIGNS:
+            out.append(VOWEL_SIGNS[offset])
+        elif offset in VOWELS:
+            out.append(VOWELS[offset])
+        elif offset in MODIFIERS:
+            out.append(MODIFIERS[offset])
+        elif 0x66 <= offset <= 0x6F:
+            out.append(str(offset - 0x66))
+        else:
+            # Virama, nukta, avagraha, danda and other signs
+            out.append(" " if offset in (0x64, 0x65) else "")
+
+    return "".join(out)
+
+
+def normalize_search_text(text: str | None) -> str:
+    """
+    Reduce text in any supported script to a lowercase Latin phonetic key.
+    """
+    if not text:
+        return ""
+
+    text = transliterate(text)
+    # Strip diacritics from romanized input such as "Chhatrapatī"
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = text.lower()
+
+    words = []
+    for word in NON_WORD.split(text):
+        for pattern, replacement in PHONETIC_RULES:
+            word = pattern.sub(replacement, word)
+        if word:
+            words.append(word)
+
+    return " ".join(words)
+
+
+def build_search_key(
+    name: str | None,
+    name_local: str | None,
+    address: str | None,
+) -> str:
+    """
+    Combined search key stored in places.search_key.
+    """
+    parts = [normalize_search_text(value) for value in (name, name_local, address)]
+    return " ".join(part for part in parts if part)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.add_column('places', sa.Column('search_key', sa.Text(), nullable=True))
+
+    # Backfill in keyset batches; the key is computed in Python with the
+    # normalization applied to search terms
+    conn = op.get_bind()
+    last_id = None
+    while True:
+        query = 'SELECT id, name, name_local, address FROM places'
+        params = {'limit': BACKFILL_BATCH_SIZE}
+        if last_id is not None:
+            query += ' WHERE id > :last_id'
+            params['last_id'] = last_id
+        query += ' ORDER BY id LIMIT :limit'
+
+        rows = conn.execute(sa.text(query), params).fetchall()
+        if not rows:
+            break
+
+        conn.execute(
+            sa.text('UPDATE places SET search_key = :search_key WHERE id = :id'),
+            [
+                {
+                    'id': row.id,
+                    'search_key': build_search_key(
+                        row.name, row.name_local, row.address),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_places_search_key_trgm '
+        'ON places USING gin (search_key gin_trgm_ops)')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_places_search_key_trgm')
+    op.drop_column('places', 'search_key')
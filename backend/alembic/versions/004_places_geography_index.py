@@ -0,0 +1,27 @@
+"""Geography expression index for KNN nearby search
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves ST_DWithin in metres and ORDER BY <-> on geography(location)
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_places_location_geog '
+        'ON places USING gist (geography(location))')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_places_location_geog')
@@ -0,0 +1,39 @@
+"""Maintained place_stats counters
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'place_stats',
+        sa.Column('accessibility_status', postgresql.ENUM('accessible', 'partially_accessible', 'not_accessible',
+                  'unknown', name='accessibilitystatus', create_type=False), primary_key=True),
+        sa.Column('category', sa.String(100), primary_key=True),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    op.execute("""
+        INSERT INTO place_stats (accessibility_status, category, count)
+        SELECT coalesce(accessibility_status, 'unknown'), category, count(*)
+        FROM places
+        GROUP BY 1, 2
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('place_stats')
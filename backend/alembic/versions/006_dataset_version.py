@@ -0,0 +1,36 @@
+"""Dataset version counter for HTTP validators
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'dataset_version',
+        sa.Column('id', sa.SmallInteger(), primary_key=True),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True),
+                  nullable=False, server_default=sa.func.now()),
+    )
+
+    op.execute("""
+        INSERT INTO dataset_version (id, version, updated_at)
+        SELECT 1, 1, coalesce(max(updated_at), now()) FROM places
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('dataset_version')
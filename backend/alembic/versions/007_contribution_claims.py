@@ -0,0 +1,35 @@
+"""Moderation claims (leases) on contributions
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('contributions', sa.Column(
+        'claimed_by', sa.String(255), nullable=True))
+    op.add_column('contributions', sa.Column(
+        'claim_expires_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Claim scans walk pending contributions oldest first
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_contributions_pending_queue '
+        "ON contributions (created_at, id) WHERE status = 'pending'")
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_contributions_pending_queue')
+    op.drop_column('contributions', 'claim_expires_at')
+    op.drop_column('contributions', 'claimed_by')
@@ -0,0 +1,49 @@
+"""Keyset indexes and status counters for contributions
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Match the admin list order so pages are read straight off the index
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_contributions_status_created '
+        'ON contributions (status, created_at DESC, id DESC)')
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_contributions_created '
+        'ON contributions (created_at DESC, id DESC)')
+
+    op.create_table(
+        'contribution_counts',
+        sa.Column('status', postgresql.ENUM('pending', 'approved', 'rejected',
+                  name='contributionstatus', create_type=False), primary_key=True),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    op.execute("""
+        INSERT INTO contribution_counts (status, count)
+        SELECT status, count(*)
+        FROM contributions
+        WHERE status IS NOT NULL
+        GROUP BY status
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('contribution_counts')
+    op.execute('DROP INDEX IF EXISTS idx_contributions_created')
+    op.execute('DROP INDEX IF EXISTS idx_contributions_status_created')
@@ -0,0 +1,28 @@
+"""Duplicate candidates on contributions
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Computed lazily for existing contributions
+    op.add_column('contributions', sa.Column(
+        'duplicate_candidates', postgresql.JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('contributions', 'duplicate_candidates')
@@ -0,0 +1,44 @@
+"""Persisted, indexed accessibility score on places
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('places', sa.Column(
+        'accessibility_score', sa.SmallInteger(), nullable=False, server_default='0'))
+
+    # Backfill with the default weights of this revision (every feature
+    # weighs 1.0, so the score is the share of the six present); statuses
+    # are left as they are until scripts.rescore_places is run
+    op.execute("""
+        UPDATE places SET accessibility_score = round(100 * (
+              CASE WHEN ramp_present IS true THEN 1 ELSE 0 END
+            + CASE WHEN step_free_entrance IS true THEN 1 ELSE 0 END
+            + CASE WHEN accessible_restroom IN ('partial', 'full') THEN 1 ELSE 0 END
+            + CASE WHEN tactile_paving IS true THEN 1 ELSE 0 END
+            + CASE WHEN audio_signage IS true OR braille_signage IS true THEN 1 ELSE 0 END
+            + CASE WHEN staff_assistance_available IS true THEN 1 ELSE 0 END
+        ) / 6.0)::smallint
+    """)
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_places_score_id '
+        'ON places (accessibility_score, id)')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_places_score_id')
+    op.drop_column('places', 'accessibility_score')
@@ -0,0 +1,43 @@
+"""Composite indexes for the place list sort orders
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # sort=-updated_at
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_places_updated_id '
+        'ON places (updated_at, id)')
+
+    # sort=name and sort=-score with one category and one status (other
+    # filter sets still sort); the first replaces idx_places_category_status,
+    # which is its prefix
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_places_category_status_name '
+        'ON places (category, accessibility_status, name, id)')
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_places_category_status_score '
+        'ON places (category, accessibility_status, accessibility_score, id)')
+    op.execute('DROP INDEX IF EXISTS idx_places_category_status')
+
+
+def downgrade() -> None:
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_places_category_status '
+        'ON places (category, accessibility_status)')
+    op.execute('DROP INDEX IF EXISTS idx_places_category_status_score')
+    op.execute('DROP INDEX IF EXISTS idx_places_category_status_name')
+    op.execute('DROP INDEX IF EXISTS idx_places_updated_id')
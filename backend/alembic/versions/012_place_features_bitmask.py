@@ -0,0 +1,46 @@
+"""Indexed accessibility features bitmask on places
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('places', sa.Column(
+        'features', sa.SmallInteger(), nullable=False, server_default='0'))
+
+    # Bits as of this revision: ramp 1, step-free entrance 2, tactile
+    # paving 4, audio signage 8, braille signage 16, staff assistance 32,
+    # accessible restroom 64 and full restroom 128
+    op.execute("""
+        UPDATE places SET features = (
+              CASE accessible_restroom WHEN 'full' THEN 192 WHEN 'partial' THEN 64 ELSE 0 END
+            + CASE WHEN ramp_present IS true THEN 1 ELSE 0 END
+            + CASE WHEN step_free_entrance IS true THEN 2 ELSE 0 END
+            + CASE WHEN tactile_paving IS true THEN 4 ELSE 0 END
+            + CASE WHEN audio_signage IS true THEN 8 ELSE 0 END
+            + CASE WHEN braille_signage IS true THEN 16 ELSE 0 END
+            + CASE WHEN staff_assistance_available IS true THEN 32 ELSE 0 END
+        )::smallint
+    """)
+
+    # "Has all of these features" filters are IN lists over mask values
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_places_features ON places (features)')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_places_features')
+    op.drop_column('places', 'features')
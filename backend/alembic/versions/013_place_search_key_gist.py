@@ -0,0 +1,28 @@
+"""GiST trigram index for ordering search matches by word distance
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves ORDER BY search_key <->> :key as a KNN scan; the GIN index
+    # stays for plain match filters and counts
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_places_search_key_gist '
+        'ON places USING gist (search_key gist_trgm_ops)')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_places_search_key_gist')
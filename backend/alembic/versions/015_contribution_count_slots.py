@@ -0,0 +1,39 @@
+"""Stripe contribution counts over slot rows
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing totals become slot 0; writers then spread over the slots
+    op.add_column('contribution_counts', sa.Column(
+        'slot', sa.SmallInteger(), nullable=False, server_default='0'))
+    op.execute('ALTER TABLE contribution_counts DROP CONSTRAINT contribution_counts_pkey')
+    op.execute('ALTER TABLE contribution_counts ADD PRIMARY KEY (status, slot)')
+
+
+def downgrade() -> None:
+    # Fold the slots back into one row per status
+    op.execute("""
+        WITH slots AS (
+            DELETE FROM contribution_counts RETURNING status, count
+        )
+        INSERT INTO contribution_counts (status, slot, count)
+        SELECT status, 0, sum(count) FROM slots GROUP BY status
+    """)
+    op.execute('ALTER TABLE contribution_counts DROP CONSTRAINT contribution_counts_pkey')
+    op.execute('ALTER TABLE contribution_counts ADD PRIMARY KEY (status)')
+    op.drop_column('contribution_counts', 'slot')
@@ -1,15 +1,57 @@
-from typing import Annotated
-from fastapi import Depends, Query
+import base64
+import binascii
+import json
+from typing import Annotated, Any, NamedTuple, Optional
+from uuid import UUID
+from fastapi import Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.config import settings
+from app.schemas.place import AccessibilityStatus, PlaceFeature, PlaceFilters
+from app.services.serialization import parse_fields
 
 
 # Database session dependency
 DbSession = Annotated[AsyncSession, Depends(get_db)]
 
 
+# Cursor helpers
+def encode_cursor(values: list[Any]) -> str:
+    """Encode the sort key of the last returned row as an opaque token"""
+    raw = json.dumps(values, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> list[Any]:
+    """Decode a token produced by encode_cursor, raising 400 if malformed"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if not isinstance(values, list):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return values
+
+
+def cursor_id(value: Any) -> UUID:
+    """Place or contribution id from a cursor, ValueError if malformed"""
+    if not isinstance(value, str):
+        raise ValueError("expected a UUID string")
+    return UUID(value)
+
+
+class Pagination(NamedTuple):
+    offset: int
+    limit: int
+    page: Optional[int]
+    after: Optional[list[Any]]
+    include_total: bool
+
+
 # Pagination dependencies
 def get_pagination_params(
     page: int = Query(1, ge=1, description="Page number"),
@@ -18,12 +60,90 @@ def get_pagination_params(
         ge=1,
         le=settings.max_page_size,
         description="Items per page"
-    )
-) -> tuple[int, int]:
-    """Returns (offset, limit) for pagination"""
+    ),
+    after: Optional[str] = Query(
+        None,
+        description="Cursor from a previous response's next_cursor; "
+                    "switches to keyset paging and ignores page"
+    ),
+    include_total: Optional[bool] = Query(
+        None,
+        description="Compute the exact total. Defaults to true for page "
+                    "based requests and false when paging with a cursor"
+    ),
+) -> Pagination:
+    """Returns offset/limit for page based paging, or the decoded cursor"""
+    if after is not None:
+        return Pagination(
+            offset=0,
+            limit=page_size,
+            page=None,
+            after=decode_cursor(after),
+            include_total=bool(include_total),
+        )
+
     offset = (page - 1) * page_size
-    return offset, page_size, page
+    return Pagination(
+        offset=offset,
+        limit=page_size,
+        page=page,
+        after=None,
+        include_total=include_total is not False,
+    )
+
+
+PaginationParams = Annotated[Pagination, Depends(get_pagination_params)]
+
+
+# Place filter dependencies
+def get_place_filters(
+    category: Optional[list[str]] = Query(None),
+    accessibility_status: Optional[list[AccessibilityStatus]] = Query(None),
+    ramp_present: Optional[bool] = None,
+    step_free_entrance: Optional[bool] = None,
+    tactile_paving: Optional[bool] = None,
+    audio_signage: Optional[bool] = None,
+    braille_signage: Optional[bool] = None,
+    staff_assistance_available: Optional[bool] = None,
+    min_score: Optional[int] = Query(
+        None, ge=0, le=100, description="Minimum accessibility score"),
+    features: Optional[list[PlaceFeature]] = Query(
+        None, description="Only places with all of these features"),
+    search: Optional[str] = Query(
+        None, description="Search by name or address"),
+) -> PlaceFilters:
+    """Collects the place filter query parameters shared by list endpoints"""
+    if search is not None:
+        search = search.strip() or None
+
+    return PlaceFilters(
+        category=category,
+        accessibility_status=accessibility_status,
+        ramp_present=ramp_present,
+        step_free_entrance=step_free_entrance,
+        tactile_paving=tactile_paving,
+        audio_signage=audio_signage,
+        braille_signage=braille_signage,
+        staff_assistance_available=staff_assistance_available,
+        min_score=min_score,
+        features=features,
+        search=search,
+    )
+
+
+PlaceFilterParams = Annotated[PlaceFilters, Depends(get_place_filters)]
+
 
+# Sparse fieldset dependency
+def get_place_fields(
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated place fields to return; "
+                    "id is always included"
+    ),
+) -> tuple[str, ...]:
+    """Validated place fields for list and nearby responses"""
+    return parse_fields(fields)
 
-PaginationParams = Annotated[tuple[int, int, int], Depends(get_pagination_params)]
 
+PlaceFieldsParam = Annotated[tuple[str, ...], Depends(get_place_fields)]
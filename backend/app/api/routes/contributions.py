@@ -1,31 +1,83 @@
-from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import select, func
-from uuid import UUID
-from typing import Optional
-
-from app.api.deps import DbSession, PaginationParams
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy import select, func, insert, update, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+from typing import Any, Optional
+
+from app.config import settings
+from app.api.deps import DbSession, PaginationParams, cursor_id, encode_cursor
 from app.models.place import (
     Contribution,
     Place,
     ContributionStatus as DBContributionStatus,
+    DataSource,
+    derived_place_values,
 )
 from app.schemas.place import (
     ContributionCreate,
     ContributionResponse,
+    ContributionAccepted,
+    DuplicateCandidate,
     ContributionReview,
+    ContributionClaimRequest,
     ContributionStatus,
+    ContributionDecision,
+    BulkReviewRequest,
+    BulkReviewOutcome,
+    BulkReviewResponse,
     PlaceResponse,
 )
+from app.services.contribution_counts import (
+    apply_status_changes,
+    read_status_count,
+)
+from app.services.duplicates import find_duplicate_candidates
+from app.services.place_events import (
+    PlaceSnapshot,
+    places_changed,
+    record_place_changes,
+)
+from app.services.response_cache import cache_key, response_cache
+from app.services.scoring import calculate_accessibility_status
+from app.services.submission_buffer import submission_buffer
 
 router = APIRouter()
 
 
-@router.post("", response_model=ContributionResponse, status_code=201)
+@router.post(
+    "",
+    response_model=ContributionResponse,
+    status_code=201,
+    responses={202: {
+        "model": ContributionAccepted,
+        "description": "Queued for a batched insert (write-behind mode)",
+    }},
+)
 async def submit_contribution(data: ContributionCreate, db: DbSession):
     """
     Submit a new contribution (public endpoint).
     Anyone can submit accessibility data for review.
+    With the submission buffer enabled the contribution is queued and
+    202 is returned with its id; 429 means the buffer is full.
     """
+    if submission_buffer.running:
+        accepted = ContributionAccepted(id=uuid4())
+        queued = submission_buffer.submit({
+            "id": accepted.id,
+            "created_at": datetime.now(timezone.utc),
+            **data.model_dump(),
+        })
+        if not queued:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many submissions, please retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        return JSONResponse(
+            status_code=202, content=accepted.model_dump(mode="json"))
+
     contribution = Contribution(
         place_id=data.place_id,
         contributor_name=data.contributor_name,
@@ -48,9 +100,15 @@ async def submit_contribution(data: ContributionCreate, db: DbSession):
         notes=data.notes,
     )
 
+    if contribution.place_id is None:
+        contribution.duplicate_candidates = await find_duplicate_candidates(
+            db, contribution)
+
     db.add(contribution)
+    await apply_status_changes(db, {DBContributionStatus.pending: 1})
     await db.commit()
     await db.refresh(contribution)
+    response_cache.invalidate("contributions")
 
     return contribution
 
@@ -58,39 +116,93 @@ async def submit_contribution(data: ContributionCreate, db: DbSession):
 @router.get("", response_model=list[ContributionResponse])
 async def list_contributions(
     db: DbSession,
+    response: Response,
     pagination: PaginationParams,
     status: Optional[ContributionStatus] = Query(None),
 ):
     """
-    List contributions (admin endpoint).
+    List contributions (admin endpoint), newest first.
+    Pass `after` (the X-Next-Cursor header of the previous response) to
+    page with a keyset seek on (created_at, id) instead of OFFSET.
     """
-    offset, limit, page = pagination
-
-    query = select(Contribution).order_by(Contribution.created_at.desc())
+    limit = pagination.limit
+    query = select(Contribution).order_by(
+        Contribution.created_at.desc(), Contribution.id.desc())
 
     if status:
         query = query.where(Contribution.status ==
                             DBContributionStatus(status.value))
 
-    query = query.offset(offset).limit(limit)
+    if pagination.after is not None:
+        try:
+            last_created_at, last_id = pagination.after
+            last_created_at = datetime.fromisoformat(last_created_at)
+            last_id = cursor_id(last_id)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.where(
+            tuple_(Contribution.created_at, Contribution.id)
+            < (last_created_at, last_id))
+    else:
+        query = query.offset(pagination.offset)
 
-    result = await db.execute(query)
+    # Fetch one extra row to know whether another page exists
+    result = await db.execute(query.limit(limit + 1))
     contributions = result.scalars().all()
 
-    return contributions
+    if len(contributions) > limit:
+        last = contributions[limit - 1]
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            [last.created_at.isoformat(), str(last.id)])
+
+    return contributions[:limit]
 
 
 @router.get("/pending/count")
-async def get_pending_count(db: DbSession):
+async def get_pending_count(request: Request, db: DbSession):
     """
-    Get count of pending contributions.
+    Get count of pending contributions, from the maintained counter.
     """
+    async def load_pending_count():
+        count = await read_status_count(db, DBContributionStatus.pending)
+        return {"pending_count": count}
+
+    return JSONResponse(await response_cache.get_or_load(
+        cache_key(request), ["contributions"], load_pending_count))
+
+
+@router.post("/claim", response_model=list[ContributionResponse])
+async def claim_contributions(claim: ContributionClaimRequest, db: DbSession):
+    """
+    Lease the oldest unclaimed pending contributions to a moderator.
+    Rows locked by a concurrent claim are skipped (FOR UPDATE SKIP LOCKED),
+    so moderators get disjoint batches; leases lapse after
+    CONTRIBUTION_LEASE_SECONDS.
+    """
+    claimable = (
+        select(Contribution.id)
+        .where(
+            Contribution.status == DBContributionStatus.pending,
+            lease_available(None),
+        )
+        .order_by(Contribution.created_at, Contribution.id)
+        .limit(claim.limit)
+        .with_for_update(skip_locked=True)
+    )
+    lease = timedelta(seconds=settings.contribution_lease_seconds)
+
     result = await db.execute(
-        select(func.count(Contribution.id))
-        .where(Contribution.status == DBContributionStatus.PENDING)
+        update(Contribution)
+        .where(Contribution.id.in_(claimable))
+        .values(claimed_by=claim.moderator, claim_expires_at=func.now() + lease)
+        .returning(Contribution)
+        .execution_options(synchronize_session=False)
     )
-    count = result.scalar()
-    return {"pending_count": count}
+    contributions = sorted(
+        result.scalars().all(), key=lambda c: (c.created_at, c.id))
+    await db.commit()
+
+    return contributions
 
 
 @router.get("/{contribution_id}", response_model=ContributionResponse)
@@ -109,14 +221,20 @@ async def get_contribution(contribution_id: UUID, db: DbSession):
     return contribution
 
 
-@router.post("/{contribution_id}/approve", response_model=PlaceResponse)
-async def approve_contribution(
+@router.get(
+    "/{contribution_id}/duplicates",
+    response_model=list[DuplicateCandidate],
+)
+async def get_duplicate_candidates(
     contribution_id: UUID,
     db: DbSession,
-    review: Optional[ContributionReview] = None,
+    refresh: bool = Query(False, description="Recompute against current places"),
 ):
     """
-    Approve a contribution and create/update the place.
+    Existing places a new-place contribution may duplicate, best match first.
+    Candidates are stored when the contribution is submitted; buffered
+    submissions get theirs on first request. Edits of existing places
+    have none.
     """
     result = await db.execute(
         select(Contribution).where(Contribution.id == contribution_id)
@@ -126,15 +244,43 @@ async def approve_contribution(
     if not contribution:
         raise HTTPException(status_code=404, detail="Contribution not found")
 
-    if contribution.status != DBContributionStatus.PENDING:
-        raise HTTPException(
-            status_code=400, detail="Contribution already reviewed")
+    if contribution.place_id is not None:
+        return []
+
+    if refresh or contribution.duplicate_candidates is None:
+        contribution.duplicate_candidates = await find_duplicate_candidates(
+            db, contribution)
+        await db.commit()
+
+    return contribution.duplicate_candidates
+
+
+@router.post("/{contribution_id}/approve", response_model=PlaceResponse)
+async def approve_contribution(
+    contribution_id: UUID,
+    db: DbSession,
+    review: Optional[ContributionReview] = None,
+):
+    """
+    Approve a contribution and create/update the place.
+    The status change is a single conditional UPDATE, so concurrent
+    approvals of the same contribution create at most one place.
+    """
+    contribution = await mark_reviewed(
+        db,
+        contribution_id,
+        DBContributionStatus.approved,
+        review.reviewer_notes if review else None,
+        review.moderator if review else None,
+    )
 
     # Create or update place
     if contribution.place_id:
         # Update existing place
         place_result = await db.execute(
-            select(Place).where(Place.id == contribution.place_id)
+            select(Place)
+            .where(Place.id == contribution.place_id)
+            .with_for_update()
         )
         place = place_result.scalar_one_or_none()
 
@@ -142,63 +288,26 @@ async def approve_contribution(
             raise HTTPException(
                 status_code=404, detail="Original place not found")
 
-        # Update place fields
-        place.name = contribution.name
-        place.name_local = contribution.name_local
-        place.category = contribution.category
-        place.address = contribution.address
-        place.latitude = contribution.latitude
-        place.longitude = contribution.longitude
-        place.location = f"SRID=4326;POINT({contribution.longitude} {contribution.latitude})"
-        place.ramp_present = contribution.ramp_present
-        place.step_free_entrance = contribution.step_free_entrance
-        place.accessible_restroom = contribution.accessible_restroom
-        place.tactile_paving = contribution.tactile_paving
-        place.audio_signage = contribution.audio_signage
-        place.braille_signage = contribution.braille_signage
-        place.lighting_level = contribution.lighting_level
-        place.noise_level = contribution.noise_level
-        place.staff_assistance_available = contribution.staff_assistance_available
-        place.notes = contribution.notes
-        # Recalculate accessibility status
-        place.accessibility_status = calculate_accessibility_status(
-            contribution)
+        before = PlaceSnapshot.of(place)
+
+        # Update place fields and recalculate accessibility status
+        for key, value in contribution_place_values(contribution).items():
+            setattr(place, key, value)
 
     else:
         # Create new place
-        place = Place(
-            name=contribution.name,
-            name_local=contribution.name_local,
-            category=contribution.category,
-            address=contribution.address,
-            latitude=contribution.latitude,
-            longitude=contribution.longitude,
-            location=f"SRID=4326;POINT({contribution.longitude} {contribution.latitude})",
-            ramp_present=contribution.ramp_present,
-            step_free_entrance=contribution.step_free_entrance,
-            accessible_restroom=contribution.accessible_restroom,
-            tactile_paving=contribution.tactile_paving,
-            audio_signage=contribution.audio_signage,
-            braille_signage=contribution.braille_signage,
-            lighting_level=contribution.lighting_level,
-            noise_level=contribution.noise_level,
-            staff_assistance_available=contribution.staff_assistance_available,
-            notes=contribution.notes,
-            accessibility_status=calculate_accessibility_status(contribution),
-            source="user",
-        )
+        before = None
+        place = Place(**contribution_place_values(contribution), source="user")
         db.add(place)
 
-    # Update contribution status
-    contribution.status = DBContributionStatus.APPROVED
-    if review and review.reviewer_notes:
-        contribution.reviewer_notes = review.reviewer_notes
-
-    from datetime import datetime, timezone
-    contribution.reviewed_at = datetime.now(timezone.utc)
+    await db.flush()
+    changes = [(before, PlaceSnapshot.of(place))]
+    await record_place_changes(db, changes)
 
     await db.commit()
     await db.refresh(place)
+    places_changed(changes)
+    response_cache.invalidate("contributions")
 
     return place
 
@@ -212,61 +321,277 @@ async def reject_contribution(
     """
     Reject a contribution.
     """
-    result = await db.execute(
-        select(Contribution).where(Contribution.id == contribution_id)
+    contribution = await mark_reviewed(
+        db,
+        contribution_id,
+        DBContributionStatus.rejected,
+        review.reviewer_notes,
+        review.moderator,
     )
-    contribution = result.scalar_one_or_none()
 
-    if not contribution:
-        raise HTTPException(status_code=404, detail="Contribution not found")
+    await db.commit()
+    response_cache.invalidate("contributions")
 
-    if contribution.status != DBContributionStatus.PENDING:
+    return contribution
+
+
+@router.post("/bulk-review", response_model=BulkReviewResponse)
+async def bulk_review_contributions(request: BulkReviewRequest, db: DbSession):
+    """
+    Approve or reject many contributions at once.
+    Decisions are applied in chunks, each loading its contributions and
+    places with one query apiece, writing them with set-based statements
+    and committing once. Every decision gets an outcome.
+    """
+    if len(request.decisions) > settings.bulk_review_max_items:
         raise HTTPException(
-            status_code=400, detail="Contribution already reviewed")
+            status_code=400,
+            detail=f"At most {settings.bulk_review_max_items} decisions per request")
+
+    outcomes: dict[int, BulkReviewOutcome] = {}
+    decisions: list[tuple[int, ContributionDecision]] = []
+    seen = set()
+    for index, decision in enumerate(request.decisions):
+        if decision.id in seen:
+            outcomes[index] = BulkReviewOutcome(id=decision.id, outcome="duplicate")
+        else:
+            seen.add(decision.id)
+            decisions.append((index, decision))
+
+    chunk_size = settings.bulk_review_chunk_size
+    for start in range(0, len(decisions), chunk_size):
+        outcomes.update(await review_chunk(
+            db, decisions[start:start + chunk_size], request.moderator))
+
+    response_cache.invalidate("contributions")
+
+    results = [outcomes[index] for index in range(len(request.decisions))]
+    approved = sum(result.outcome == "approved" for result in results)
+    rejected = sum(result.outcome == "rejected" for result in results)
+    return BulkReviewResponse(
+        approved=approved,
+        rejected=rejected,
+        failed=len(results) - approved - rejected,
+        results=results,
+    )
 
-    contribution.status = DBContributionStatus.REJECTED
-    contribution.reviewer_notes = review.reviewer_notes
 
-    from datetime import datetime, timezone
-    contribution.reviewed_at = datetime.now(timezone.utc)
+async def review_chunk(
+    db: AsyncSession,
+    decisions: list[tuple[int, ContributionDecision]],
+    moderator: Optional[str],
+) -> dict[int, BulkReviewOutcome]:
+    """
+    Apply one chunk of bulk review decisions in a single transaction.
+    """
+    # Lock the targets so concurrent reviews cannot apply them twice
+    result = await db.execute(
+        select(Contribution)
+        .where(Contribution.id.in_([decision.id for _, decision in decisions]))
+        .order_by(Contribution.id)
+        .with_for_update()
+    )
+    contributions = {contribution.id: contribution for contribution in result.scalars()}
+
+    place_ids = {c.place_id for c in contributions.values() if c.place_id}
+    places = {}
+    if place_ids:
+        result = await db.execute(
+            select(Place)
+            .where(Place.id.in_(place_ids))
+            .order_by(Place.id)
+            .with_for_update()
+        )
+        places = {place.id: place for place in result.scalars()}
+
+    now = datetime.now(timezone.utc)
+    outcomes: dict[int, BulkReviewOutcome] = {}
+    place_inserts: list[dict[str, Any]] = []
+    place_updates: list[dict[str, Any]] = []
+    reviews: list[dict[str, Any]] = []
+    changes = []
+    # Latest snapshot per place, for several edits to the same place
+    snapshots: dict[UUID, PlaceSnapshot] = {}
+
+    for index, decision in decisions:
+        contribution = contributions.get(decision.id)
+        if contribution is None:
+            outcomes[index] = BulkReviewOutcome(id=decision.id, outcome="not_found")
+            continue
+
+        if contribution.status != DBContributionStatus.pending:
+            outcomes[index] = BulkReviewOutcome(
+                id=decision.id, outcome="already_reviewed")
+            continue
+
+        lease = contribution.claim_expires_at
+        if lease is not None and lease > now and contribution.claimed_by != moderator:
+            outcomes[index] = BulkReviewOutcome(id=decision.id, outcome="claimed")
+            continue
+
+        review = {
+            "id": contribution.id,
+            "reviewer_notes": decision.reviewer_notes or contribution.reviewer_notes,
+            "reviewed_at": now,
+            "claimed_by": None,
+            "claim_expires_at": None,
+        }
+
+        if decision.status == ContributionStatus.rejected:
+            reviews.append({**review, "status": DBContributionStatus.rejected})
+            outcomes[index] = BulkReviewOutcome(id=decision.id, outcome="rejected")
+            continue
+
+        values = contribution_place_values(contribution)
+        values.update(derived_place_values(values))
+
+        if contribution.place_id:
+            place = places.get(contribution.place_id)
+            if place is None:
+                outcomes[index] = BulkReviewOutcome(
+                    id=decision.id, outcome="place_not_found")
+                continue
+            place_id = place.id
+            before = snapshots.get(place_id) or PlaceSnapshot.of(place)
+            place_updates.append({"id": place_id, **values})
+        else:
+            place_id = uuid4()
+            before = None
+            place_inserts.append({"id": place_id, **values, "source": DataSource.user})
+
+        after = PlaceSnapshot(
+            id=place_id,
+            category=values["category"],
+            accessibility_status=values["accessibility_status"].value,
+            latitude=values["latitude"],
+            longitude=values["longitude"],
+        )
+        snapshots[place_id] = after
+        changes.append((before, after))
+
+        reviews.append({**review, "status": DBContributionStatus.approved})
+        outcomes[index] = BulkReviewOutcome(
+            id=decision.id, outcome="approved", place_id=place_id)
+
+    # Set-based writes: one multi-row INSERT, executemany UPDATEs by id
+    if place_inserts:
+        await db.execute(insert(Place), place_inserts)
+    if place_updates:
+        await db.execute(update(Place), place_updates)
+    if reviews:
+        await db.execute(update(Contribution), reviews)
+        await apply_status_changes(db, {
+            DBContributionStatus.pending: -len(reviews),
+            DBContributionStatus.approved: sum(
+                review["status"] == DBContributionStatus.approved for review in reviews),
+            DBContributionStatus.rejected: sum(
+                review["status"] == DBContributionStatus.rejected for review in reviews),
+        })
+    if changes:
+        await record_place_changes(db, changes)
 
     await db.commit()
-    await db.refresh(contribution)
+    if changes:
+        places_changed(changes)
 
-    return contribution
+    return outcomes
 
 
-def calculate_accessibility_status(contribution: Contribution):
+def lease_available(moderator: Optional[str]):
     """
-    Calculate accessibility status based on attributes.
+    SQL condition: the contribution is unclaimed, its lease has lapsed,
+    or it is leased to `moderator`.
     """
-    from app.models.place import AccessibilityStatus, RestroomAccessibility
-
-    # Count positive accessibility features
-    score = 0
-    max_score = 6
-
-    if contribution.ramp_present:
-        score += 1
-    if contribution.step_free_entrance:
-        score += 1
-    if contribution.accessible_restroom in [RestroomAccessibility.partial, RestroomAccessibility.full]:
-        score += 1
-    if contribution.tactile_paving:
-        score += 1
-    if contribution.audio_signage or contribution.braille_signage:
-        score += 1
-    if contribution.staff_assistance_available:
-        score += 1
-
-    # Determine status based on score
-    ratio = score / max_score
-
-    if ratio >= 0.7:
-        return AccessibilityStatus.accessible
-    elif ratio >= 0.3:
-        return AccessibilityStatus.partially_accessible
-    elif score > 0:
-        return AccessibilityStatus.not_accessible
-    else:
-        return AccessibilityStatus.unknown
+    condition = or_(
+        Contribution.claim_expires_at.is_(None),
+        Contribution.claim_expires_at <= func.now(),
+    )
+    if moderator:
+        condition = or_(condition, Contribution.claimed_by == moderator)
+    return condition
+
+
+async def mark_reviewed(
+    db: AsyncSession,
+    contribution_id: UUID,
+    status: DBContributionStatus,
+    reviewer_notes: Optional[str],
+    moderator: Optional[str],
+) -> Contribution:
+    """
+    Move a pending contribution to `status` with one conditional
+    UPDATE ... WHERE status = 'pending' RETURNING. The row lock it takes
+    is held until commit, so a concurrent review of the same contribution
+    waits and then matches nothing.
+    """
+    values = {
+        "status": status,
+        "reviewed_at": func.now(),
+        "claimed_by": None,
+        "claim_expires_at": None,
+    }
+    if reviewer_notes:
+        values["reviewer_notes"] = reviewer_notes
+
+    result = await db.execute(
+        update(Contribution)
+        .where(
+            Contribution.id == contribution_id,
+            Contribution.status == DBContributionStatus.pending,
+            lease_available(moderator),
+        )
+        .values(**values)
+        .returning(Contribution)
+        .execution_options(synchronize_session=False)
+    )
+    contribution = result.scalar_one_or_none()
+    if contribution is not None:
+        await apply_status_changes(db, {
+            DBContributionStatus.pending: -1,
+            status: 1,
+        })
+        return contribution
+
+    # Nothing matched; report why
+    result = await db.execute(
+        select(Contribution.status).where(Contribution.id == contribution_id)
+    )
+    current_status = result.scalar_one_or_none()
+
+    if current_status is None:
+        raise HTTPException(status_code=404, detail="Contribution not found")
+
+    if current_status != DBContributionStatus.pending:
+        raise HTTPException(
+            status_code=400, detail="Contribution already reviewed")
+
+    raise HTTPException(
+        status_code=409, detail="Contribution is claimed by another moderator")
+
+
+def contribution_place_values(contribution: Contribution) -> dict[str, Any]:
+    """
+    Place column values taken from a contribution, with the accessibility
+    status recalculated from its attributes.
+    """
+    return {
+        "name": contribution.name,
+        "name_local": contribution.name_local,
+        "category": contribution.category,
+        "address": contribution.address,
+        "latitude": contribution.latitude,
+        "longitude": contribution.longitude,
+        "location": f"SRID=4326;POINT({contribution.longitude} {contribution.latitude})",
+        "ramp_present": contribution.ramp_present,
+        "step_free_entrance": contribution.step_free_entrance,
+        "accessible_restroom": contribution.accessible_restroom,
+        "tactile_paving": contribution.tactile_paving,
+        "audio_signage": contribution.audio_signage,
+        "braille_signage": contribution.braille_signage,
+        "lighting_level": contribution.lighting_level,
+        "noise_level": contribution.noise_level,
+        "staff_assistance_available": contribution.staff_assistance_available,
+        "notes": contribution.notes,
+        "accessibility_status": calculate_accessibility_status(contribution),
+        "status_explicit": False,
+    }
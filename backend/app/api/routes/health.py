@@ -2,6 +2,8 @@ from fastapi import APIRouter
 from sqlalchemy import text
 
 from app.api.deps import DbSession
+from app.services.response_cache import response_cache
+from app.services.submission_buffer import submission_buffer
 
 router = APIRouter()
 
@@ -21,3 +23,11 @@ async def db_health_check(db: DbSession):
     except Exception as e:
         return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
 
+
+@router.get("/health/cache")
+async def cache_stats():
+    """Response cache and submission buffer counters"""
+    return {
+        "response_cache": response_cache.stats(),
+        "submission_buffer": submission_buffer.stats(),
+    }
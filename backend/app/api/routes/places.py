@@ -1,143 +1,279 @@
-from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import select, func, and_, or_
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import (
+    select, and_, or_, true, values, column, Integer, Float
+)
 from sqlalchemy.orm import load_only
-from geoalchemy2.functions import ST_DWithin, ST_MakePoint, ST_SetSRID, ST_Distance
+from geoalchemy2.functions import ST_DWithin, ST_MakeEnvelope
+from datetime import datetime
 from uuid import UUID
-from typing import Optional
-
-from app.api.deps import DbSession, PaginationParams
+from typing import Literal, Optional
+
+from app.config import settings
+from app.api.deps import (
+    DbSession,
+    PaginationParams,
+    PlaceFieldsParam,
+    PlaceFilterParams,
+    cursor_id,
+    decode_cursor,
+    encode_cursor,
+)
 from app.models.place import Place, AccessibilityStatus as DBAccessibilityStatus
 from app.schemas.place import (
     PlaceCreate,
     PlaceUpdate,
     PlaceResponse,
+    NearbyPlaceResponse,
     PlaceListResponse,
     PlaceFilters,
     NearbySearchParams,
     StatsResponse,
     AccessibilityStatus,
+    PlaceFeature,
+    PlaceMarker,
+    PlaceMarkerColumns,
+    BBoxResponse,
+    PlaceCluster,
+    ClusterResponse,
+    NearbyBatchRequest,
+    NearbyBatchResult,
+)
+from app.services.clusters import blocks_in_bbox, cluster_index, get_clusters
+from app.services.conditional import dataset_validators
+from app.services.count_cache import count_places
+from app.services.export import MEDIA_TYPES, stream_places
+from app.services.features import allowed_masks, feature_bits, features_condition
+from app.services.markers import MARKERS_MEDIA_TYPE, MarkerColumns, markers_query
+from app.services.geo import knn_distance, place_geography, point_geography
+from app.services.place_events import (
+    PlaceSnapshot,
+    places_changed,
+    record_place_changes,
 )
+from app.services.place_stats import read_place_stats
+from app.services.replica import ReplicaFilter, place_replica
+from app.services.response_cache import cache_key, response_cache
+from app.services.place_filters import build_place_conditions, filters_cache_key
+from app.services.place_sorts import DISTANCE_SORT, PLACE_SORTS
+from app.services.search import search_distance
+from app.services.serialization import (
+    PLACE_FIELDS,
+    FastJSONResponse,
+    place_columns,
+    serialize_place,
+)
+from app.services.tiles import MVT_MEDIA_TYPE, get_tile
 
 router = APIRouter()
 
+# Columns of the lean bbox marker rows
+MARKER_FIELDS = tuple(PlaceMarker.model_fields)
+
 
 @router.get("", response_model=PlaceListResponse)
 async def list_places(
+    request: Request,
     db: DbSession,
     pagination: PaginationParams,
-    # Filter parameters
-    category: Optional[list[str]] = Query(None),
-    accessibility_status: Optional[list[AccessibilityStatus]] = Query(None),
-    ramp_present: Optional[bool] = None,
-    step_free_entrance: Optional[bool] = None,
-    tactile_paving: Optional[bool] = None,
-    audio_signage: Optional[bool] = None,
-    braille_signage: Optional[bool] = None,
-    staff_assistance_available: Optional[bool] = None,
-    search: Optional[str] = Query(
-        None, description="Search by name or address"),
+    filters: PlaceFilterParams,
+    fields: PlaceFieldsParam,
+    sort: Literal["name", "-updated_at", "-score", "distance"] = Query(
+        "name",
+        description="`distance` orders nearest first from latitude/longitude"
+    ),
+    latitude: Optional[float] = Query(None, ge=-90, le=90),
+    longitude: Optional[float] = Query(None, ge=-180, le=180),
+    total_mode: Literal["exact", "estimated"] = Query(
+        "exact",
+        description="`estimated` returns the planner's row estimate for "
+                    "wide filter sets instead of counting them"
+    ),
 ):
     """
     List all places with optional filtering and pagination.
-    """
-    offset, limit, page = pagination
 
-    # Build query
-    query = select(Place)
-    count_query = select(func.count(Place.id))
+    Pass `after` (the previous response's `next_cursor`) to page with a
+    keyset seek on the sort key and id instead of OFFSET. Searches match names in
+    Latin or Indic scripts and are ordered by relevance first. The exact total is only
+    computed when requested in cursor mode, and totals are cached per
+    filter set until the next place write. `fields` limits each item to
+    the listed fields. Unfiltered sort orders read pages straight off a
+    (key, id) index.
+    """
+    if sort == DISTANCE_SORT and (latitude is None or longitude is None):
+        raise HTTPException(
+            status_code=400,
+            detail="sort=distance requires latitude and longitude")
+
+    validators = await dataset_validators(request, db)
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    limit = pagination.limit
+
+    # Build query over plain columns; the sort key and id feed the cursor
+    distance = None
+    place_sort = PLACE_SORTS.get(sort)
+    if place_sort is not None:
+        query = select(*place_columns(fields, place_sort.field))
+    else:
+        distance = knn_distance(point_geography(longitude, latitude))
+        query = select(*place_columns(fields), distance.label("distance_m"))
 
     # Apply filters
-    conditions = []
-
-    if category:
-        conditions.append(Place.category.in_(category))
-
-    if accessibility_status:
-        db_statuses = [DBAccessibilityStatus(
-            s.value) for s in accessibility_status]
-        conditions.append(Place.accessibility_status.in_(db_statuses))
-
-    if ramp_present is not None:
-        conditions.append(Place.ramp_present == ramp_present)
-
-    if step_free_entrance is not None:
-        conditions.append(Place.step_free_entrance == step_free_entrance)
-
-    if tactile_paving is not None:
-        conditions.append(Place.tactile_paving == tactile_paving)
-
-    if audio_signage is not None:
-        conditions.append(Place.audio_signage == audio_signage)
-
-    if braille_signage is not None:
-        conditions.append(Place.braille_signage == braille_signage)
-
-    if staff_assistance_available is not None:
-        conditions.append(Place.staff_assistance_available ==
-                          staff_assistance_available)
-
-    if search:
-        search_term = f"%{search}%"
-        conditions.append(
-            or_(
-                Place.name.ilike(search_term),
-                Place.name_local.ilike(search_term),
-                Place.address.ilike(search_term)
-            )
-        )
-
+    conditions = build_place_conditions(filters)
     if conditions:
         query = query.where(and_(*conditions))
-        count_query = count_query.where(and_(*conditions))
 
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
+    # Get total count (opt-in when paging with a cursor)
+    total = None
+    pages = None
+    total_estimated = False
+    if pagination.include_total:
+        counted = await count_places(
+            db,
+            filters_cache_key(filters),
+            conditions,
+            estimated=total_mode == "estimated",
+        )
+        total = counted.total
+        total_estimated = counted.estimated
+        pages = (total + limit - 1) // limit if total > 0 else 0
+
+    # Order search matches by relevance (nearest search key first),
+    # keeping the sort order for ties
+    rank = None
+    if filters.search:
+        rank = search_distance(Place.search_key, filters.search)
+        query = query.add_columns(rank.label("rank"))
 
     # Apply pagination and ordering
-    query = query.order_by(Place.name).offset(offset).limit(limit)
+    if pagination.after is not None:
+        try:
+            if rank is not None:
+                last_rank, last_value, last_id = pagination.after
+                last_rank = float(last_rank)
+            else:
+                last_value, last_id = pagination.after
+            last_id = cursor_id(last_id)
+
+            if place_sort is not None:
+                seek = place_sort.seek(last_value, last_id)
+            else:
+                last_distance = float(last_value)
+                seek = or_(
+                    distance > last_distance,
+                    and_(distance == last_distance, Place.id > last_id),
+                )
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        if rank is not None:
+            seek = or_(rank > last_rank, and_(rank == last_rank, seek))
+        query = query.where(seek)
+    else:
+        query = query.offset(pagination.offset)
+
+    if place_sort is not None:
+        order_by = place_sort.order_by()
+    else:
+        order_by = [distance, Place.id]
+    if rank is not None:
+        order_by.insert(0, rank)
+
+    # Fetch one extra row to know whether another page exists
+    query = query.order_by(*order_by).limit(limit + 1)
 
     # Execute query
     result = await db.execute(query)
-    places = result.scalars().all()
-
-    # Calculate pages
-    pages = (total + limit - 1) // limit if total > 0 else 0
-
-    return PlaceListResponse(
-        items=places,
-        total=total,
-        page=page,
-        page_size=limit,
-        pages=pages
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        if place_sort is not None:
+            cursor = [getattr(last, place_sort.field), str(last.id)]
+        else:
+            cursor = [last.distance_m, str(last.id)]
+        if rank is not None:
+            cursor.insert(0, last.rank)
+        next_cursor = encode_cursor(cursor)
+
+    return FastJSONResponse(
+        {
+            "items": [serialize_place(row, fields) for row in rows[:limit]],
+            "total": total,
+            "page": pagination.page,
+            "page_size": limit,
+            "pages": pages,
+            "next_cursor": next_cursor,
+            "total_estimated": total_estimated,
+        },
+        headers=validators.headers(),
     )
 
 
-@router.get("/nearby", response_model=list[PlaceResponse])
+@router.get("/nearby", response_model=list[NearbyPlaceResponse])
 async def find_nearby_places(
     db: DbSession,
+    fields: PlaceFieldsParam,
     latitude: float = Query(..., ge=-90, le=90),
     longitude: float = Query(..., ge=-180, le=180),
     radius_km: float = Query(5.0, gt=0, le=50, description="Radius in km"),
     limit: int = Query(20, ge=1, le=100),
     accessibility_status: Optional[list[AccessibilityStatus]] = Query(None),
+    features: Optional[list[PlaceFeature]] = Query(
+        None, description="Only places with all of these features"),
+    after: Optional[str] = Query(
+        None, description="X-Next-Cursor header of the previous response"),
 ):
     """
-    Find places within a radius of a given point.
-    Uses PostGIS for efficient geospatial queries.
+    Find places within a radius of a given point, nearest first.
+    Uses an index-driven KNN search on geography(location); each result
+    carries distance_m, and the X-Next-Cursor response header continues
+    the search when more places are in range. `fields` limits each item
+    to the listed fields. Served from the in-memory replica when enabled
+    and current.
     """
     # Convert km to meters for PostGIS
     radius_m = radius_km * 1000
 
+    # Continue after the last place of the previous page
+    last = None
+    if after is not None:
+        try:
+            last_distance, last_id = decode_cursor(after)
+            last = (float(last_distance), cursor_id(last_id))
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    masks = allowed_masks(required=feature_bits(features or []))
+
+    if place_replica.usable():
+        matches = place_replica.data.nearby(
+            latitude,
+            longitude,
+            radius_m,
+            ReplicaFilter.of(PlaceFilters(
+                accessibility_status=accessibility_status, features=features)),
+            last,
+            limit + 1,
+            fields,
+        )
+        if matches is not None:
+            return nearby_response(matches, limit)
+
     # Create point from coordinates
-    point = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)
+    point = point_geography(longitude, latitude)
+    distance = knn_distance(point)
 
     # Build query with distance filter
     query = (
-        select(Place)
-        .where(ST_DWithin(Place.location, point, radius_m, use_spheroid=True))
-        .order_by(ST_Distance(Place.location, point))
-        .limit(limit)
+        select(*place_columns(fields), distance.label("distance_m"))
+        .where(ST_DWithin(place_geography(), point, radius_m))
+        .order_by(distance, Place.id)
+        .limit(limit + 1)
     )
 
     # Apply accessibility filter if provided
@@ -146,72 +282,389 @@ async def find_nearby_places(
             s.value) for s in accessibility_status]
         query = query.where(Place.accessibility_status.in_(db_statuses))
 
+    if masks is not None:
+        query = query.where(features_condition(masks))
+
+    if last is not None:
+        last_distance, last_id = last
+        query = query.where(or_(
+            distance > last_distance,
+            and_(distance == last_distance, Place.id > last_id),
+        ))
+
     result = await db.execute(query)
-    places = result.scalars().all()
+    return nearby_response(
+        [(serialize_place(row, fields), row.distance_m) for row in result.all()], limit)
+
+
+def nearby_response(matches: list, limit: int) -> FastJSONResponse:
+    """
+    Nearby items from (place, distance_m) pairs, with the next page cursor.
+    """
+    headers = {}
+    if len(matches) > limit:
+        place, distance_m = matches[limit - 1]
+        headers["X-Next-Cursor"] = encode_cursor([distance_m, str(place["id"])])
+
+    places = []
+    for place, distance_m in matches[:limit]:
+        place["distance_m"] = distance_m
+        places.append(place)
+
+    return FastJSONResponse(places, headers=headers)
 
-    return places
+
+@router.post("/nearby/batch", response_model=list[NearbyBatchResult])
+async def find_nearby_places_batch(request: NearbyBatchRequest, db: DbSession):
+    """
+    Nearby search for many origin points in one statement.
+    Each origin is resolved with a LATERAL KNN join against places and
+    results are grouped per origin, in request order.
+    """
+    if len(request.origins) > settings.nearby_batch_max_origins:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.nearby_batch_max_origins} origins per request")
+
+    origins = values(
+        column("idx", Integer),
+        column("latitude", Float),
+        column("longitude", Float),
+        column("radius_m", Float),
+        column("max_results", Integer),
+        name="origins",
+    ).data([
+        (i, o.latitude, o.longitude, o.radius_km * 1000, o.limit)
+        for i, o in enumerate(request.origins)
+    ])
+
+    point = point_geography(origins.c.longitude, origins.c.latitude)
+    distance = knn_distance(point)
+
+    nearest = (
+        select(*place_columns(PLACE_FIELDS), distance.label("distance_m"))
+        .where(ST_DWithin(place_geography(), point, origins.c.radius_m))
+        .order_by(distance, Place.id)
+        .limit(origins.c.max_results)
+    )
+
+    if request.accessibility_status:
+        db_statuses = [DBAccessibilityStatus(
+            s.value) for s in request.accessibility_status]
+        nearest = nearest.where(Place.accessibility_status.in_(db_statuses))
+
+    nearest = nearest.lateral("nearest")
+
+    query = (
+        select(origins.c.idx, nearest)
+        .select_from(origins)
+        .join(nearest, true())
+        .order_by(origins.c.idx, nearest.c.distance_m)
+    )
+    result = await db.execute(query)
+
+    grouped = [{"origin": i, "items": []}
+               for i in range(len(request.origins))]
+    for row in result:
+        item = serialize_place(row)
+        item["distance_m"] = row.distance_m
+        grouped[row.idx]["items"].append(item)
+
+    return FastJSONResponse(grouped)
+
+
+@router.get("/bbox", response_model=BBoxResponse)
+async def find_places_in_bbox(
+    db: DbSession,
+    filters: PlaceFilterParams,
+    min_lon: float = Query(..., ge=-180, le=180),
+    min_lat: float = Query(..., ge=-90, le=90),
+    max_lon: float = Query(..., ge=-180, le=180),
+    max_lat: float = Query(..., ge=-90, le=90),
+):
+    """
+    Places inside the current map view, as lean marker rows.
+    Views holding more than the row budget return `too_dense` instead.
+    """
+    if min_lon > max_lon or min_lat > max_lat:
+        raise HTTPException(status_code=400, detail="Invalid bbox")
+
+    max_rows = settings.bbox_max_rows
+
+    replica_filter = ReplicaFilter.of(filters)
+    if place_replica.usable() and replica_filter is not None:
+        places = place_replica.data.bbox(
+            min_lon, min_lat, max_lon, max_lat, replica_filter, max_rows + 1,
+            MARKER_FIELDS)
+        return bbox_response(places, max_rows)
+
+    envelope = ST_MakeEnvelope(min_lon, min_lat, max_lon, max_lat, 4326)
+
+    query = (
+        select(Place)
+        .options(load_only(
+            Place.id,
+            Place.name,
+            Place.category,
+            Place.latitude,
+            Place.longitude,
+            Place.accessibility_status,
+            Place.features,
+        ))
+        .where(Place.location.op("&&")(envelope))
+        .where(*build_place_conditions(filters))
+        .limit(max_rows + 1)
+    )
+
+    result = await db.execute(query)
+    return bbox_response(result.scalars().all(), max_rows)
+
+
+def bbox_response(places: list, max_rows: int) -> BBoxResponse:
+    if len(places) > max_rows:
+        return BBoxResponse(items=[], too_dense=True, max_rows=max_rows)
+
+    return BBoxResponse(
+        items=[PlaceMarker.model_validate(place) for place in places],
+        max_rows=max_rows,
+    )
+
+
+def parse_bbox(bbox: str) -> tuple[float, float, float, float]:
+    """Parse "min_lon,min_lat,max_lon,max_lat", raising 400 if invalid"""
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(v) for v in bbox.split(","))
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="bbox must be min_lon,min_lat,max_lon,max_lat")
+
+    if not (-180 <= min_lon <= max_lon <= 180 and -90 <= min_lat <= max_lat <= 90):
+        raise HTTPException(status_code=400, detail="Invalid bbox")
+
+    return min_lon, min_lat, max_lon, max_lat
+
+
+@router.get("/clusters", response_model=ClusterResponse)
+async def get_place_clusters(
+    db: DbSession,
+    bbox: str = Query(..., description="min_lon,min_lat,max_lon,max_lat"),
+    zoom: int = Query(..., ge=0, le=settings.cluster_max_zoom),
+):
+    """
+    Group places in a bounding box into grid cells for a zoom level.
+    Each cell returns its centroid, count and status breakdown.
+    """
+    min_lon, min_lat, max_lon, max_lat = parse_bbox(bbox)
+
+    blocks = blocks_in_bbox(zoom, min_lon, min_lat, max_lon, max_lat)
+    if len(blocks) > settings.cluster_max_request_blocks:
+        raise HTTPException(
+            status_code=400, detail="bbox is too large for this zoom level")
+
+    cells = await get_clusters(db, zoom, min_lon, min_lat, max_lon, max_lat)
+
+    return ClusterResponse(
+        zoom=zoom,
+        cell_size=cluster_index.cell_size(zoom),
+        clusters=[
+            PlaceCluster(
+                latitude=cell.sum_latitude / cell.count,
+                longitude=cell.sum_longitude / cell.count,
+                count=cell.count,
+                by_status=dict(cell.by_status),
+            )
+            for _, cell in cells
+        ],
+    )
+
+
+@router.get("/markers", response_model=PlaceMarkerColumns)
+async def get_place_markers(
+    request: Request,
+    db: DbSession,
+    filters: PlaceFilterParams,
+    bbox: Optional[str] = Query(
+        None, description="min_lon,min_lat,max_lon,max_lat"),
+    encoding: Literal["plain", "delta"] = Query(
+        "plain",
+        description="`delta` sends coordinates as integer micro-degree "
+                    "differences from the previous marker"
+    ),
+    marker_format: Literal["json", "binary"] = Query(
+        "json",
+        alias="format",
+        description="`binary` returns a little-endian buffer of float32 "
+                    "coordinates and integer codes"
+    ),
+):
+    """
+    All markers matching the filters as parallel arrays of ids,
+    coordinates and status/category codes, plus the code lookup tables.
+    """
+    validators = await dataset_validators(request, db)
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    envelope = None
+    if bbox is not None:
+        envelope = ST_MakeEnvelope(*parse_bbox(bbox), 4326)
+
+    max_rows = settings.markers_max_rows
+    delta = marker_format == "json" and encoding == "delta"
+    query = markers_query(filters, envelope, delta=delta).limit(max_rows + 1)
+    result = await db.execute(query)
+    markers = MarkerColumns(result.all())
+
+    if len(markers) > max_rows:
+        raise HTTPException(
+            status_code=400,
+            detail=f"More than {max_rows} markers match; narrow the filters or bbox")
+
+    if marker_format == "binary":
+        return Response(
+            content=markers.to_binary(),
+            media_type=MARKERS_MEDIA_TYPE,
+            headers=validators.headers(),
+        )
+
+    return FastJSONResponse(markers.to_json(delta), headers=validators.headers())
+
+
+@router.get("/export")
+async def export_places(
+    filters: PlaceFilterParams,
+    fields: PlaceFieldsParam,
+    export_format: Literal["ndjson", "geojson", "csv"] = Query(
+        "ndjson", alias="format"),
+):
+    """
+    Stream the full dataset (or a filtered subset) as NDJSON, GeoJSON or CSV.
+    Rows are read from a server-side cursor, so memory use stays constant.
+    `fields` limits the exported columns, e.g. `features` in place of the
+    individual accessibility attributes.
+    """
+    return StreamingResponse(
+        stream_places(filters, export_format, fields),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="places.{export_format}"',
+        },
+    )
 
 
 @router.get("/stats", response_model=StatsResponse)
-async def get_stats(db: DbSession):
+async def get_stats(request: Request, db: DbSession):
     """
     Get aggregate statistics about places.
+    Served from the place_stats counters, which every write keeps current,
+    or from the in-memory replica's counts when it is enabled and current.
     """
-    # Total count
-    total_result = await db.execute(select(func.count(Place.id)))
-    total = total_result.scalar()
-
-    # Count by status
-    status_query = select(
-        Place.accessibility_status,
-        func.count(Place.id)
-    ).group_by(Place.accessibility_status)
-
-    status_result = await db.execute(status_query)
-    status_counts = {row[0].value: row[1] for row in status_result}
-
-    # Count by category
-    category_query = select(
-        Place.category,
-        func.count(Place.id)
-    ).group_by(Place.category).order_by(func.count(Place.id).desc())
-
-    category_result = await db.execute(category_query)
-    category_counts = {row[0]: row[1] for row in category_result}
-
-    return StatsResponse(
-        total=total,
-        accessible=status_counts.get("accessible", 0),
-        partially_accessible=status_counts.get("partially_accessible", 0),
-        not_accessible=status_counts.get("not_accessible", 0),
-        unknown=status_counts.get("unknown", 0),
-        by_category=category_counts
+    from_replica = place_replica.usable()
+    validators = await dataset_validators(request, db, replica=from_replica)
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    async def load_stats():
+        status_counts: dict[str, int] = {}
+        category_counts: dict[str, int] = {}
+        cross_tab: dict[str, dict[str, int]] = {}
+
+        if from_replica:
+            rows = place_replica.data.stats()
+        else:
+            rows = await read_place_stats(db)
+
+        for status, category, count in rows:
+            status_counts[status] = status_counts.get(status, 0) + count
+            category_counts[category] = category_counts.get(category, 0) + count
+            cross_tab.setdefault(status, {})[category] = count
+
+        return StatsResponse(
+            total=sum(status_counts.values()),
+            accessible=status_counts.get("accessible", 0),
+            partially_accessible=status_counts.get("partially_accessible", 0),
+            not_accessible=status_counts.get("not_accessible", 0),
+            unknown=status_counts.get("unknown", 0),
+            by_category=dict(sorted(
+                category_counts.items(), key=lambda item: item[1], reverse=True)),
+            by_status_and_category=cross_tab,
+        ).model_dump(mode="json")
+
+    # Replica counts can lag the counters, so each source has its own entry
+    key = cache_key(request) + ("#replica" if from_replica else "")
+    return JSONResponse(
+        await response_cache.get_or_load(key, ["stats"], load_stats),
+        headers=validators.headers(),
     )
 
 
 @router.get("/categories", response_model=list[str])
-async def get_categories(db: DbSession):
+async def get_categories(request: Request, db: DbSession):
     """
     Get list of all unique categories.
     """
-    query = select(Place.category).distinct().order_by(Place.category)
-    result = await db.execute(query)
-    categories = [row[0] for row in result]
-    return categories
+    validators = await dataset_validators(request, db)
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    async def load_categories():
+        query = select(Place.category).distinct().order_by(Place.category)
+        result = await db.execute(query)
+        return [row[0] for row in result]
+
+    return JSONResponse(
+        await response_cache.get_or_load(
+            cache_key(request), ["categories"], load_categories),
+        headers=validators.headers(),
+    )
+
+
+@router.get("/tiles/{z}/{x}/{y}.mvt")
+async def get_places_tile(z: int, x: int, y: int, db: DbSession):
+    """
+    Mapbox Vector Tile of places (layer "places") for the map.
+    Features carry only id, status and category.
+    """
+    if not 0 <= z <= settings.tile_max_zoom:
+        raise HTTPException(status_code=404, detail="Zoom level out of range")
+
+    if not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        raise HTTPException(status_code=404, detail="Tile out of range")
+
+    tile = await get_tile(db, z, x, y)
+
+    return Response(
+        content=tile,
+        media_type=MVT_MEDIA_TYPE,
+        headers={"Cache-Control": f"public, max-age={settings.tile_http_max_age}"},
+    )
 
 
 @router.get("/{place_id}", response_model=PlaceResponse)
-async def get_place(place_id: UUID, db: DbSession):
+async def get_place(place_id: UUID, request: Request, db: DbSession):
     """
     Get a single place by ID.
+    Last-Modified (sent and checked) is the place's own updated_at.
     """
-    result = await db.execute(select(Place).where(Place.id == place_id))
-    place = result.scalar_one_or_none()
+    async def load_place():
+        result = await db.execute(select(Place).where(Place.id == place_id))
+        place = result.scalar_one_or_none()
 
-    if not place:
-        raise HTTPException(status_code=404, detail="Place not found")
+        if not place:
+            raise HTTPException(status_code=404, detail="Place not found")
 
-    return place
+        return PlaceResponse.model_validate(place).model_dump(mode="json")
+
+    place = await response_cache.get_or_load(
+        cache_key(request), [f"place:{place_id}"], load_place)
+
+    validators = (await dataset_validators(request, db))._replace(
+        last_modified=datetime.fromisoformat(place["updated_at"]))
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    return JSONResponse(place, headers=validators.headers())
 
 
 @router.post("", response_model=PlaceResponse, status_code=201)
@@ -224,12 +677,20 @@ async def create_place(place_data: PlaceCreate, db: DbSession):
 
     place = Place(
         **place_data.model_dump(),
-        location=location
+        location=location,
+        # A status given by the admin is kept when places are rescored
+        status_explicit="accessibility_status" in place_data.model_fields_set,
     )
 
     db.add(place)
+    await db.flush()
+
+    changes = [(None, PlaceSnapshot.of(place))]
+    await record_place_changes(db, changes)
+
     await db.commit()
     await db.refresh(place)
+    places_changed(changes)
 
     return place
 
@@ -245,8 +706,12 @@ async def update_place(place_id: UUID, place_data: PlaceUpdate, db: DbSession):
     if not place:
         raise HTTPException(status_code=404, detail="Place not found")
 
+    before = PlaceSnapshot.of(place)
+
     # Update only provided fields
     update_data = place_data.model_dump(exclude_unset=True)
+    if "accessibility_status" in update_data:
+        update_data["status_explicit"] = True
 
     # Update location if coordinates changed
     if "latitude" in update_data or "longitude" in update_data:
@@ -257,8 +722,12 @@ async def update_place(place_id: UUID, place_data: PlaceUpdate, db: DbSession):
     for key, value in update_data.items():
         setattr(place, key, value)
 
+    changes = [(before, PlaceSnapshot.of(place))]
+    await record_place_changes(db, changes)
+
     await db.commit()
     await db.refresh(place)
+    places_changed(changes)
 
     return place
 
@@ -274,7 +743,11 @@ async def delete_place(place_id: UUID, db: DbSession):
     if not place:
         raise HTTPException(status_code=404, detail="Place not found")
 
+    changes = [(PlaceSnapshot.of(place), None)]
+    await record_place_changes(db, changes)
+
     await db.delete(place)
     await db.commit()
+    places_changed(changes)
 
     return None
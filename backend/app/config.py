@@ -23,6 +23,70 @@ class Settings(BaseSettings):
     default_page_size: int = 20
     max_page_size: int = 100
 
+    # List totals cache
+    count_cache_ttl_seconds: int = 300
+    count_cache_max_entries: int = 1024
+    count_estimate_threshold: int = 10000
+
+    # Vector tiles
+    tile_max_zoom: int = 22
+    tile_cache_ttl_seconds: int = 600
+    tile_cache_max_bytes: int = 64 * 1024 * 1024
+    tile_http_max_age: int = 60
+
+    # Clusters
+    cluster_grid_size: int = 8
+    cluster_max_zoom: int = 16
+    cluster_cache_ttl_seconds: int = 600
+    cluster_cache_max_blocks: int = 4096
+    cluster_max_request_blocks: int = 64
+
+    # Viewport queries
+    bbox_max_rows: int = 2000
+    markers_max_rows: int = 100000
+
+    # Batch nearby search
+    nearby_batch_max_origins: int = 300
+
+    # Export
+    export_batch_size: int = 2000
+
+    # Read response cache
+    response_cache_ttl_seconds: int = 60
+    response_cache_max_entries: int = 2048
+
+    # Accessibility scoring: weight per feature, score is the weighted
+    # share of features present (0-100)
+    accessibility_score_weights: dict[str, float] = {
+        "ramp_present": 1.0,
+        "step_free_entrance": 1.0,
+        "accessible_restroom": 1.0,
+        "tactile_paving": 1.0,
+        "signage": 1.0,
+        "staff_assistance_available": 1.0,
+    }
+
+    # In-process read replica for nearby, bbox and stats
+    replica_enabled: bool = False
+    replica_cell_degrees: float = 0.05
+    replica_sync_seconds: float = 1.0
+    replica_max_staleness_seconds: float = 5.0
+
+    # Moderation
+    bulk_review_max_items: int = 1000
+    bulk_review_chunk_size: int = 200
+    contribution_lease_seconds: int = 600
+    duplicate_radius_m: float = 150.0
+    duplicate_min_similarity: float = 0.3
+    duplicate_max_candidates: int = 5
+
+    # Write-behind buffer for public submissions
+    submission_buffer_enabled: bool = False
+    submission_buffer_max_size: int = 10000
+    submission_buffer_batch_size: int = 500
+    submission_buffer_flush_seconds: float = 0.5
+    submission_buffer_drain_seconds: float = 30.0
+
     @property
     def database_url(self) -> str:
         """Async database URL for FastAPI"""
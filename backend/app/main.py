@@ -4,6 +4,8 @@ from contextlib import asynccontextmanager
 
 from app.config import settings
 from app.api.routes import api_router
+from app.services.replica import place_replica
+from app.services.submission_buffer import submission_buffer
 
 
 @asynccontextmanager
@@ -11,9 +13,25 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     print(f"🚀 Starting {settings.app_name}...")
+    if settings.submission_buffer_enabled:
+        submission_buffer.start()
+        print("📥 Buffering contribution submissions")
+    if settings.replica_enabled:
+        try:
+            await place_replica.start()
+        except Exception as exc:
+            print(f"❌ Replica unavailable, serving reads from SQL: {exc}")
     yield
     # Shutdown
     print(f"👋 Shutting down {settings.app_name}...")
+    if submission_buffer.running:
+        lost = await submission_buffer.stop(settings.submission_buffer_drain_seconds)
+        if lost:
+            print(f"❌ {lost} buffered contributions were not written")
+        else:
+            print("📤 Flushed buffered contributions")
+    if place_replica.running:
+        await place_replica.stop()
 
 
 app = FastAPI(
@@ -33,6 +51,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],
 )
 
 # Include API router
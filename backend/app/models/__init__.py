@@ -1,4 +1,15 @@
-from app.models.place import Place, Contribution
-
-__all__ = ["Place", "Contribution"]
+from app.models.place import (
+    Place,
+    PlaceStat,
+    DatasetVersion,
+    Contribution,
+    ContributionCount,
+)
 
+__all__ = [
+    "Place",
+    "PlaceStat",
+    "DatasetVersion",
+    "Contribution",
+    "ContributionCount",
+]
@@ -1,14 +1,18 @@
 from sqlalchemy import (
-    String, Boolean, Text, Enum, DateTime, Float, func, Index
+    String, Boolean, Text, Enum, DateTime, Float, Integer, BigInteger,
+    SmallInteger, func, Index, event, text
 )
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from geoalchemy2 import Geometry
+from collections.abc import Mapping
 from datetime import datetime
+from typing import Any
 import uuid
 import enum
 
 from app.database import Base
+from app.services.search import build_search_key
 
 
 class AccessibilityStatus(str, enum.Enum):
@@ -87,9 +91,23 @@ class Place(Base):
     accessibility_status: Mapped[AccessibilityStatus] = mapped_column(
         Enum(AccessibilityStatus), default=AccessibilityStatus.unknown, index=True
     )
+    # Status set explicitly (by an admin or an OSM wheelchair=* verdict)
+    # rather than derived from the score; rescoring leaves it alone
+    status_explicit: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=text("false")
+    )
+    accessibility_score: Mapped[int] = mapped_column(
+        SmallInteger, nullable=False, default=0
+    )
+    features: Mapped[int] = mapped_column(
+        SmallInteger, nullable=False, default=0
+    )
     source: Mapped[DataSource] = mapped_column(
         Enum(DataSource), default=DataSource.user
     )
+
+    # Derived columns, kept in sync by derived_place_values()
+    search_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -101,13 +119,104 @@ class Place(Base):
 
     __table_args__ = (
         Index("idx_places_location", "location", postgresql_using="gist"),
-        Index("idx_places_category_status", "category", "accessibility_status"),
+        Index(
+            "idx_places_location_geog",
+            func.geography(location),
+            postgresql_using="gist",
+        ),
+        # One category and one status combined with the name/score sort
+        # orders; the (category, accessibility_status) prefix also serves
+        # plain filters
+        Index(
+            "idx_places_category_status_name",
+            "category", "accessibility_status", "name", "id",
+        ),
+        Index(
+            "idx_places_category_status_score",
+            "category", "accessibility_status", "accessibility_score", "id",
+        ),
+        Index("idx_places_name_id", "name", "id"),
+        Index("idx_places_score_id", "accessibility_score", "id"),
+        Index("idx_places_updated_id", "updated_at", "id"),
+        Index("idx_places_features", "features"),
+        Index(
+            "idx_places_search_key_trgm",
+            "search_key",
+            postgresql_using="gin",
+            postgresql_ops={"search_key": "gin_trgm_ops"},
+        ),
+        # KNN ordering of search matches by word distance (<->>)
+        Index(
+            "idx_places_search_key_gist",
+            "search_key",
+            postgresql_using="gist",
+            postgresql_ops={"search_key": "gist_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
         return f"<Place {self.name} ({self.accessibility_status.value})>"
 
 
+def derived_place_values(place: Any) -> dict[str, Any]:
+    """
+    Compute the derived Place columns from a Place-like object or a dict
+    of column values. Bulk Core inserts/updates must merge these in since
+    they bypass the ORM listeners below.
+    """
+    if isinstance(place, Mapping):
+        get = place.get
+    else:
+        def get(key):
+            return getattr(place, key, None)
+
+    # These depend on the models, so they are imported on first use
+    from app.services.features import feature_mask
+    from app.services.scoring import accessibility_score
+
+    return {
+        "search_key": build_search_key(
+            get("name"), get("name_local"), get("address")),
+        "accessibility_score": accessibility_score(place),
+        "features": feature_mask(place),
+    }
+
+
+@event.listens_for(Place, "before_insert")
+@event.listens_for(Place, "before_update")
+def _set_derived_place_values(mapper, connection, target: Place) -> None:
+    for key, value in derived_place_values(target).items():
+        setattr(target, key, value)
+
+
+class PlaceStat(Base):
+    """Place counts per (status, category), maintained on every place write"""
+    __tablename__ = "place_stats"
+
+    accessibility_status: Mapped[AccessibilityStatus] = mapped_column(
+        Enum(AccessibilityStatus), primary_key=True
+    )
+    category: Mapped[str] = mapped_column(String(100), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<PlaceStat {self.accessibility_status.value}/{self.category}: {self.count}>"
+
+
+class DatasetVersion(Base):
+    """Single-row counter bumped with every place write"""
+    __tablename__ = "dataset_version"
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=1)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<DatasetVersion {self.version}>"
+
+
 class Contribution(Base):
     """Pending contributions awaiting moderation"""
     __tablename__ = "contributions"
@@ -156,6 +265,17 @@ class Contribution(Base):
         Enum(ContributionStatus), default=ContributionStatus.pending, index=True
     )
     reviewer_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Moderation lease, set when a moderator claims the contribution
+    claimed_by: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    claim_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    # Likely existing places for new-place contributions; null until computed
+    duplicate_candidates: Mapped[list[dict[str, Any]] | None] = mapped_column(
+        JSONB, nullable=True
+    )
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -165,6 +285,40 @@ class Contribution(Base):
         DateTime(timezone=True), nullable=True
     )
 
+    __table_args__ = (
+        Index(
+            "idx_contributions_pending_queue",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index(
+            "idx_contributions_status_created",
+            "status",
+            created_at.desc(),
+            id.desc(),
+        ),
+        Index("idx_contributions_created", created_at.desc(), id.desc()),
+    )
+
     def __repr__(self) -> str:
         return f"<Contribution {self.name} ({self.status.value})>"
 
+
+class ContributionCount(Base):
+    """
+    Contribution counts per status, maintained on every contribution write.
+    Each status is striped over several slot rows that reads sum, so
+    concurrent writers rarely wait on the same row lock.
+    """
+    __tablename__ = "contribution_counts"
+
+    status: Mapped[ContributionStatus] = mapped_column(
+        Enum(ContributionStatus), primary_key=True
+    )
+    slot: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=0)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<ContributionCount {self.status.value}[{self.slot}]: {self.count}>"
+
@@ -3,12 +3,28 @@ from app.schemas.place import (
     PlaceCreate,
     PlaceUpdate,
     PlaceResponse,
+    NearbyPlaceResponse,
     PlaceListResponse,
     PlaceFilters,
     ContributionCreate,
     ContributionResponse,
+    ContributionAccepted,
+    DuplicateCandidate,
     ContributionReview,
+    ContributionClaimRequest,
+    ContributionDecision,
+    BulkReviewRequest,
+    BulkReviewOutcome,
+    BulkReviewResponse,
     NearbySearchParams,
+    NearbyOrigin,
+    NearbyBatchRequest,
+    NearbyBatchResult,
+    PlaceMarker,
+    PlaceMarkerColumns,
+    BBoxResponse,
+    PlaceCluster,
+    ClusterResponse,
     StatsResponse,
 )
 
@@ -17,12 +33,28 @@ __all__ = [
     "PlaceCreate",
     "PlaceUpdate",
     "PlaceResponse",
+    "NearbyPlaceResponse",
     "PlaceListResponse",
     "PlaceFilters",
     "ContributionCreate",
     "ContributionResponse",
+    "ContributionAccepted",
+    "DuplicateCandidate",
     "ContributionReview",
+    "ContributionClaimRequest",
+    "ContributionDecision",
+    "BulkReviewRequest",
+    "BulkReviewOutcome",
+    "BulkReviewResponse",
     "NearbySearchParams",
+    "NearbyOrigin",
+    "NearbyBatchRequest",
+    "NearbyBatchResult",
+    "PlaceMarker",
+    "PlaceMarkerColumns",
+    "BBoxResponse",
+    "PlaceCluster",
+    "ClusterResponse",
     "StatsResponse",
 ]
 
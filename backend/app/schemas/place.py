@@ -2,7 +2,7 @@ from pydantic import BaseModel, Field, EmailStr, ConfigDict
 from datetime import datetime
 from uuid import UUID
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional
 
 
 class AccessibilityStatus(str, Enum):
@@ -30,6 +30,18 @@ class DataSource(str, Enum):
     osm = "osm"
 
 
+class PlaceFeature(str, Enum):
+    """Bits of the place features bitmask, in bit order"""
+    ramp_present = "ramp_present"
+    step_free_entrance = "step_free_entrance"
+    tactile_paving = "tactile_paving"
+    audio_signage = "audio_signage"
+    braille_signage = "braille_signage"
+    staff_assistance_available = "staff_assistance_available"
+    accessible_restroom = "accessible_restroom"
+    accessible_restroom_full = "accessible_restroom_full"
+
+
 class ContributionStatus(str, Enum):
     pending = "pending"
     approved = "approved"
@@ -94,17 +106,25 @@ class PlaceResponse(PlaceBase):
     legacy_id: Optional[str] = None
     photo_url: Optional[str] = None
     accessibility_status: AccessibilityStatus
+    accessibility_score: int = 0
+    features: int = Field(0, description="PlaceFeature bitmask, bit i is the i-th feature")
     source: DataSource
     created_at: datetime
     updated_at: datetime
 
 
+class NearbyPlaceResponse(PlaceResponse):
+    distance_m: Optional[float] = None
+
+
 class PlaceListResponse(BaseModel):
     items: list[PlaceResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    total_estimated: bool = False
 
 
 class PlaceFilters(BaseModel):
@@ -119,6 +139,9 @@ class PlaceFilters(BaseModel):
     braille_signage: Optional[bool] = None
     staff_assistance_available: Optional[bool] = None
     source: Optional[list[DataSource]] = None
+    min_score: Optional[int] = Field(None, ge=0, le=100)
+    features: Optional[list[PlaceFeature]] = None
+    search: Optional[str] = None
 
 
 class NearbySearchParams(BaseModel):
@@ -127,6 +150,23 @@ class NearbySearchParams(BaseModel):
     radius_km: float = Field(5.0, gt=0, le=50, description="Search radius in kilometers")
 
 
+class NearbyOrigin(BaseModel):
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
+    radius_km: float = Field(5.0, gt=0, le=50, description="Search radius in kilometers")
+    limit: int = Field(20, ge=1, le=100)
+
+
+class NearbyBatchRequest(BaseModel):
+    origins: list[NearbyOrigin] = Field(..., min_length=1)
+    accessibility_status: Optional[list[AccessibilityStatus]] = None
+
+
+class NearbyBatchResult(BaseModel):
+    origin: int = Field(..., description="Index into the request's origins")
+    items: list[NearbyPlaceResponse]
+
+
 # Contribution schemas
 class ContributionCreate(PlaceBase):
     """Schema for public contribution submissions"""
@@ -146,12 +186,119 @@ class ContributionResponse(BaseModel):
     status: ContributionStatus
     created_at: datetime
     reviewed_at: Optional[datetime] = None
+    claimed_by: Optional[str] = None
+    claim_expires_at: Optional[datetime] = None
+
+
+class DuplicateCandidate(BaseModel):
+    """Existing place that a new-place contribution may duplicate"""
+    place_id: UUID
+    name: str
+    category: str
+    distance_m: float
+    similarity: float = Field(..., description="Name trigram similarity, 0 to 1")
+
+
+class ContributionAccepted(BaseModel):
+    """Submission queued for a batched insert"""
+    id: UUID
+    status: ContributionStatus = ContributionStatus.pending
 
 
 class ContributionReview(BaseModel):
     """Schema for moderator review"""
     status: ContributionStatus
     reviewer_notes: Optional[str] = None
+    moderator: Optional[str] = Field(
+        None, max_length=255,
+        description="Reviews of contributions leased to another moderator are refused")
+
+
+class ContributionClaimRequest(BaseModel):
+    """Claim the next pending contributions for a moderator"""
+    moderator: str = Field(..., min_length=1, max_length=255)
+    limit: int = Field(10, ge=1, le=100)
+
+
+class ContributionDecision(BaseModel):
+    """One moderator decision in a bulk review"""
+    id: UUID
+    status: Literal[ContributionStatus.approved, ContributionStatus.rejected]
+    reviewer_notes: Optional[str] = None
+
+
+class BulkReviewRequest(BaseModel):
+    decisions: list[ContributionDecision] = Field(..., min_length=1)
+    moderator: Optional[str] = Field(None, max_length=255)
+
+
+class BulkReviewOutcome(BaseModel):
+    id: UUID
+    outcome: Literal[
+        "approved",
+        "rejected",
+        "not_found",
+        "already_reviewed",
+        "place_not_found",
+        "duplicate",
+        "claimed",
+    ]
+    place_id: Optional[UUID] = None
+
+
+class BulkReviewResponse(BaseModel):
+    approved: int
+    rejected: int
+    failed: int
+    results: list[BulkReviewOutcome]
+
+
+class PlaceMarker(BaseModel):
+    """Lean projection of a place for map markers"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    name: str
+    category: str
+    latitude: float
+    longitude: float
+    accessibility_status: AccessibilityStatus
+    features: int = 0
+
+
+class PlaceMarkerColumns(BaseModel):
+    """Markers as parallel arrays; codes index the lookup tables"""
+    count: int
+    encoding: Literal["plain", "delta"]
+    statuses: list[str]
+    categories: list[str]
+    ids: list[UUID]
+    lat: list[float]
+    lon: list[float]
+    status_code: list[int]
+    category_code: list[int]
+    features: list[int]
+
+
+class BBoxResponse(BaseModel):
+    items: list[PlaceMarker]
+    # Set when the view holds more places than the row budget; items is
+    # then empty and the client should request clusters instead
+    too_dense: bool = False
+    max_rows: int
+
+
+class PlaceCluster(BaseModel):
+    latitude: float
+    longitude: float
+    count: int
+    by_status: dict[str, int]
+
+
+class ClusterResponse(BaseModel):
+    zoom: int
+    cell_size: float
+    clusters: list[PlaceCluster]
 
 
 class StatsResponse(BaseModel):
@@ -161,4 +308,5 @@ class StatsResponse(BaseModel):
     not_accessible: int
     unknown: int
     by_category: dict[str, int]
+    by_status_and_category: dict[str, dict[str, int]] = {}
 
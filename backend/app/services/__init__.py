@@ -0,0 +1 @@
+# Services shared by the API routes and scripts
@@ -0,0 +1,79 @@
+"""
+Place change feed over Postgres LISTEN/NOTIFY.
+
+Every dataset version bump announces the new version on the
+place_changes channel, with the ids of the places it touched, split
+over numbered parts when there are many. Bulk loaders announce no ids,
+which tells listeners to reload everything.
+Notifications are delivered when the writing transaction commits, in
+commit order.
+"""
+import json
+from collections.abc import Collection
+from datetime import datetime
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+CHANNEL = "place_changes"
+
+# Payloads are limited to 8000 bytes, so long id lists are split
+IDS_PER_NOTIFICATION = 100
+
+
+class PlaceNotification(NamedTuple):
+    version: int
+    updated_at: datetime
+    # None means the whole dataset may have changed
+    ids: Optional[list[UUID]]
+    # The version's ids are split over `parts` notifications
+    part: int = 0
+    parts: int = 1
+
+
+def notification_payloads(
+    version: int,
+    updated_at: datetime,
+    place_ids: Optional[Collection[UUID]] = None,
+) -> list[str]:
+    base = {"version": version, "updated_at": updated_at.isoformat()}
+    if place_ids is None:
+        return [json.dumps(base)]
+
+    ids = sorted(str(place_id) for place_id in place_ids)
+    chunks = [
+        ids[start:start + IDS_PER_NOTIFICATION]
+        for start in range(0, len(ids), IDS_PER_NOTIFICATION)
+    ] or [[]]
+    return [
+        json.dumps({**base, "ids": chunk, "part": part, "parts": len(chunks)})
+        for part, chunk in enumerate(chunks)
+    ]
+
+
+async def notify_place_changes(
+    db: AsyncSession,
+    version: int,
+    updated_at: datetime,
+    place_ids: Optional[Collection[UUID]] = None,
+) -> None:
+    """
+    Queue change notifications in the caller's transaction.
+    """
+    for payload in notification_payloads(version, updated_at, place_ids):
+        await db.execute(select(func.pg_notify(CHANNEL, payload)))
+
+
+def parse_notification(payload: str) -> PlaceNotification:
+    data = json.loads(payload)
+    ids = data.get("ids")
+    return PlaceNotification(
+        version=data["version"],
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+        ids=None if ids is None else [UUID(place_id) for place_id in ids],
+        part=data.get("part", 0),
+        parts=data.get("parts", 1),
+    )
@@ -0,0 +1,232 @@
+"""
+Grid clustering of places per zoom level.
+
+At zoom z the world is split into square lon/lat blocks of 360 / 2**z
+degrees (one block per web tile column), and each block into
+grid_size x grid_size cells. Cell aggregates are loaded a block at a time
+with a GROUP BY over the GiST-indexed location column, cached, and kept
+current by applying each place write to the cells it touches.
+"""
+import math
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from geoalchemy2.functions import ST_MakeEnvelope
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.place import AccessibilityStatus, Place
+
+
+class Cell:
+    __slots__ = ("count", "sum_latitude", "sum_longitude", "by_status")
+
+    def __init__(self):
+        self.count = 0
+        self.sum_latitude = 0.0
+        self.sum_longitude = 0.0
+        self.by_status: dict[str, int] = {}
+
+    def add(self, status: str, count: int, sum_latitude: float, sum_longitude: float) -> None:
+        self.count += count
+        self.sum_latitude += sum_latitude
+        self.sum_longitude += sum_longitude
+        remaining = self.by_status.get(status, 0) + count
+        if remaining:
+            self.by_status[status] = remaining
+        else:
+            self.by_status.pop(status, None)
+
+
+BlockKey = tuple[int, int, int]
+CellKey = tuple[int, int]
+
+
+class ClusterIndex:
+    """
+    Cached per-zoom cell aggregates, LRU-evicted by block.
+    """
+
+    def __init__(self, grid_size: int, max_zoom: int, ttl: float, max_blocks: int):
+        self.grid_size = grid_size
+        self.max_zoom = max_zoom
+        self.ttl = ttl
+        self.max_blocks = max_blocks
+        self.generation = 0
+        self._blocks: OrderedDict[BlockKey, tuple[float, dict[CellKey, Cell]]] = OrderedDict()
+
+    def block_size(self, zoom: int) -> float:
+        return 360.0 / 2 ** zoom
+
+    def cell_size(self, zoom: int) -> float:
+        return self.block_size(zoom) / self.grid_size
+
+    def cell_for(self, zoom: int, longitude: float, latitude: float) -> CellKey:
+        size = self.cell_size(zoom)
+        return math.floor(longitude / size), math.floor(latitude / size)
+
+    def block_for(self, zoom: int, cell: CellKey) -> BlockKey:
+        return zoom, cell[0] // self.grid_size, cell[1] // self.grid_size
+
+    def get_block(self, key: BlockKey) -> Optional[dict[CellKey, Cell]]:
+        entry = self._blocks.get(key)
+        if entry is None:
+            return None
+
+        loaded_at, cells = entry
+        if loaded_at + self.ttl < time.monotonic():
+            del self._blocks[key]
+            return None
+
+        self._blocks.move_to_end(key)
+        return cells
+
+    def set_block(self, key: BlockKey, cells: dict[CellKey, Cell], generation: int) -> None:
+        if generation != self.generation:
+            return
+
+        self._blocks[key] = (time.monotonic(), cells)
+        self._blocks.move_to_end(key)
+        while len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+
+    def apply(self, longitude: float, latitude: float, status: str, sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) one place in every cached zoom.
+        """
+        self.generation += 1
+        for zoom in range(self.max_zoom + 1):
+            cell_key = self.cell_for(zoom, longitude, latitude)
+            entry = self._blocks.get(self.block_for(zoom, cell_key))
+            if entry is None:
+                continue
+
+            cells = entry[1]
+            cell = cells.setdefault(cell_key, Cell())
+            cell.add(status, sign, sign * latitude, sign * longitude)
+            if cell.count <= 0:
+                del cells[cell_key]
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._blocks.clear()
+
+
+cluster_index = ClusterIndex(
+    grid_size=settings.cluster_grid_size,
+    max_zoom=settings.cluster_max_zoom,
+    ttl=settings.cluster_cache_ttl_seconds,
+    max_blocks=settings.cluster_cache_max_blocks,
+)
+
+
+def blocks_in_bbox(
+    zoom: int,
+    min_lon: float,
+    min_lat: float,
+    max_lon: float,
+    max_lat: float,
+) -> list[BlockKey]:
+    size = cluster_index.block_size(zoom)
+    return [
+        (zoom, bx, by)
+        for bx in range(math.floor(min_lon / size), math.floor(max_lon / size) + 1)
+        for by in range(math.floor(min_lat / size), math.floor(max_lat / size) + 1)
+    ]
+
+
+async def load_blocks(
+    db: AsyncSession,
+    zoom: int,
+    keys: list[BlockKey],
+) -> dict[BlockKey, dict[CellKey, Cell]]:
+    """
+    Aggregate the cells of the given blocks with a single indexed query.
+    """
+    generation = cluster_index.generation
+    block_size = cluster_index.block_size(zoom)
+    cell_size = cluster_index.cell_size(zoom)
+
+    min_bx = min(key[1] for key in keys)
+    max_bx = max(key[1] for key in keys)
+    min_by = min(key[2] for key in keys)
+    max_by = max(key[2] for key in keys)
+    envelope = ST_MakeEnvelope(
+        min_bx * block_size,
+        min_by * block_size,
+        (max_bx + 1) * block_size,
+        (max_by + 1) * block_size,
+        4326,
+    )
+
+    cx = func.floor(Place.longitude / cell_size)
+    cy = func.floor(Place.latitude / cell_size)
+    query = (
+        select(
+            cx,
+            cy,
+            Place.accessibility_status,
+            func.count(Place.id),
+            func.sum(Place.latitude),
+            func.sum(Place.longitude),
+        )
+        .where(Place.location.op("&&")(envelope))
+        .group_by(cx, cy, Place.accessibility_status)
+    )
+    result = await db.execute(query)
+
+    blocks: dict[BlockKey, dict[CellKey, Cell]] = {key: {} for key in keys}
+    for cell_x, cell_y, status, count, sum_lat, sum_lon in result:
+        cell_key = (int(cell_x), int(cell_y))
+        cells = blocks.get(cluster_index.block_for(zoom, cell_key))
+        # The envelope may cover blocks that were already cached
+        if cells is None:
+            continue
+        cell = cells.setdefault(cell_key, Cell())
+        # NULL statuses count as unknown, as in place_stats
+        status = status or AccessibilityStatus.unknown
+        cell.add(status.value, count, sum_lat, sum_lon)
+
+    for key, cells in blocks.items():
+        cluster_index.set_block(key, cells, generation)
+
+    return blocks
+
+
+async def get_clusters(
+    db: AsyncSession,
+    zoom: int,
+    min_lon: float,
+    min_lat: float,
+    max_lon: float,
+    max_lat: float,
+) -> list[tuple[CellKey, Cell]]:
+    """
+    Non-empty cells intersecting the bounding box at a zoom level.
+    """
+    keys = blocks_in_bbox(zoom, min_lon, min_lat, max_lon, max_lat)
+
+    blocks = {}
+    missing = []
+    for key in keys:
+        cells = cluster_index.get_block(key)
+        if cells is None:
+            missing.append(key)
+        else:
+            blocks[key] = cells
+
+    if missing:
+        blocks.update(await load_blocks(db, zoom, missing))
+
+    min_cell = cluster_index.cell_for(zoom, min_lon, min_lat)
+    max_cell = cluster_index.cell_for(zoom, max_lon, max_lat)
+
+    return [
+        (cell_key, cell)
+        for cells in blocks.values()
+        for cell_key, cell in cells.items()
+        if min_cell[0] <= cell_key[0] <= max_cell[0]
+        and min_cell[1] <= cell_key[1] <= max_cell[1]
+    ]
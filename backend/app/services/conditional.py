@@ -0,0 +1,105 @@
+"""
+HTTP validators (ETag / Last-Modified) derived from the dataset version.
+
+Every place write bumps dataset_version in its own transaction, so a
+response for a given URL can only change when the version does. Checking
+If-None-Match costs one primary key read instead of the endpoint's query.
+"""
+import hashlib
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from collections.abc import Collection
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from fastapi import Request, Response
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.place import DatasetVersion
+from app.services.change_feed import notify_place_changes
+from app.services.replica import place_replica
+from app.services.response_cache import cache_key
+
+
+class Validators(NamedTuple):
+    etag: str
+    last_modified: datetime
+
+    def headers(self) -> dict[str, str]:
+        return {
+            "ETag": self.etag,
+            "Last-Modified": format_datetime(self.last_modified, usegmt=True),
+            # Always revalidate; a matching ETag answers with 304
+            "Cache-Control": "no-cache",
+        }
+
+    def is_fresh(self, request: Request) -> bool:
+        """
+        True when the client's cached copy is still current.
+        If-None-Match takes precedence over If-Modified-Since and uses
+        weak comparison, so tags a proxy marked weak (W/"...") still match.
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            return "*" in tags or self.etag in tags
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            # HTTP dates have one second resolution
+            return self.last_modified.replace(microsecond=0) <= since
+
+        return False
+
+    def not_modified(self) -> Response:
+        return Response(status_code=304, headers=self.headers())
+
+
+async def bump_dataset_version(
+    db: AsyncSession,
+    place_ids: Optional[Collection[UUID]] = None,
+) -> None:
+    """
+    Advance the dataset version in the caller's transaction and announce
+    it on the place change feed. Without place_ids, listeners reload.
+    """
+    result = await db.execute(
+        update(DatasetVersion)
+        .where(DatasetVersion.id == 1)
+        .values(version=DatasetVersion.version + 1, updated_at=func.now())
+        .returning(DatasetVersion.version, DatasetVersion.updated_at)
+    )
+    version, updated_at = result.one()
+    await notify_place_changes(db, version, updated_at, place_ids)
+
+
+async def read_dataset_version(db: AsyncSession) -> tuple[int, datetime]:
+    result = await db.execute(
+        select(DatasetVersion.version, DatasetVersion.updated_at)
+        .where(DatasetVersion.id == 1)
+    )
+    return result.one()
+
+
+async def dataset_validators(
+    request: Request,
+    db: AsyncSession,
+    replica: bool = False,
+) -> Validators:
+    """
+    Strong validators for a read endpoint at the current dataset version.
+    Pass `replica` when the response is served from the in-memory replica:
+    the validators then follow its version, which may lag the database's,
+    and are read without a database query.
+    """
+    if replica:
+        version, updated_at = place_replica.version, place_replica.updated_at
+    else:
+        version, updated_at = await read_dataset_version(db)
+    digest = hashlib.sha1(cache_key(request).encode()).hexdigest()[:16]
+    return Validators(etag=f'"{version}-{digest}"', last_modified=updated_at)
@@ -0,0 +1,47 @@
+import random
+from collections.abc import Mapping
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.place import ContributionCount, ContributionStatus
+
+
+# Rows each status is striped over; reads sum them, so this can change
+# without migrating the counts
+COUNT_SLOTS = 16
+
+
+async def apply_status_changes(
+    db: AsyncSession,
+    deltas: Mapping[ContributionStatus, int],
+) -> None:
+    """
+    Apply per-status count changes in the caller's transaction.
+    All changes go to one randomly chosen slot, so concurrent writers
+    mostly touch different rows; within it, rows are upserted in status
+    order so writers sharing a slot lock them in the same order.
+    """
+    deltas = {status: delta for status, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    slot = random.randrange(COUNT_SLOTS)
+    stmt = pg_insert(ContributionCount).values([
+        {"status": status, "slot": slot, "count": delta}
+        for status, delta in sorted(deltas.items(), key=lambda item: item[0].value)
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ContributionCount.status, ContributionCount.slot],
+        set_={"count": ContributionCount.count + stmt.excluded.count},
+    )
+    await db.execute(stmt)
+
+
+async def read_status_count(db: AsyncSession, status: ContributionStatus) -> int:
+    result = await db.execute(
+        select(func.sum(ContributionCount.count))
+        .where(ContributionCount.status == status)
+    )
+    return result.scalar() or 0
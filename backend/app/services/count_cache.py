@@ -0,0 +1,118 @@
+import json
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from sqlalchemy import Select, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.place import Place
+
+
+class CachedCount(NamedTuple):
+    total: int
+    estimated: bool
+
+
+class CountCache:
+    """
+    Process-local cache of list totals keyed by normalized filter hash.
+
+    Entries expire after `ttl` seconds and the least recently used entry
+    is evicted past `max_entries`. Place writes call `invalidate()`; the
+    generation counter stops a count that was computed before a write
+    from being stored after it.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: OrderedDict[str, tuple[float, CachedCount]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[CachedCount]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: CachedCount, generation: int) -> None:
+        if generation != self.generation:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+
+count_cache = CountCache(
+    ttl=settings.count_cache_ttl_seconds,
+    max_entries=settings.count_cache_max_entries,
+)
+
+
+async def estimate_row_count(db: AsyncSession, query: Select) -> int:
+    """
+    Read the planner's row estimate for a query via EXPLAIN.
+    """
+    connection = await db.connection()
+    compiled = query.compile(
+        dialect=connection.dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+    # Run as driver SQL: text() would read ":name" inside the inlined
+    # literals as bind parameters
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_places(
+    db: AsyncSession,
+    key: str,
+    conditions: list,
+    estimated: bool = False,
+) -> CachedCount:
+    """
+    Count places matching `conditions`, served from the cache when possible.
+
+    With `estimated`, wide filter sets (planner estimate above
+    settings.count_estimate_threshold) return the estimate instead of
+    running count(); narrower sets are still counted exactly.
+    """
+    key = f"{'estimated' if estimated else 'exact'}:{key}"
+    cached = count_cache.get(key)
+    if cached is not None:
+        return cached
+
+    generation = count_cache.generation
+    value = None
+
+    if estimated:
+        estimate = await estimate_row_count(
+            db, select(Place.id).where(*conditions))
+        if estimate >= settings.count_estimate_threshold:
+            value = CachedCount(total=estimate, estimated=True)
+
+    if value is None:
+        total_result = await db.execute(
+            select(func.count(Place.id)).where(*conditions))
+        value = CachedCount(total=total_result.scalar(), estimated=False)
+
+    count_cache.set(key, value, generation)
+    return value
@@ -0,0 +1,69 @@
+"""
+Duplicate candidates for new-place contributions.
+
+Places within a small radius of the contribution are found through the
+geography index, and ranked by how well the contribution's name matches
+their search key, so "Chatrapati Shivaji Terminus" submitted next to
+"Chhatrapati Shivaji Maharaj Terminus" is surfaced to the moderator.
+
+The name filter is the pg_trgm %> operator, which the trigram GIN index
+on search_key can serve; its cut-off is set for the transaction with
+SET LOCAL pg_trgm.word_similarity_threshold. word_similarity() itself is
+only evaluated for the rows that pass, to rank them.
+"""
+from typing import Any
+
+from geoalchemy2.functions import ST_DWithin
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.place import Contribution, Place
+from app.services.geo import knn_distance, place_geography, point_geography
+from app.services.search import build_search_key
+
+
+async def find_duplicate_candidates(
+    db: AsyncSession,
+    contribution: Contribution,
+) -> list[dict[str, Any]]:
+    """
+    Nearby places whose names resemble the contribution's, best match first.
+    """
+    key = build_search_key(contribution.name, contribution.name_local, None)
+    if not key:
+        return []
+
+    point = point_geography(contribution.longitude, contribution.latitude)
+    distance = knn_distance(point)
+    similarity = func.word_similarity(key, Place.search_key)
+
+    await db.execute(select(func.set_config(
+        "pg_trgm.word_similarity_threshold",
+        str(settings.duplicate_min_similarity),
+        True,
+    )))
+    result = await db.execute(
+        select(
+            Place.id,
+            Place.name,
+            Place.category,
+            distance.label("distance_m"),
+            similarity.label("similarity"),
+        )
+        .where(ST_DWithin(place_geography(), point, settings.duplicate_radius_m))
+        .where(Place.search_key.op("%>")(key))
+        .order_by(similarity.desc(), distance, Place.id)
+        .limit(settings.duplicate_max_candidates)
+    )
+
+    return [
+        {
+            "place_id": str(row.id),
+            "name": row.name,
+            "category": row.category,
+            "distance_m": round(row.distance_m, 1),
+            "similarity": round(row.similarity, 3),
+        }
+        for row in result
+    ]
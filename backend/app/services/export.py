@@ -0,0 +1,101 @@
+import csv
+import io
+from collections.abc import AsyncIterator
+
+from sqlalchemy import and_, select
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.schemas.place import PlaceFilters
+from app.services.place_filters import build_place_conditions
+from app.services.serialization import (
+    PLACE_FIELDS,
+    dumps,
+    place_columns,
+    serialize_place,
+    text_value,
+)
+
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "geojson": "application/geo+json",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def export_query(filters: PlaceFilters, fields: tuple[str, ...] = PLACE_FIELDS):
+    """
+    Plain column select (no ORM identity map) of the exported place fields.
+    Coordinates are always read for GeoJSON geometries.
+    """
+    query = select(*place_columns(fields, "latitude", "longitude"))
+    conditions = build_place_conditions(filters)
+    if conditions:
+        query = query.where(and_(*conditions))
+    return query.execution_options(yield_per=settings.export_batch_size)
+
+
+def encode_ndjson(rows, fields: tuple[str, ...]) -> bytes:
+    return b"".join(dumps(serialize_place(row, fields)) + b"\n" for row in rows)
+
+
+def encode_geojson(rows, fields: tuple[str, ...], first: bool) -> bytes:
+    features = []
+    for row in rows:
+        properties = serialize_place(row, fields)
+        features.append(dumps({
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [row.longitude, row.latitude],
+            },
+            "properties": properties,
+        }))
+
+    body = b",\n".join(features)
+    return body if first else b",\n" + body
+
+
+def encode_csv(rows, fields: tuple[str, ...]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        mapping = row._mapping
+        writer.writerow([text_value(mapping[field]) for field in fields])
+    return buffer.getvalue()
+
+
+async def stream_places(
+    filters: PlaceFilters,
+    export_format: str,
+    fields: tuple[str, ...] = PLACE_FIELDS,
+) -> AsyncIterator[str | bytes]:
+    """
+    Stream matching places in the requested format from a server-side
+    cursor, one yield_per batch at a time.
+
+    Opens its own session: the request's session is closed before a
+    streaming response body is sent.
+    """
+    if export_format == "geojson":
+        yield '{"type": "FeatureCollection", "features": [\n'
+    elif export_format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(fields)
+        yield buffer.getvalue()
+
+    first = True
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(export_query(filters, fields))
+        async for rows in result.partitions():
+            if export_format == "ndjson":
+                yield encode_ndjson(rows, fields)
+            elif export_format == "geojson":
+                yield encode_geojson(rows, fields, first)
+            else:
+                yield encode_csv(rows, fields)
+            first = False
+
+    if export_format == "geojson":
+        yield "\n]}\n"
@@ -0,0 +1,133 @@
+"""
+Accessibility features packed into one places.features bitmask.
+
+"Has all of these features" (and "lacks these") filters become a single
+`features IN (...)` over the few mask values that satisfy them, which the
+btree index on features serves, instead of one unindexed equality
+condition per boolean column.
+"""
+from collections.abc import Iterable, Mapping
+from typing import Any, Optional
+
+from sqlalchemy import SmallInteger, case, false
+
+from app.models.place import Place, RestroomAccessibility
+
+
+FEATURE_BITS = {
+    "ramp_present": 1 << 0,
+    "step_free_entrance": 1 << 1,
+    "tactile_paving": 1 << 2,
+    "audio_signage": 1 << 3,
+    "braille_signage": 1 << 4,
+    "staff_assistance_available": 1 << 5,
+    # Partial or full accessible restroom; full also sets the next bit
+    "accessible_restroom": 1 << 6,
+    "accessible_restroom_full": 1 << 7,
+}
+
+BOOLEAN_FEATURES = (
+    "ramp_present",
+    "step_free_entrance",
+    "tactile_paving",
+    "audio_signage",
+    "braille_signage",
+    "staff_assistance_available",
+)
+
+RESTROOM = FEATURE_BITS["accessible_restroom"]
+RESTROOM_FULL = FEATURE_BITS["accessible_restroom_full"]
+
+# Every mask a place can have (full restroom implies a restroom)
+VALID_MASKS = tuple(
+    mask for mask in range(1 << len(FEATURE_BITS))
+    if not (mask & RESTROOM_FULL and not mask & RESTROOM)
+)
+
+
+def restroom_bits(restroom: Any) -> int:
+    if restroom == RestroomAccessibility.full:
+        return RESTROOM | RESTROOM_FULL
+    if restroom == RestroomAccessibility.partial:
+        return RESTROOM
+    return 0
+
+
+def feature_mask(place: Any) -> int:
+    """
+    Feature bitmask of a Place, a Contribution or a dict of column values.
+    """
+    if isinstance(place, Mapping):
+        get = place.get
+    else:
+        def get(key):
+            return getattr(place, key, None)
+
+    mask = restroom_bits(get("accessible_restroom"))
+    for name in BOOLEAN_FEATURES:
+        if get(name):
+            mask |= FEATURE_BITS[name]
+    return mask
+
+
+def feature_bits(features: Iterable[Any]) -> int:
+    """
+    Mask of feature names (or PlaceFeature members).
+    """
+    mask = 0
+    for feature in features:
+        mask |= FEATURE_BITS[getattr(feature, "value", feature)]
+    return mask
+
+
+def features_expression():
+    """
+    SQL equivalent of feature_mask() over the places columns.
+    """
+    mask = case(
+        (Place.accessible_restroom == RestroomAccessibility.full, RESTROOM | RESTROOM_FULL),
+        (Place.accessible_restroom == RestroomAccessibility.partial, RESTROOM),
+        else_=0,
+    )
+    for name in BOOLEAN_FEATURES:
+        column = getattr(Place, name)
+        mask = mask + case((column.is_(True), FEATURE_BITS[name]), else_=0)
+    return mask.cast(SmallInteger)
+
+
+def allowed_masks(
+    required: int = 0,
+    forbidden: int = 0,
+    restrooms: Optional[Iterable[Any]] = None,
+) -> Optional[list[int]]:
+    """
+    Feature masks that pass, or None when nothing is excluded.
+
+    `required` bits must all be set, `forbidden` bits must all be clear,
+    and the restroom level must be one of `restrooms` when given.
+    """
+    allowed_restrooms = None
+    if restrooms is not None:
+        allowed_restrooms = {restroom_bits(restroom) for restroom in restrooms}
+
+    masks = [
+        mask for mask in VALID_MASKS
+        if mask & required == required
+        and not mask & forbidden
+        and (allowed_restrooms is None
+             or mask & (RESTROOM | RESTROOM_FULL) in allowed_restrooms)
+    ]
+    if len(masks) == len(VALID_MASKS):
+        return None
+    return masks
+
+
+def features_condition(masks: Optional[list[int]]):
+    """
+    Indexed condition on places.features for allowed_masks(), or None.
+    """
+    if masks is None:
+        return None
+    if not masks:
+        return false()
+    return Place.features.in_(masks)
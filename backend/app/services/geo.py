@@ -0,0 +1,30 @@
+"""
+Geography expressions shared by the distance based queries.
+
+`geography(places.location)` matches the expression index
+idx_places_location_geog, so ST_DWithin on it and KNN ordering with `<->`
+are both served by that index and distances come back in metres.
+"""
+from geoalchemy2 import Geography
+from geoalchemy2.functions import ST_MakePoint, ST_SetSRID
+from sqlalchemy import Float, func
+
+from app.models.place import Place
+
+
+def place_geography():
+    return func.geography(Place.location, type_=Geography)
+
+
+def point_geography(longitude, latitude):
+    return func.geography(
+        ST_SetSRID(ST_MakePoint(longitude, latitude), 4326),
+        type_=Geography,
+    )
+
+
+def knn_distance(point):
+    """
+    Index-assisted distance in metres from each place to `point`.
+    """
+    return place_geography().op("<->", return_type=Float)(point)
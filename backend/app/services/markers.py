@@ -0,0 +1,164 @@
+"""
+Columnar marker payloads for the map.
+
+Markers are sent as parallel arrays (ids, lat, lon, status_code,
+category_code, features) with lookup tables for the codes, either as JSON or as a
+little-endian binary buffer that maps straight onto typed arrays.
+
+Binary layout (each column starts at a multiple of its element size):
+
+    magic      4 bytes   b"AAMK"
+    version    uint16    2
+    reserved   uint16
+    count      uint32
+    tables     uint32    byte length of the JSON lookup tables
+    tables     JSON      {"statuses": [...], "categories": [...]}, space padded
+    ids        count x 16 bytes (UUID)
+    lat        count x float32
+    lon        count x float32
+    category   count x uint16 (index into categories)
+    status     count x uint8  (index into statuses)
+    features   count x uint8  (features bitmask, see app.services.features)
+"""
+import struct
+import sys
+from array import array
+from typing import Any
+
+from sqlalchemy import and_, func, select
+
+from app.models.place import AccessibilityStatus, Place
+from app.schemas.place import PlaceFilters
+from app.services.place_filters import build_place_conditions
+from app.services.serialization import dumps
+
+
+MARKERS_MEDIA_TYPE = "application/octet-stream"
+MARKERS_MAGIC = b"AAMK"
+MARKERS_VERSION = 2
+
+# Codes follow the enum order, so they are stable across responses
+STATUSES = [status.value for status in AccessibilityStatus]
+STATUS_CODES = {status: code for code, status in enumerate(AccessibilityStatus)}
+
+# Coordinates are sent with 6 decimals (~0.1 m); delta encoding sends
+# them as integer micro-degrees relative to the previous marker
+COORDINATE_SCALE = 1_000_000
+
+
+def markers_query(filters: PlaceFilters, envelope=None, delta: bool = False):
+    """
+    Only the marker columns, optionally inside a bbox envelope.
+    Delta-encoded payloads are ordered by geohash so neighbouring markers
+    are close together and their differences stay small.
+    """
+    query = select(
+        Place.id,
+        Place.latitude,
+        Place.longitude,
+        Place.accessibility_status,
+        Place.category,
+        Place.features,
+    )
+    conditions = build_place_conditions(filters)
+    if envelope is not None:
+        conditions.append(Place.location.op("&&")(envelope))
+    if conditions:
+        query = query.where(and_(*conditions))
+
+    if delta:
+        return query.order_by(func.ST_GeoHash(Place.location), Place.id)
+    return query.order_by(Place.id)
+
+
+class MarkerColumns:
+    """
+    Marker rows split into parallel columns with coded status/category.
+    """
+
+    def __init__(self, rows):
+        self.ids = []
+        self.latitudes = []
+        self.longitudes = []
+        self.status_codes = []
+        self.category_codes = []
+        self.features = []
+        self.categories: list[str] = []
+
+        category_codes: dict[str, int] = {}
+        for place_id, latitude, longitude, status, category, features in rows:
+            code = category_codes.get(category)
+            if code is None:
+                code = category_codes[category] = len(self.categories)
+                self.categories.append(category)
+
+            self.ids.append(place_id)
+            self.latitudes.append(latitude)
+            self.longitudes.append(longitude)
+            # NULL statuses count as unknown, as in place_stats
+            self.status_codes.append(
+                STATUS_CODES[status or AccessibilityStatus.unknown])
+            self.category_codes.append(code)
+            self.features.append(features)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def tables(self) -> dict[str, list[str]]:
+        return {"statuses": STATUSES, "categories": self.categories}
+
+    def to_json(self, delta: bool = False) -> dict[str, Any]:
+        if delta:
+            latitudes = delta_encode(self.latitudes)
+            longitudes = delta_encode(self.longitudes)
+        else:
+            latitudes = [round(value, 6) for value in self.latitudes]
+            longitudes = [round(value, 6) for value in self.longitudes]
+
+        return {
+            "count": len(self),
+            "encoding": "delta" if delta else "plain",
+            **self.tables(),
+            "ids": self.ids,
+            "lat": latitudes,
+            "lon": longitudes,
+            "status_code": self.status_codes,
+            "category_code": self.category_codes,
+            "features": self.features,
+        }
+
+    def to_binary(self) -> bytes:
+        tables = dumps(self.tables())
+        tables += b" " * (-len(tables) % 4)
+
+        columns = [
+            array("f", self.latitudes),
+            array("f", self.longitudes),
+            array("H", self.category_codes),
+            array("B", self.status_codes),
+            array("B", self.features),
+        ]
+        if sys.byteorder == "big":
+            for column in columns:
+                column.byteswap()
+
+        return b"".join([
+            MARKERS_MAGIC,
+            struct.pack("<HHII", MARKERS_VERSION, 0, len(self), len(tables)),
+            tables,
+            b"".join(place_id.bytes for place_id in self.ids),
+            *(column.tobytes() for column in columns),
+        ])
+
+
+def delta_encode(values: list[float]) -> list[int]:
+    """
+    Integer micro-degrees, each relative to the previous value.
+    """
+    encoded = []
+    previous = 0
+    for value in values:
+        scaled = round(value * COORDINATE_SCALE)
+        encoded.append(scaled - previous)
+        previous = scaled
+    return encoded
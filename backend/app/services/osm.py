@@ -0,0 +1,195 @@
+"""
+Mapping of OpenStreetMap tags onto Place columns.
+
+Pure functions over plain tuples and dicts so they can run in worker
+processes during ingestion.
+"""
+from typing import Any, Optional
+
+from app.models.place import (
+    AccessibilityStatus,
+    DataSource,
+    LevelSetting,
+    RestroomAccessibility,
+    derived_place_values,
+)
+from app.services.scoring import calculate_accessibility_status
+
+
+# (key, value, category), first match wins
+CATEGORY_TAGS = (
+    ("station", "subway", "metro_station"),
+    ("railway", "station", "railway_station"),
+    ("railway", "halt", "railway_station"),
+    ("aeroway", "aerodrome", "airport"),
+    ("aeroway", "terminal", "airport"),
+    ("amenity", "bus_station", "transport"),
+    ("amenity", "ferry_terminal", "transport"),
+    ("amenity", "hospital", "hospital"),
+    ("amenity", "clinic", "hospital"),
+    ("healthcare", "hospital", "hospital"),
+    ("amenity", "bank", "bank"),
+    ("amenity", "place_of_worship", "religious"),
+    ("amenity", "school", "school"),
+    ("amenity", "college", "school"),
+    ("amenity", "university", "school"),
+    ("amenity", "library", "library"),
+    ("amenity", "townhall", "govt_office"),
+    ("amenity", "courthouse", "govt_office"),
+    ("amenity", "police", "govt_office"),
+    ("amenity", "post_office", "govt_office"),
+    ("office", "government", "govt_office"),
+    ("amenity", "marketplace", "market"),
+    ("amenity", "theatre", "cultural"),
+    ("amenity", "cinema", "cultural"),
+    ("amenity", "arts_centre", "cultural"),
+    ("amenity", "toilets", "public_space"),
+    ("tourism", "museum", "museum"),
+    ("historic", "monument", "monument"),
+    ("historic", "memorial", "monument"),
+    ("shop", "mall", "shopping"),
+    ("shop", "department_store", "shopping"),
+    ("shop", "supermarket", "shopping"),
+    ("leisure", "park", "park"),
+    ("leisure", "garden", "park"),
+    ("leisure", "sports_centre", "sports"),
+    ("leisure", "stadium", "sports"),
+)
+
+# Keys an object needs at least one of to be considered
+CATEGORY_KEYS = tuple(sorted({key for key, _, _ in CATEGORY_TAGS}))
+
+LOCAL_NAME_KEYS = (
+    "name:hi", "name:mr", "name:bn", "name:ta", "name:te",
+    "name:kn", "name:ml", "name:gu", "name:pa", "name:or",
+)
+
+ADDRESS_KEYS = (
+    "addr:housenumber", "addr:street", "addr:suburb", "addr:city", "addr:postcode",
+)
+
+YES = ("yes", "designated")
+
+# Explicit wheelchair=* verdicts; other values leave the status to scoring
+WHEELCHAIR_STATUS = {
+    "no": AccessibilityStatus.not_accessible,
+    "limited": AccessibilityStatus.partially_accessible,
+}
+
+STEP_COUNT_KEYS = ("entrance:step_count", "step_count")
+
+# Door types that are only fitted at level entrances
+LEVEL_DOORS = ("automatic", "sliding")
+
+# Raw element: (kind "n"/"w", osm id, latitude, longitude, tags)
+OsmElement = tuple[str, int, float, float, dict[str, str]]
+
+
+def osm_legacy_id(kind: str, osm_id: int) -> str:
+    return f"osm:{kind}{osm_id}"
+
+
+def osm_category(tags: dict[str, str]) -> Optional[str]:
+    for key, value, category in CATEGORY_TAGS:
+        if tags.get(key) == value:
+            return category
+    return None
+
+
+def is_yes(tags: dict[str, str], *keys: str) -> bool:
+    return any(tags.get(key) in YES for key in keys)
+
+
+def osm_restroom(tags: dict[str, str]) -> RestroomAccessibility:
+    value = tags.get("toilets:wheelchair")
+    # On a toilets node, wheelchair=* describes the toilet itself
+    if value is None and tags.get("amenity") == "toilets":
+        value = tags.get("wheelchair")
+
+    if value in YES:
+        return RestroomAccessibility.full
+    if value == "limited":
+        return RestroomAccessibility.partial
+    return RestroomAccessibility.none
+
+
+def osm_step_free_entrance(tags: dict[str, str]) -> bool:
+    """
+    Whether the main entrance is step-free, from wheelchair, step_count
+    and the entrance/door tags of an object mapped as its own entrance.
+    """
+    step_count = next((tags[key] for key in STEP_COUNT_KEYS if key in tags), None)
+    if tags.get("wheelchair") == "no" or tags.get("entrance:wheelchair") == "no":
+        return False
+    if step_count is not None:
+        return step_count == "0"
+
+    # wheelchair=yes means every part is reachable without steps
+    if is_yes(tags, "wheelchair", "entrance:wheelchair"):
+        return True
+    return "entrance" in tags and tags.get("door") in LEVEL_DOORS
+
+
+def osm_address(tags: dict[str, str]) -> Optional[str]:
+    if tags.get("addr:full"):
+        return tags["addr:full"]
+    parts = [tags[key] for key in ADDRESS_KEYS if tags.get(key)]
+    return ", ".join(parts) or None
+
+
+def osm_place_values(element: OsmElement) -> Optional[dict[str, Any]]:
+    """
+    Place column values for a named, categorised OSM object, or None.
+    """
+    kind, osm_id, latitude, longitude, tags = element
+
+    category = osm_category(tags)
+    name = tags.get("name:en") or tags.get("name")
+    if category is None or not name:
+        return None
+
+    name_local = tags.get("name") if tags.get("name") != name else None
+    if name_local is None:
+        name_local = next((tags[key] for key in LOCAL_NAME_KEYS if tags.get(key)), None)
+
+    values = {
+        "legacy_id": osm_legacy_id(kind, osm_id),
+        "name": name[:255],
+        "name_local": name_local[:255] if name_local else None,
+        "category": category,
+        "address": osm_address(tags),
+        "latitude": latitude,
+        "longitude": longitude,
+        "ramp_present": is_yes(tags, "ramp:wheelchair", "ramp"),
+        "step_free_entrance": osm_step_free_entrance(tags),
+        "accessible_restroom": osm_restroom(tags),
+        "tactile_paving": is_yes(tags, "tactile_paving"),
+        "audio_signage": is_yes(
+            tags, "speech_output", "traffic_signals:sound", "audio_guide"),
+        "braille_signage": is_yes(
+            tags, "braille", "tactile_writing", "tactile_writing:braille"),
+        "lighting_level": LevelSetting.medium,
+        "noise_level": LevelSetting.medium,
+        "staff_assistance_available": is_yes(tags, "wheelchair:assistance"),
+        "notes": tags.get("wheelchair:description:en") or tags.get("wheelchair:description"),
+        "photo_url": None,
+        "source": DataSource.osm,
+    }
+    verdict = WHEELCHAIR_STATUS.get(tags.get("wheelchair"))
+    values["accessibility_status"] = verdict or calculate_accessibility_status(values)
+    # Kept through rescoring, and cleared again once the tag goes
+    values["status_explicit"] = verdict is not None
+    values.update(derived_place_values(values))
+    return values
+
+
+def map_osm_elements(elements: list[OsmElement]) -> list[dict[str, Any]]:
+    """
+    Worker entry point: map a batch of raw elements, dropping irrelevant ones.
+    """
+    mapped = []
+    for element in elements:
+        values = osm_place_values(element)
+        if values is not None:
+            mapped.append(values)
+    return mapped
@@ -0,0 +1,83 @@
+from collections.abc import Iterable
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.place import AccessibilityStatus
+from app.services.clusters import cluster_index
+from app.services.conditional import bump_dataset_version
+from app.services.count_cache import count_cache
+from app.services.place_stats import apply_stats_changes
+from app.services.response_cache import response_cache
+from app.services.tiles import tile_cache
+
+
+class PlaceSnapshot(NamedTuple):
+    """The parts of a place that derived caches are keyed on"""
+    id: UUID
+    category: str
+    accessibility_status: str
+    latitude: float
+    longitude: float
+
+    @classmethod
+    def of(cls, place) -> "PlaceSnapshot":
+        # NULL statuses count as unknown, as in rebuild_place_stats
+        status = place.accessibility_status or AccessibilityStatus.unknown
+        return cls(
+            id=place.id,
+            category=place.category,
+            accessibility_status=getattr(status, "value", status),
+            latitude=place.latitude,
+            longitude=place.longitude,
+        )
+
+
+# (before, after) for one place write; before is None for inserts and
+# after is None for deletes
+PlaceChange = tuple[Optional[PlaceSnapshot], Optional[PlaceSnapshot]]
+
+
+async def record_place_changes(db: AsyncSession, changes: list[PlaceChange]) -> None:
+    """
+    Database-side bookkeeping for place writes.
+    Call before committing, in the same transaction as the writes.
+    """
+    await apply_stats_changes(db, changes)
+    await bump_dataset_version(db, {
+        snapshot.id
+        for change in changes
+        for snapshot in change
+        if snapshot is not None
+    })
+
+
+def places_changed(changes: Iterable[PlaceChange]) -> None:
+    """
+    Drop in-process caches derived from places.
+    Call after a place write has been committed.
+    """
+    count_cache.invalidate()
+
+    tags = {"stats"}
+    for before, after in changes:
+        for snapshot in (before, after):
+            if snapshot is not None:
+                tags.add(f"place:{snapshot.id}")
+        # The category list only changes when a category can appear or vanish
+        if before is None or after is None or before.category != after.category:
+            tags.add("categories")
+    response_cache.invalidate(*tags)
+
+    for before, after in changes:
+        for snapshot, sign in ((before, -1), (after, 1)):
+            if snapshot is None:
+                continue
+            tile_cache.invalidate_point(snapshot.longitude, snapshot.latitude)
+            cluster_index.apply(
+                snapshot.longitude,
+                snapshot.latitude,
+                snapshot.accessibility_status,
+                sign,
+            )
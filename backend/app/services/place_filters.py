@@ -0,0 +1,85 @@
+import hashlib
+import json
+from typing import Optional
+
+from app.models.place import (
+    Place,
+    AccessibilityStatus as DBAccessibilityStatus,
+    DataSource as DBDataSource,
+)
+from app.schemas.place import PlaceFilters
+from app.services.features import (
+    BOOLEAN_FEATURES,
+    FEATURE_BITS,
+    allowed_masks,
+    feature_bits,
+    features_condition,
+)
+from app.services.search import normalize_search_text, search_condition
+
+
+def feature_masks(filters: PlaceFilters) -> Optional[list[int]]:
+    """
+    Feature masks allowed by the boolean, restroom and features filters.
+    """
+    required = forbidden = 0
+    for name in BOOLEAN_FEATURES:
+        value = getattr(filters, name)
+        if value is True:
+            required |= FEATURE_BITS[name]
+        elif value is False:
+            forbidden |= FEATURE_BITS[name]
+    required |= feature_bits(filters.features or [])
+
+    return allowed_masks(required, forbidden, filters.accessible_restroom or None)
+
+
+def build_place_conditions(filters: PlaceFilters) -> list:
+    """
+    Translate PlaceFilters into SQLAlchemy WHERE conditions on Place.
+    """
+    conditions = []
+
+    if filters.category:
+        conditions.append(Place.category.in_(filters.category))
+
+    if filters.accessibility_status:
+        db_statuses = [DBAccessibilityStatus(
+            s.value) for s in filters.accessibility_status]
+        conditions.append(Place.accessibility_status.in_(db_statuses))
+
+    # Feature filters collapse into one indexed condition on the bitmask
+    features = features_condition(feature_masks(filters))
+    if features is not None:
+        conditions.append(features)
+
+    if filters.source:
+        db_sources = [DBDataSource(s.value) for s in filters.source]
+        conditions.append(Place.source.in_(db_sources))
+
+    if filters.min_score is not None:
+        conditions.append(Place.accessibility_score >= filters.min_score)
+
+    if filters.search:
+        conditions.append(search_condition(Place.search_key, filters.search))
+
+    return conditions
+
+
+def filters_cache_key(filters: PlaceFilters) -> str:
+    """
+    Normalized, order-independent key for a filter set.
+    """
+    normalized = {}
+    for name, value in filters.model_dump(mode="json", exclude_none=True).items():
+        if isinstance(value, list):
+            if not value:
+                continue
+            value = sorted(set(value))
+        elif name == "search":
+            # Searches that normalize to the same key match the same rows
+            value = normalize_search_text(value)
+        normalized[name] = value
+
+    raw = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(raw.encode()).hexdigest()
@@ -0,0 +1,56 @@
+"""
+Sort orders for place lists.
+
+Every order is keyed on one column with id as the tie-breaker, and has a
+matching (key, id) index, so unfiltered keyset pages are read straight
+off the index; descending orders walk it backwards. With one category
+and one status, the (category, accessibility_status, key, id) indexes
+give the same for name and score. Other filter combinations read the
+matching rows from a filter index and sort them. The distance order is
+built by the route since it depends on the requested point.
+"""
+from datetime import datetime
+from typing import Any, Callable, NamedTuple
+
+from sqlalchemy import tuple_
+
+from app.models.place import Place
+
+
+class PlaceSort(NamedTuple):
+    field: str
+    descending: bool
+    # Turns a cursor value back into a column value
+    parse: Callable[[Any], Any]
+
+    @property
+    def column(self):
+        return getattr(Place, self.field)
+
+    def order_by(self) -> list:
+        if self.descending:
+            return [self.column.desc(), Place.id.desc()]
+        return [self.column, Place.id]
+
+    def seek(self, last_value: Any, last_id) -> Any:
+        """
+        Rows after (last_value, last_id) in this order.
+        """
+        key = tuple_(self.column, Place.id)
+        last = (self.parse(last_value), last_id)
+        return key < last if self.descending else key > last
+
+
+def _text(value: Any) -> str:
+    if not isinstance(value, str):
+        raise ValueError("expected a string")
+    return value
+
+
+PLACE_SORTS = {
+    "name": PlaceSort("name", False, _text),
+    "-updated_at": PlaceSort("updated_at", True, datetime.fromisoformat),
+    "-score": PlaceSort("accessibility_score", True, int),
+}
+
+DISTANCE_SORT = "distance"
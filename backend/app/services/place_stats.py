@@ -0,0 +1,76 @@
+from collections import Counter
+from collections.abc import Iterable
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.models.place import Place, PlaceStat, AccessibilityStatus
+
+
+def stats_deltas(changes: Iterable) -> dict[tuple[str, str], int]:
+    """
+    Net count change per (status, category) for a set of place writes.
+    """
+    deltas = Counter()
+    for before, after in changes:
+        if before is not None:
+            deltas[(before.accessibility_status, before.category)] -= 1
+        if after is not None:
+            deltas[(after.accessibility_status, after.category)] += 1
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+async def apply_stats_changes(db: AsyncSession, changes: Iterable) -> None:
+    """
+    Apply place writes to place_stats in the caller's transaction.
+    Rows are upserted in key order so concurrent writers lock them in
+    the same order.
+    """
+    deltas = stats_deltas(changes)
+    if not deltas:
+        return
+
+    stmt = pg_insert(PlaceStat).values([
+        {
+            "accessibility_status": AccessibilityStatus(status),
+            "category": category,
+            "count": delta,
+        }
+        for (status, category), delta in sorted(deltas.items())
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PlaceStat.accessibility_status, PlaceStat.category],
+        set_={"count": PlaceStat.count + stmt.excluded.count},
+    )
+    await db.execute(stmt)
+
+
+async def rebuild_place_stats(db: AsyncSession | AsyncConnection) -> None:
+    """
+    Recompute place_stats from places, for bulk loaders that bypass the
+    per-write bookkeeping.
+    """
+    status = func.coalesce(Place.accessibility_status, AccessibilityStatus.unknown)
+    await db.execute(delete(PlaceStat))
+    await db.execute(
+        insert(PlaceStat).from_select(
+            ["accessibility_status", "category", "count"],
+            select(status, Place.category, func.count(Place.id))
+            .group_by(status, Place.category),
+        )
+    )
+
+
+async def read_place_stats(db: AsyncSession) -> list[tuple[str, str, int]]:
+    """
+    All non-empty (status, category, count) rows.
+    """
+    result = await db.execute(
+        select(
+            PlaceStat.accessibility_status,
+            PlaceStat.category,
+            PlaceStat.count,
+        ).where(PlaceStat.count > 0)
+    )
+    return [(status.value, category, count) for status, category, count in result]
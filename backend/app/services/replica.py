@@ -0,0 +1,499 @@
+"""
+Optional in-process read replica of places.
+
+With REPLICA_ENABLED, each app process loads places at startup into
+column arrays (NumPy coordinates plus small-int status, category,
+feature and score codes) bucketed in a uniform lon/lat grid, and answers
+nearby, bbox and stats reads from memory.
+
+The replica follows the place change feed: notifications carrying ids
+are applied by re-reading those places, id-less ones trigger a reload.
+A version split over several notifications only counts as applied once
+all of its parts have been.
+Every REPLICA_SYNC_SECONDS it compares its dataset version with the
+database's. Reads only use it while it was confirmed current within
+REPLICA_MAX_STALENESS_SECONDS, and fall back to SQL otherwise or when a
+query is outside what it supports (text search, source filters, areas
+crossing the antimeridian or a pole).
+"""
+import asyncio
+import contextlib
+import itertools
+import math
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Any, NamedTuple, Optional
+from uuid import UUID
+
+import asyncpg
+import numpy as np
+import orjson
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import AsyncSessionLocal, engine
+from app.models.place import AccessibilityStatus, DatasetVersion, Place
+from app.schemas.place import PlaceFilters
+from app.services.change_feed import CHANNEL, PlaceNotification, parse_notification
+from app.services.place_filters import feature_masks
+from app.services.response_cache import response_cache
+from app.services.serialization import PLACE_FIELDS, dumps, place_columns
+
+
+# Mean earth radius; PostGIS measures geography `<->` on this sphere
+EARTH_RADIUS_M = 6371008.8
+
+STATUS_CODES = {status.value: code for code, status in enumerate(AccessibilityStatus)}
+STATUSES = list(AccessibilityStatus)
+
+# Response fields read back from the column arrays; the others are kept
+# per slot as one orjson-encoded array
+ARRAY_FIELDS = (
+    "id", "latitude", "longitude", "accessibility_status",
+    "category", "features", "accessibility_score",
+)
+PACKED_FIELDS = tuple(field for field in PLACE_FIELDS if field not in ARRAY_FIELDS)
+
+INITIAL_CAPACITY = 1024
+
+
+def status_value(row) -> str:
+    status = row.accessibility_status
+    return status.value if status is not None else AccessibilityStatus.unknown.value
+
+
+class ReplicaFilter(NamedTuple):
+    """PlaceFilters translated to replica codes"""
+    statuses: Optional[list[int]]
+    categories: Optional[list[str]]
+    masks: Optional[list[int]]
+    min_score: Optional[int]
+
+    @classmethod
+    def of(cls, filters: PlaceFilters) -> Optional["ReplicaFilter"]:
+        """
+        None when the filters need SQL (search, source).
+        """
+        if filters.search or filters.source:
+            return None
+        return cls(
+            statuses=[STATUS_CODES[status.value] for status in filters.accessibility_status]
+            if filters.accessibility_status else None,
+            categories=filters.category or None,
+            masks=feature_masks(filters),
+            min_score=filters.min_score,
+        )
+
+
+class ReplicaData:
+    """
+    Place columns in growable arrays, one slot per place, with a grid of
+    slot sets. The remaining PLACE_FIELDS values are held as encoded
+    bytes per slot, and response dicts are built from both on demand.
+    """
+
+    def __init__(self, cell_degrees: float, capacity: int = INITIAL_CAPACITY):
+        self.cell_degrees = cell_degrees
+        self.latitudes = np.zeros(capacity, dtype=np.float64)
+        self.longitudes = np.zeros(capacity, dtype=np.float64)
+        self.status_codes = np.zeros(capacity, dtype=np.uint8)
+        self.category_codes = np.zeros(capacity, dtype=np.uint16)
+        self.features = np.zeros(capacity, dtype=np.uint8)
+        self.scores = np.zeros(capacity, dtype=np.int16)
+        # UUID bytes sort like the uuid column, for (distance, id) order
+        self.id_bytes = np.zeros(capacity, dtype="S16")
+        self.packed: list[Optional[bytes]] = [None] * capacity
+
+        self.slots: dict[UUID, int] = {}
+        self.free: list[int] = []
+        self.size = 0
+
+        self.categories: list[str] = []
+        self.category_index: dict[str, int] = {}
+        self.cells: defaultdict[tuple[int, int], set[int]] = defaultdict(set)
+        self.counts: Counter[tuple[str, str]] = Counter()
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def cell_for(self, longitude: float, latitude: float) -> tuple[int, int]:
+        return (
+            math.floor(longitude / self.cell_degrees),
+            math.floor(latitude / self.cell_degrees),
+        )
+
+    def category_code(self, category: str) -> int:
+        code = self.category_index.get(category)
+        if code is None:
+            code = self.category_index[category] = len(self.categories)
+            self.categories.append(category)
+        return code
+
+    def _allocate(self) -> int:
+        if self.free:
+            return self.free.pop()
+
+        capacity = len(self.packed)
+        if self.size == capacity:
+            for name in (
+                "latitudes", "longitudes", "status_codes",
+                "category_codes", "features", "scores", "id_bytes",
+            ):
+                column = getattr(self, name)
+                grown = np.zeros(capacity * 2, dtype=column.dtype)
+                grown[:capacity] = column
+                setattr(self, name, grown)
+            self.packed.extend([None] * capacity)
+
+        self.size += 1
+        return self.size - 1
+
+    def _unlink(self, slot: int) -> None:
+        cell = self.cell_for(self.longitudes[slot], self.latitudes[slot])
+        self.cells[cell].discard(slot)
+        if not self.cells[cell]:
+            del self.cells[cell]
+        status = STATUSES[self.status_codes[slot]].value
+        self.counts[(status, self.categories[self.category_codes[slot]])] -= 1
+
+    def upsert(self, row) -> None:
+        """
+        Insert or replace a place from a place_columns(PLACE_FIELDS) row.
+        """
+        slot = self.slots.get(row.id)
+        if slot is None:
+            slot = self.slots[row.id] = self._allocate()
+        else:
+            self._unlink(slot)
+
+        status = status_value(row)
+        self.latitudes[slot] = row.latitude
+        self.longitudes[slot] = row.longitude
+        self.status_codes[slot] = STATUS_CODES[status]
+        self.category_codes[slot] = self.category_code(row.category)
+        self.features[slot] = row.features
+        self.scores[slot] = row.accessibility_score
+        self.id_bytes[slot] = row.id.bytes
+        self.packed[slot] = dumps([getattr(row, field) for field in PACKED_FIELDS])
+
+        self.cells[self.cell_for(row.longitude, row.latitude)].add(slot)
+        self.counts[(status, row.category)] += 1
+
+    def delete(self, place_id: UUID) -> None:
+        slot = self.slots.pop(place_id, None)
+        if slot is None:
+            return
+        self._unlink(slot)
+        self.packed[slot] = None
+        self.free.append(slot)
+
+    def place(self, slot: int, fields: tuple[str, ...] = PLACE_FIELDS) -> dict[str, Any]:
+        """
+        Response dict of a slot, limited to `fields`.
+        """
+        values = dict(zip(PACKED_FIELDS, orjson.loads(self.packed[slot])))
+        values.update(
+            # numpy drops trailing NUL bytes of "S" items
+            id=UUID(bytes=self.id_bytes[slot].ljust(16, b"\0")),
+            latitude=float(self.latitudes[slot]),
+            longitude=float(self.longitudes[slot]),
+            accessibility_status=STATUSES[self.status_codes[slot]],
+            category=self.categories[self.category_codes[slot]],
+            features=int(self.features[slot]),
+            accessibility_score=int(self.scores[slot]),
+        )
+        return {field: values[field] for field in fields}
+
+    def candidates(
+        self,
+        min_lon: float,
+        min_lat: float,
+        max_lon: float,
+        max_lat: float,
+    ) -> np.ndarray:
+        """
+        Slots in the grid cells overlapping a lon/lat box.
+        """
+        x0, y0 = self.cell_for(min_lon, min_lat)
+        x1, y1 = self.cell_for(max_lon, max_lat)
+
+        if (x1 - x0 + 1) * (y1 - y0 + 1) <= len(self.cells):
+            sets = (
+                self.cells[key]
+                for key in itertools.product(range(x0, x1 + 1), range(y0, y1 + 1))
+                if key in self.cells
+            )
+        else:
+            # Wide areas: walking the occupied cells is cheaper
+            sets = (
+                slots for (x, y), slots in self.cells.items()
+                if x0 <= x <= x1 and y0 <= y <= y1
+            )
+
+        return np.fromiter(itertools.chain.from_iterable(sets), dtype=np.int64)
+
+    def matches(self, slots: np.ndarray, replica_filter: ReplicaFilter) -> np.ndarray:
+        keep = np.ones(len(slots), dtype=bool)
+        if replica_filter.statuses is not None:
+            keep &= np.isin(self.status_codes[slots], replica_filter.statuses)
+        if replica_filter.categories is not None:
+            codes = [
+                self.category_index[category]
+                for category in replica_filter.categories
+                if category in self.category_index
+            ]
+            keep &= np.isin(self.category_codes[slots], codes)
+        if replica_filter.masks is not None:
+            keep &= np.isin(self.features[slots], replica_filter.masks)
+        if replica_filter.min_score is not None:
+            keep &= self.scores[slots] >= replica_filter.min_score
+        return keep
+
+    def nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_m: float,
+        replica_filter: ReplicaFilter,
+        after: Optional[tuple[float, UUID]],
+        limit: int,
+        fields: tuple[str, ...] = PLACE_FIELDS,
+    ) -> Optional[list[tuple[dict[str, Any], float]]]:
+        """
+        (place, distance_m) nearest first, ties by id, after the cursor.
+        """
+        delta_lat = math.degrees(radius_m / EARTH_RADIUS_M)
+        if abs(latitude) + delta_lat >= 90:
+            return None
+        delta_lon = delta_lat / math.cos(math.radians(abs(latitude) + delta_lat))
+        if abs(longitude) + delta_lon > 180:
+            return None
+
+        slots = self.candidates(
+            longitude - delta_lon, latitude - delta_lat,
+            longitude + delta_lon, latitude + delta_lat,
+        )
+
+        # Haversine distance on the sphere
+        lat1 = math.radians(latitude)
+        lat2 = np.radians(self.latitudes[slots])
+        half_dlat = (lat2 - lat1) / 2
+        half_dlon = np.radians(self.longitudes[slots] - longitude) / 2
+        a = np.sin(half_dlat) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(half_dlon) ** 2
+        distances = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+        keep = (distances <= radius_m) & self.matches(slots, replica_filter)
+        ids = self.id_bytes[slots]
+        if after is not None:
+            last_distance, last_id = after
+            keep &= (distances > last_distance) | (
+                (distances == last_distance) & (ids > last_id.bytes))
+
+        slots, distances, ids = slots[keep], distances[keep], ids[keep]
+        order = np.lexsort((ids, distances))[:limit]
+        return [(self.place(slots[i], fields), float(distances[i])) for i in order]
+
+    def bbox(
+        self,
+        min_lon: float,
+        min_lat: float,
+        max_lon: float,
+        max_lat: float,
+        replica_filter: ReplicaFilter,
+        limit: int,
+        fields: tuple[str, ...] = PLACE_FIELDS,
+    ) -> list[dict[str, Any]]:
+        slots = self.candidates(min_lon, min_lat, max_lon, max_lat)
+        latitudes = self.latitudes[slots]
+        longitudes = self.longitudes[slots]
+        keep = (
+            (latitudes >= min_lat) & (latitudes <= max_lat)
+            & (longitudes >= min_lon) & (longitudes <= max_lon)
+            & self.matches(slots, replica_filter)
+        )
+        return [self.place(slot, fields) for slot in slots[keep][:limit]]
+
+    def stats(self) -> list[tuple[str, str, int]]:
+        return [
+            (status, category, count)
+            for (status, category), count in self.counts.items()
+            if count > 0
+        ]
+
+
+class PlaceReplica:
+    """
+    Owns the replica data, the LISTEN connection and the sync task.
+    """
+
+    def __init__(self, cell_degrees: float, sync_seconds: float, max_staleness: float):
+        self.cell_degrees = cell_degrees
+        self.sync_seconds = sync_seconds
+        self.max_staleness = max_staleness
+        self.data: Optional[ReplicaData] = None
+        self.version = 0
+        self.updated_at: Optional[datetime] = None
+        self.synced_at = -math.inf
+        # Versions with parts still to come: version -> (notification, parts seen)
+        self._pending: dict[int, tuple[PlaceNotification, set[int]]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._connection: Optional[asyncpg.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def usable(self) -> bool:
+        """
+        True while the replica was confirmed current within the bound.
+        """
+        return (
+            self.data is not None
+            and time.monotonic() - self.synced_at <= self.max_staleness
+        )
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        await self._connect()
+        await self._reload()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self._disconnect()
+        self.data = None
+
+    async def _connect(self) -> None:
+        # asyncpg takes the plain postgresql:// URL
+        self._connection = await asyncpg.connect(settings.sync_database_url)
+        await self._connection.add_listener(CHANNEL, self._on_notify)
+
+    async def _disconnect(self) -> None:
+        if self._connection is not None:
+            with contextlib.suppress(Exception):
+                await self._connection.close()
+            self._connection = None
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        self._queue.put_nowait(payload)
+
+    async def _reload(self) -> None:
+        """
+        Load every place and the dataset version from one snapshot, then
+        swap the new data in.
+        """
+        data = ReplicaData(self.cell_degrees)
+        async with engine.connect() as connection:
+            connection = await connection.execution_options(
+                isolation_level="REPEATABLE READ")
+            async with connection.begin():
+                version, updated_at = (await connection.execute(
+                    select(DatasetVersion.version, DatasetVersion.updated_at)
+                    .where(DatasetVersion.id == 1)
+                )).one()
+                result = await connection.stream(
+                    select(*place_columns(PLACE_FIELDS))
+                    .execution_options(yield_per=settings.export_batch_size)
+                )
+                async for rows in result.partitions():
+                    for row in rows:
+                        data.upsert(row)
+
+        self.data, self.version, self.updated_at = data, version, updated_at
+        self._pending = {
+            pending: entry
+            for pending, entry in self._pending.items()
+            if pending > version
+        }
+        self.synced_at = time.monotonic()
+        response_cache.invalidate("stats")
+        print(f"🧠 Replica loaded {len(data)} places at dataset version {version}")
+
+    async def _read_places(self, ids: set[UUID]) -> list[Any]:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(*place_columns(PLACE_FIELDS)).where(Place.id.in_(ids))
+            )
+            return result.all()
+
+    async def _apply(self, payloads: list[str]) -> None:
+        ids: set[UUID] = set()
+        for payload in payloads:
+            notification = parse_notification(payload)
+            # Versions up to self.version are complete in the data
+            if notification.version <= self.version:
+                continue
+            if notification.ids is None:
+                await self._reload()
+                return
+            ids.update(notification.ids)
+            _, parts = self._pending.setdefault(
+                notification.version, (notification, set()))
+            parts.add(notification.part)
+
+        if ids:
+            rows = await self._read_places(ids)
+            for row in rows:
+                self.data.upsert(row)
+            for place_id in ids.difference(row.id for row in rows):
+                self.data.delete(place_id)
+            response_cache.invalidate("stats")
+
+        # Re-reading ids is idempotent, but the version only advances over
+        # versions whose parts have all arrived
+        for version in sorted(self._pending):
+            notification, parts = self._pending[version]
+            if len(parts) < notification.parts:
+                break
+            del self._pending[version]
+            self.version, self.updated_at = version, notification.updated_at
+
+    async def _run(self) -> None:
+        missed = 0
+        while True:
+            try:
+                payloads = [await asyncio.wait_for(self._queue.get(), self.sync_seconds)]
+            except asyncio.TimeoutError:
+                payloads = []
+            while not self._queue.empty():
+                payloads.append(self._queue.get_nowait())
+
+            try:
+                await self._apply(payloads)
+
+                current = await self._connection.fetchval(
+                    "SELECT version FROM dataset_version WHERE id = 1")
+                if current <= self.version:
+                    self.synced_at = time.monotonic()
+                    missed = 0
+                elif not payloads:
+                    # Behind with nothing in flight twice in a row: a
+                    # notification was lost
+                    missed += 1
+                    if missed >= 2:
+                        print("⚠️  Replica missed changes, reloading")
+                        await self._reload()
+                        missed = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                # Reads fall back to SQL once the staleness bound passes
+                print(f"⚠️  Replica sync failed, reconnecting: {exc}")
+                await asyncio.sleep(self.sync_seconds)
+                with contextlib.suppress(Exception):
+                    await self._disconnect()
+                    await self._connect()
+                    await self._reload()
+
+
+place_replica = PlaceReplica(
+    cell_degrees=settings.replica_cell_degrees,
+    sync_seconds=settings.replica_sync_seconds,
+    max_staleness=settings.replica_max_staleness_seconds,
+)
@@ -0,0 +1,122 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from fastapi import Request
+
+from app.config import settings
+
+
+class ResponseCache:
+    """
+    In-process TTL + LRU cache of serialized read responses.
+
+    Entries carry tags ("stats", "place:<id>", ...) so write handlers can
+    drop exactly what they affect. The TTL bounds staleness for writes
+    made through other worker processes.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, Any, frozenset[str]]] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] < time.monotonic():
+            self._remove(key)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: str, value: Any, tags: Iterable[str], generation: int) -> None:
+        # Skip values loaded before an invalidation that ran meanwhile
+        if generation != self.generation:
+            return
+
+        self._remove(key)
+        tags = frozenset(tags)
+        self._entries[key] = (time.monotonic() + self.ttl, value, tags)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    async def get_or_load(
+        self,
+        key: str,
+        tags: Iterable[str],
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        generation = self.generation
+        value = await loader()
+        self.set(key, value, tags, generation)
+        return value
+
+    def invalidate(self, *tags: str) -> None:
+        self.generation += 1
+        for tag in tags:
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+response_cache = ResponseCache(
+    ttl=settings.response_cache_ttl_seconds,
+    max_entries=settings.response_cache_max_entries,
+)
+
+
+def cache_key(request: Request) -> str:
+    """
+    Route path plus query parameters in a canonical order.
+    """
+    params = sorted(request.query_params.multi_items())
+    query = "&".join(f"{name}={value}" for name, value in params)
+    return f"{request.url.path}?{query}"
@@ -0,0 +1,123 @@
+"""
+Accessibility scoring.
+
+Each place gets a 0-100 score from weighted accessibility features
+(ACCESSIBILITY_SCORE_WEIGHTS), persisted in places.accessibility_score,
+and the status follows from the score. The same rules exist as Python
+for single rows and as SQL for set-based rescoring.
+"""
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import SmallInteger, case, cast, func, literal, or_
+
+from app.config import settings
+from app.models.place import AccessibilityStatus, Place, RestroomAccessibility
+
+
+# Minimum score for each status, checked in order
+STATUS_THRESHOLDS = (
+    (70, AccessibilityStatus.accessible),
+    (30, AccessibilityStatus.partially_accessible),
+    (1, AccessibilityStatus.not_accessible),
+)
+
+RESTROOM_PRESENT = (RestroomAccessibility.partial, RestroomAccessibility.full)
+
+
+def _feature_checks(get) -> dict[str, bool]:
+    return {
+        "ramp_present": bool(get("ramp_present")),
+        "step_free_entrance": bool(get("step_free_entrance")),
+        "accessible_restroom": get("accessible_restroom") in RESTROOM_PRESENT,
+        "tactile_paving": bool(get("tactile_paving")),
+        "signage": bool(get("audio_signage") or get("braille_signage")),
+        "staff_assistance_available": bool(get("staff_assistance_available")),
+    }
+
+
+def _feature_conditions() -> dict[str, Any]:
+    return {
+        "ramp_present": Place.ramp_present.is_(True),
+        "step_free_entrance": Place.step_free_entrance.is_(True),
+        "accessible_restroom": Place.accessible_restroom.in_(RESTROOM_PRESENT),
+        "tactile_paving": Place.tactile_paving.is_(True),
+        "signage": or_(Place.audio_signage.is_(True), Place.braille_signage.is_(True)),
+        "staff_assistance_available": Place.staff_assistance_available.is_(True),
+    }
+
+
+def score_weights() -> dict[str, float]:
+    weights = settings.accessibility_score_weights
+    unknown = set(weights).difference(_feature_conditions())
+    if unknown:
+        raise ValueError(
+            f"Unknown accessibility score features: {', '.join(sorted(unknown))}")
+    return {feature: weight for feature, weight in weights.items() if weight > 0}
+
+
+WEIGHTS = score_weights()
+TOTAL_WEIGHT = sum(WEIGHTS.values())
+
+
+def accessibility_score(place: Any) -> int:
+    """
+    Weighted 0-100 score of a Place, a Contribution or a dict of column values.
+    """
+    if isinstance(place, Mapping):
+        get = place.get
+    else:
+        def get(key):
+            return getattr(place, key, None)
+
+    if not TOTAL_WEIGHT:
+        return 0
+
+    present = _feature_checks(get)
+    score = sum(weight for feature, weight in WEIGHTS.items() if present[feature])
+    return round(100 * score / TOTAL_WEIGHT)
+
+
+def status_for_score(score: int) -> AccessibilityStatus:
+    for minimum, status in STATUS_THRESHOLDS:
+        if score >= minimum:
+            return status
+    return AccessibilityStatus.unknown
+
+
+def calculate_accessibility_status(place: Any) -> AccessibilityStatus:
+    """
+    Calculate accessibility status based on attributes.
+
+    Accepts a Place, a Contribution or a dict of column values.
+    """
+    return status_for_score(accessibility_score(place))
+
+
+def score_expression():
+    """
+    SQL equivalent of accessibility_score() over the places columns.
+    """
+    if not TOTAL_WEIGHT:
+        return literal(0, SmallInteger)
+
+    conditions = _feature_conditions()
+    weighted = sum(
+        case((conditions[feature], weight), else_=0)
+        for feature, weight in WEIGHTS.items()
+    )
+    return cast(func.round(100 * weighted / TOTAL_WEIGHT), SmallInteger)
+
+
+def status_expression(score):
+    """
+    SQL equivalent of status_for_score() for a score expression.
+    """
+    status_type = Place.__table__.c.accessibility_status.type
+    return case(
+        *[
+            (score >= minimum, literal(status, status_type))
+            for minimum, status in STATUS_THRESHOLDS
+        ],
+        else_=literal(AccessibilityStatus.unknown, status_type),
+    )
@@ -0,0 +1,84 @@
+"""
+Fast serialization of place rows.
+
+Read routes select plain columns instead of ORM entities and build the
+response dicts straight from the row mappings. orjson encodes UUIDs,
+datetimes and enums natively, so no per-row pydantic validation runs;
+the JSON shape matches the declared response models.
+"""
+import enum
+from datetime import datetime
+from typing import Any, Optional
+
+import orjson
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+from app.models.place import Place
+from app.schemas.place import PlaceResponse
+
+
+PLACE_FIELDS = tuple(PlaceResponse.model_fields)
+
+# UTC datetimes end in "Z", as pydantic renders them
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def parse_fields(fields: Optional[str]) -> tuple[str, ...]:
+    """
+    Validate a comma-separated sparse fieldset, in response field order.
+    The id is always included.
+    """
+    if not fields:
+        return PLACE_FIELDS
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested.difference(PLACE_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    requested.add("id")
+    return tuple(field for field in PLACE_FIELDS if field in requested)
+
+
+def place_columns(fields: tuple[str, ...], *extra: str) -> list:
+    """
+    Place columns for a fieldset plus any extra columns a query needs
+    for ordering or cursors.
+    """
+    names = list(fields)
+    names.extend(name for name in extra if name not in fields)
+    return [getattr(Place, name) for name in names]
+
+
+def serialize_place(row, fields: tuple[str, ...] = PLACE_FIELDS) -> dict[str, Any]:
+    mapping = row._mapping
+    return {field: mapping[field] for field in fields}
+
+
+def text_value(value: Any) -> Any:
+    """
+    Plain-text rendering of a column value for CSV, matching the JSON form.
+    """
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat().replace("+00:00", "Z")
+    return value
@@ -0,0 +1,141 @@
+"""
+Write-behind buffer for public contribution submissions.
+
+When enabled, submissions are validated and queued in memory, and a
+background task started in the app lifespan inserts them in multi-row
+batches, one connection and one commit per batch instead of per request.
+"""
+import asyncio
+import contextlib
+import logging
+from typing import Any, Optional
+
+from sqlalchemy import insert
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.place import Contribution, ContributionStatus
+from app.services.contribution_counts import apply_status_changes
+from app.services.response_cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before each retry of a failed batch insert
+RETRY_DELAYS = (1, 2, 4)
+
+
+class SubmissionBuffer:
+    """
+    Bounded queue of contribution rows with a batching flusher task.
+    """
+
+    def __init__(self, max_size: int, batch_size: int, flush_seconds: float):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._task = asyncio.create_task(self._run())
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_size": self.max_size,
+            "dropped": self.dropped,
+        }
+
+    def submit(self, values: dict[str, Any]) -> bool:
+        """
+        Queue one contribution row; False when the buffer is full.
+        """
+        try:
+            self._queue.put_nowait(values)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def stop(self, timeout: float) -> int:
+        """
+        Flush everything queued, then stop the flusher.
+        Returns the number of rows still queued if the drain timed out.
+        """
+        if self._task is None:
+            return 0
+
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._queue.join(), timeout)
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        return self._queue.qsize()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+
+            # Collect up to batch_size rows or until flush_seconds pass
+            deadline = loop.time() + self.flush_seconds
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: list[dict[str, Any]]) -> None:
+        for delay in (*RETRY_DELAYS, None):
+            try:
+                await self._insert(batch)
+                break
+            except Exception as exc:
+                if delay is None:
+                    # Keep the rest of the batch when one row is bad
+                    print(f"⚠️  Buffered batch failed, inserting {len(batch)} rows singly: {exc}")
+                    await self._insert_singly(batch)
+                    break
+                print(f"⚠️  Buffered contribution insert failed, retrying in {delay}s: {exc}")
+                await asyncio.sleep(delay)
+
+        response_cache.invalidate("contributions")
+
+    async def _insert(self, rows: list[dict[str, Any]]) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(Contribution), rows)
+            await apply_status_changes(
+                db, {ContributionStatus.pending: len(rows)})
+            await db.commit()
+
+    async def _insert_singly(self, batch: list[dict[str, Any]]) -> None:
+        for row in batch:
+            try:
+                await self._insert([row])
+            except Exception as exc:
+                self.dropped += 1
+                logger.error("Dropped buffered contribution %s: %s", row["id"], exc)
+
+
+submission_buffer = SubmissionBuffer(
+    max_size=settings.submission_buffer_max_size,
+    batch_size=settings.submission_buffer_batch_size,
+    flush_seconds=settings.submission_buffer_flush_seconds,
+)
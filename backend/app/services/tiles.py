@@ -0,0 +1,149 @@
+import math
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+# Web Mercator stops at ~85.0511 degrees
+MAX_MERCATOR_LATITUDE = 85.0511287798
+
+# Points are selected with the exact tile envelope (no buffer). `&&` is
+# inclusive, so a place on a tile edge is drawn in every tile sharing
+# that edge; invalidation drops all of them (see tiles_for)
+TILE_QUERY = text("""
+    WITH bounds AS (
+        SELECT ST_TileEnvelope(:z, :x, :y) AS geom
+    )
+    SELECT ST_AsMVT(tile, 'places', 4096, 'geom')
+    FROM (
+        SELECT
+            ST_AsMVTGeom(
+                ST_Transform(p.location, 3857), bounds.geom, 4096, 0, false
+            ) AS geom,
+            p.id::text AS id,
+            p.accessibility_status::text AS status,
+            p.category
+        FROM places p, bounds
+        WHERE p.location && ST_Transform(bounds.geom, 4326)
+    ) AS tile
+""")
+
+
+# Tile widths within which a point counts as on an edge, covering float
+# differences between this and PostGIS's projection
+EDGE_EPSILON = 1e-6
+
+
+def tiles_for(longitude: float, latitude: float, z: int) -> set[tuple[int, int]]:
+    """
+    XYZ tiles whose envelope contains a WGS84 point at zoom z: one, or
+    two or four when the point lies on a tile edge or corner.
+    """
+    n = 2 ** z
+    latitude = max(-MAX_MERCATOR_LATITUDE, min(MAX_MERCATOR_LATITUDE, latitude))
+    lat_rad = math.radians(latitude)
+
+    x = (longitude + 180.0) / 360.0 * n
+    y = (1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n
+
+    def indexes(value: float) -> set[int]:
+        return {
+            min(max(math.floor(value + offset), 0), n - 1)
+            for offset in (-EDGE_EPSILON, EDGE_EPSILON)
+        }
+
+    return {(tx, ty) for tx in indexes(x) for ty in indexes(y)}
+
+
+class TileCache:
+    """
+    LRU cache of encoded tiles bounded by total bytes.
+
+    Entries also expire after `ttl` seconds, which bounds staleness for
+    writes made through another worker process. As with the count cache,
+    a tile rendered before an invalidation is not stored after it.
+    """
+
+    def __init__(self, ttl: float, max_bytes: int, max_zoom: int):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_zoom = max_zoom
+        self.generation = 0
+        self.size = 0
+        self._tiles: OrderedDict[tuple[int, int, int], tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: tuple[int, int, int]) -> Optional[bytes]:
+        entry = self._tiles.get(key)
+        if entry is None:
+            return None
+
+        expires_at, tile = entry
+        if expires_at < time.monotonic():
+            self._discard(key)
+            return None
+
+        self._tiles.move_to_end(key)
+        return tile
+
+    def set(self, key: tuple[int, int, int], tile: bytes, generation: int) -> None:
+        if generation != self.generation:
+            return
+
+        self._discard(key)
+        if len(tile) > self.max_bytes:
+            return
+
+        self._tiles[key] = (time.monotonic() + self.ttl, tile)
+        self.size += len(tile)
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self._tiles.popitem(last=False)
+            self.size -= len(evicted)
+
+    def invalidate_point(self, longitude: float, latitude: float) -> None:
+        """
+        Drop the tiles containing a point at every zoom level.
+        """
+        self.generation += 1
+        for z in range(self.max_zoom + 1):
+            for x, y in tiles_for(longitude, latitude, z):
+                self._discard((z, x, y))
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._tiles.clear()
+        self.size = 0
+
+    def _discard(self, key: tuple[int, int, int]) -> None:
+        entry = self._tiles.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+
+tile_cache = TileCache(
+    ttl=settings.tile_cache_ttl_seconds,
+    max_bytes=settings.tile_cache_max_bytes,
+    max_zoom=settings.tile_max_zoom,
+)
+
+
+async def get_tile(db: AsyncSession, z: int, x: int, y: int) -> bytes:
+    """
+    Encoded places layer for tile z/x/y, served from the cache when present.
+    """
+    key = (z, x, y)
+    tile = tile_cache.get(key)
+    if tile is not None:
+        return tile
+
+    generation = tile_cache.generation
+    result = await db.execute(TILE_QUERY, {"z": z, "x": x, "y": y})
+    tile = result.scalar() or b""
+    tile_cache.set(key, bytes(tile), generation)
+    return tile
@@ -0,0 +1,446 @@
+"""
+Bulk import places from JSON, NDJSON, CSV or GeoJSON.
+
+Input is streamed and loaded in chunks: each chunk is COPYed into a
+temporary staging table and upserted into places on legacy_id, so
+re-running an import updates existing places instead of duplicating them.
+
+Usage:
+    python -m scripts.bulk_import data/places.ndjson
+    python -m scripts.bulk_import data/places.geojson --chunk-size 10000
+    python -m scripts.bulk_import data/places.csv --dry-run
+    python -m scripts.bulk_import data/places.json --resume
+
+    Or with docker:
+    docker-compose exec backend python -m scripts.bulk_import /app/seed_data/places.json
+"""
+from app.models.place import Place, derived_place_values
+from app.database import AsyncSessionLocal
+from app.services.conditional import bump_dataset_version
+from app.services.place_stats import rebuild_place_stats
+from scripts.seed_data import (
+    map_accessibility_status,
+    map_restroom,
+    map_level,
+    map_source,
+)
+from sqlalchemy import Enum, text
+import argparse
+import asyncio
+import csv
+import enum
+import io
+import json
+import re
+import time
+import uuid
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+DEFAULT_CHUNK_SIZE = 5000
+READ_SIZE = 1 << 20
+MAX_REPORTED_ERRORS = 20
+
+FORMATS = {
+    ".json": "json",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+    ".geojson": "geojson",
+}
+
+BOOLEAN_FIELDS = (
+    "ramp_present",
+    "step_free_entrance",
+    "tactile_paving",
+    "audio_signage",
+    "braille_signage",
+    "staff_assistance_available",
+)
+
+# Every places column except the ones the upsert computes itself
+PLACE_COLUMNS = {
+    column.name: column
+    for column in Place.__table__.columns
+    if column.name not in ("location", "created_at", "updated_at")
+}
+IMPORT_COLUMNS = list(PLACE_COLUMNS)
+UPDATE_COLUMNS = [name for name in IMPORT_COLUMNS if name not in ("id", "legacy_id")]
+
+
+def staging_select() -> str:
+    # Enums are staged as text (COPY sends plain strings) and cast back on upsert
+    return ", ".join(
+        f"{name}::text AS {name}" if isinstance(column.type, Enum) else name
+        for name, column in PLACE_COLUMNS.items()
+    )
+
+
+def upsert_select() -> str:
+    return ", ".join(
+        f"{name}::{column.type.name}" if isinstance(column.type, Enum) else name
+        for name, column in PLACE_COLUMNS.items()
+    )
+
+
+CREATE_STAGING = f"""
+    CREATE TEMP TABLE IF NOT EXISTS places_staging
+    ON COMMIT DELETE ROWS AS
+    SELECT 0::bigint AS import_seq, {staging_select()}
+    FROM places WITH NO DATA
+"""
+
+
+def upsert_sql(only_changed: bool = False) -> str:
+    """
+    Upsert the staged chunk into places on legacy_id; later rows win when
+    a chunk repeats a legacy_id. With only_changed, rows identical to the
+    stored place are left untouched (and not returned).
+    """
+    condition = ""
+    if only_changed:
+        stored = ", ".join(f"places.{name}" for name in UPDATE_COLUMNS)
+        incoming = ", ".join(f"EXCLUDED.{name}" for name in UPDATE_COLUMNS)
+        condition = f"WHERE ({stored}) IS DISTINCT FROM ({incoming})"
+
+    return f"""
+        INSERT INTO places ({", ".join(IMPORT_COLUMNS)}, location)
+        SELECT DISTINCT ON (legacy_id)
+            {upsert_select()},
+            ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)
+        FROM places_staging
+        ORDER BY legacy_id, import_seq DESC
+        ON CONFLICT (legacy_id) DO UPDATE SET
+            {", ".join(f"{name} = EXCLUDED.{name}" for name in UPDATE_COLUMNS)},
+            location = EXCLUDED.location,
+            updated_at = now()
+        {condition}
+        RETURNING (xmax = 0) AS inserted
+    """
+
+
+UPSERT = upsert_sql()
+
+
+# Readers
+def iter_json_array(stream, key: str | None = None):
+    """
+    Yield the objects of a top-level JSON array (or of the array stored
+    under `key`) without loading the whole document.
+    """
+    decoder = json.JSONDecoder()
+    buffer = stream.read(READ_SIZE)
+
+    # Find the start of the array
+    pattern = re.compile(r'"%s"\s*:\s*\[' % re.escape(key) if key else r"\s*\[")
+    while True:
+        match = pattern.search(buffer) if key else pattern.match(buffer)
+        if match:
+            pos = match.end()
+            break
+        chunk = stream.read(READ_SIZE)
+        if not chunk:
+            raise ValueError(f'No "{key}" array found' if key else "Expected a JSON array")
+        buffer += chunk
+
+    while True:
+        # Skip separators, refilling the buffer as needed
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+        if pos == len(buffer):
+            buffer = stream.read(READ_SIZE)
+            pos = 0
+            if not buffer:
+                raise ValueError("Unterminated JSON array")
+            continue
+
+        if buffer[pos] == "]":
+            return
+
+        try:
+            value, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            chunk = stream.read(READ_SIZE)
+            if not chunk:
+                raise
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+
+        yield value
+
+
+def iter_ndjson(stream):
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def iter_csv(stream):
+    for row in csv.DictReader(stream):
+        yield {key: (value if value != "" else None) for key, value in row.items()}
+
+
+def iter_geojson(stream):
+    for feature in iter_json_array(stream, key="features"):
+        record = dict(feature.get("properties") or {})
+        record.setdefault("id", feature.get("id"))
+        coordinates = (feature.get("geometry") or {}).get("coordinates")
+        if coordinates:
+            record["longitude"], record["latitude"] = coordinates[:2]
+        yield record
+
+
+READERS = {
+    "json": iter_json_array,
+    "ndjson": iter_ndjson,
+    "csv": iter_csv,
+    "geojson": iter_geojson,
+}
+
+
+# Mapping
+def parse_bool(value) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes", "y", "t")
+    return bool(value)
+
+
+def place_values(record: dict) -> dict:
+    """
+    Map an input record to places column values, raising ValueError
+    for records that cannot be imported.
+    """
+    legacy_id = record.get("id") or record.get("legacy_id")
+    if legacy_id is None:
+        raise ValueError("missing id")
+
+    missing = [field for field in ("name", "category", "latitude", "longitude")
+               if record.get(field) in (None, "")]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+
+    latitude = float(record["latitude"])
+    longitude = float(record["longitude"])
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise ValueError("coordinates out of range")
+
+    values = {
+        "legacy_id": str(legacy_id),
+        "name": record["name"],
+        "name_local": record.get("name_local"),
+        "category": record["category"],
+        "address": record.get("address"),
+        "latitude": latitude,
+        "longitude": longitude,
+        "accessible_restroom": map_restroom(
+            record.get("accessible_restroom") or "none"),
+        "lighting_level": map_level(record.get("lighting_level") or "medium"),
+        "noise_level": map_level(record.get("noise_level") or "medium"),
+        "notes": record.get("notes"),
+        "photo_url": record.get("photo_url"),
+        "accessibility_status": map_accessibility_status(
+            record.get("accessibility_status") or "unknown"),
+        "status_explicit": bool(record.get("accessibility_status")),
+        "source": map_source(record.get("source") or "manual"),
+    }
+    for field in BOOLEAN_FIELDS:
+        values[field] = parse_bool(record.get(field, False))
+
+    for name, value in values.items():
+        length = getattr(PLACE_COLUMNS[name].type, "length", None)
+        if length and isinstance(value, str) and len(value) > length:
+            raise ValueError(f"{name} longer than {length} characters")
+
+    values.update(derived_place_values(values))
+    return values
+
+
+def staging_record(seq: int, place_id, values: dict) -> tuple:
+    row = [seq]
+    for name in IMPORT_COLUMNS:
+        value = place_id if name == "id" else values.get(name)
+        row.append(value.value if isinstance(value, enum.Enum) else value)
+    return tuple(row)
+
+
+# Checkpoints
+def checkpoint_path(source: Path) -> Path:
+    return source.with_name(source.name + ".import-state.json")
+
+
+def load_checkpoint(source: Path) -> int:
+    path = checkpoint_path(source)
+    if not path.exists():
+        return 0
+
+    state = json.loads(path.read_text())
+    if state.get("size") != source.stat().st_size:
+        raise SystemExit(f"❌ {source} changed since the last run; remove {path} to start over")
+    return state["records"]
+
+
+def save_checkpoint(source: Path, records: int) -> None:
+    checkpoint_path(source).write_text(json.dumps({
+        "source": str(source),
+        "size": source.stat().st_size,
+        "records": records,
+    }))
+
+
+class Progress:
+    def __init__(self, total_bytes: int):
+        self.total_bytes = total_bytes
+        self.started = time.monotonic()
+        self.records = 0
+        self.inserted = 0
+        self.updated = 0
+        self.invalid = 0
+
+    def report(self, position: int) -> None:
+        elapsed = time.monotonic() - self.started
+        rate = self.records / elapsed if elapsed else 0
+        percent = 100 * position / self.total_bytes if self.total_bytes else 100
+        print(
+            f"📦 {percent:5.1f}% | {self.records} records ({rate:,.0f}/s) | "
+            f"inserted {self.inserted}, updated {self.updated}, invalid {self.invalid}"
+        )
+
+
+async def load_chunk(session, rows: list[tuple], upsert: str = UPSERT) -> tuple[int, int]:
+    """
+    COPY one chunk into the staging table and upsert it into places.
+    Returns (inserted, updated).
+    """
+    await session.execute(text(CREATE_STAGING))
+
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "places_staging",
+        records=rows,
+        columns=["import_seq", *IMPORT_COLUMNS],
+    )
+
+    result = await session.execute(text(upsert))
+    flags = result.scalars().all()
+    await session.commit()
+
+    inserted = sum(flags)
+    return inserted, len(flags) - inserted
+
+
+async def bulk_import(
+    source: Path,
+    source_format: str,
+    chunk_size: int,
+    dry_run: bool,
+    resume: bool,
+):
+    print(f"📂 Importing {source} ({source_format})")
+
+    skip = load_checkpoint(source) if resume else 0
+    if skip:
+        print(f"⏩ Resuming after {skip} records")
+
+    progress = Progress(source.stat().st_size)
+    errors = 0
+
+    with open(source, "rb") as raw_file:
+        stream = io.TextIOWrapper(raw_file, encoding="utf-8", newline="")
+        records = READERS[source_format](stream)
+
+        async with AsyncSessionLocal() as session:
+            chunk: list[tuple] = []
+            for seq, record in enumerate(records, start=1):
+                if seq <= skip:
+                    continue
+
+                try:
+                    values = place_values(record)
+                except (KeyError, TypeError, ValueError) as exc:
+                    progress.invalid += 1
+                    errors += 1
+                    if errors <= MAX_REPORTED_ERRORS:
+                        print(f"⚠️  Record {seq}: {exc}")
+                    continue
+
+                chunk.append(staging_record(seq, uuid.uuid4(), values))
+                progress.records += 1
+
+                if len(chunk) >= chunk_size:
+                    if not dry_run:
+                        inserted, updated = await load_chunk(session, chunk)
+                        progress.inserted += inserted
+                        progress.updated += updated
+                        save_checkpoint(source, seq)
+                    chunk = []
+                    progress.report(raw_file.tell())
+
+            if chunk and not dry_run:
+                inserted, updated = await load_chunk(session, chunk)
+                progress.inserted += inserted
+                progress.updated += updated
+            progress.report(raw_file.tell())
+
+            if dry_run:
+                print(f"🧪 Dry run: {progress.records} valid and "
+                      f"{progress.invalid} invalid records, nothing written")
+                return
+
+            # Bulk writes bypass the per-place hooks; rebuild derived tables once
+            await rebuild_place_stats(session)
+            await bump_dataset_version(session)
+            await session.commit()
+
+    checkpoint_path(source).unlink(missing_ok=True)
+    print(f"✅ Inserted {progress.inserted} and updated {progress.updated} places")
+    if progress.invalid:
+        print(f"⏭️  Skipped {progress.invalid} invalid records")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import places")
+    parser.add_argument("source", type=Path)
+    parser.add_argument(
+        "--format", dest="source_format", choices=sorted(READERS),
+        help="Input format (default: from the file extension)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Parse and validate the input without writing")
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="Continue after the last committed chunk of a previous run")
+    args = parser.parse_args()
+
+    if not args.source.exists():
+        print(f"❌ Data file not found: {args.source}")
+        sys.exit(1)
+
+    source_format = args.source_format or FORMATS.get(args.source.suffix.lower())
+    if source_format is None:
+        parser.error("cannot infer the format; pass --format")
+
+    print("🚚 Starting bulk import...")
+    print("-" * 40)
+
+    asyncio.run(bulk_import(
+        args.source,
+        source_format,
+        args.chunk_size,
+        args.dry_run,
+        args.resume,
+    ))
+
+    print("-" * 40)
+    print("🎉 Import complete!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Ingest places from a local OpenStreetMap extract (.osm.pbf or .osm/.osm.xml).
+
+The extract is streamed with osmium; tagged nodes and ways (at their
+centroid) are batched out to a process pool that maps their tags onto
+Place columns, and the results are bulk-upserted on their OSM id
+(legacy_id "osm:n<id>" / "osm:w<id>"). Rows identical to the stored
+place are skipped, so a weekly re-run only writes objects that changed.
+
+Only tag mapping runs in the worker processes. Reading the extract
+stays in the main process: libosmium decodes PBF blocks on its own
+threads, but the filtered object stream and the way centroids (which
+need the node location index) are produced serially, and that read is
+what bounds the run time on a country extract.
+
+Usage:
+    python -m scripts.ingest_osm india-latest.osm.pbf
+    python -m scripts.ingest_osm india-latest.osm.pbf --workers 8 --prune
+    python -m scripts.ingest_osm mumbai.osm --dry-run
+
+    Or with docker:
+    docker-compose exec backend python -m scripts.ingest_osm /app/seed_data/india-latest.osm.pbf
+"""
+from app.database import AsyncSessionLocal
+from app.services.conditional import bump_dataset_version
+from app.services.osm import CATEGORY_KEYS, map_osm_elements
+from app.services.place_stats import rebuild_place_stats
+from scripts.bulk_import import load_chunk, staging_record, upsert_sql
+from sqlalchemy import text
+import argparse
+import asyncio
+import osmium
+import os
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+DEFAULT_CHUNK_SIZE = 5000
+ELEMENT_BATCH_SIZE = 2000
+REPORT_EVERY_SECONDS = 10
+
+UPSERT_CHANGED = upsert_sql(only_changed=True)
+
+# Places that disappeared from the extract; places referenced by
+# contributions are kept
+PRUNE = """
+    DELETE FROM places p
+    WHERE p.source = 'osm'
+      AND NOT EXISTS (SELECT 1 FROM osm_seen s WHERE s.legacy_id = p.legacy_id)
+      AND NOT EXISTS (SELECT 1 FROM contributions c WHERE c.place_id = p.id)
+"""
+
+
+def read_elements(source: Path):
+    """
+    Stream tagged nodes and ways carrying a category key as raw tuples.
+    """
+    processor = (
+        osmium.FileProcessor(str(source), osmium.osm.NODE | osmium.osm.WAY)
+        .with_locations()
+        .with_filter(osmium.filter.KeyFilter(*CATEGORY_KEYS))
+    )
+
+    for obj in processor:
+        if obj.is_node():
+            if not obj.location.valid():
+                continue
+            latitude, longitude = obj.location.lat, obj.location.lon
+            kind = "n"
+        else:
+            points = [node.location for node in obj.nodes if node.location.valid()]
+            if not points:
+                continue
+            latitude = sum(point.lat for point in points) / len(points)
+            longitude = sum(point.lon for point in points) / len(points)
+            kind = "w"
+
+        yield kind, obj.id, latitude, longitude, {tag.k: tag.v for tag in obj.tags}
+
+
+def batched(iterable, size: int):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def map_in_pool(pool: ProcessPoolExecutor, elements, max_pending: int):
+    """
+    Map element batches in worker processes, keeping at most max_pending
+    batches in flight so reading never runs far ahead of mapping.
+    """
+    pending = deque()
+    for batch in batched(elements, ELEMENT_BATCH_SIZE):
+        pending.append(pool.submit(map_osm_elements, batch))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+
+    while pending:
+        yield from pending.popleft().result()
+
+
+class Progress:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.reported = self.started
+        self.places = 0
+        self.inserted = 0
+        self.updated = 0
+
+    def report(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self.reported < REPORT_EVERY_SECONDS:
+            return
+        self.reported = now
+        rate = self.places / (now - self.started) if now > self.started else 0
+        unchanged = self.places - self.inserted - self.updated
+        print(
+            f"🗺️  {self.places} places ({rate:,.0f}/s) | inserted {self.inserted}, "
+            f"updated {self.updated}, unchanged {unchanged}"
+        )
+
+
+async def prune_missing(session, seen: list[str]) -> int:
+    await session.execute(text(
+        "CREATE TEMP TABLE osm_seen (legacy_id text PRIMARY KEY) ON COMMIT DROP"))
+
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "osm_seen", records=[(legacy_id,) for legacy_id in seen])
+
+    result = await session.execute(text(PRUNE))
+    return result.rowcount
+
+
+async def ingest_osm(
+    source: Path,
+    workers: int,
+    chunk_size: int,
+    prune: bool,
+    dry_run: bool,
+):
+    print(f"📂 Reading {source} with {workers} workers")
+
+    progress = Progress()
+    seen: list[str] = []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        async with AsyncSessionLocal() as session:
+            chunk: list[tuple] = []
+            places = map_in_pool(pool, read_elements(source), max_pending=workers * 2)
+            for seq, values in enumerate(places, start=1):
+                progress.places += 1
+                if prune:
+                    seen.append(values["legacy_id"])
+                if dry_run:
+                    progress.report()
+                    continue
+
+                chunk.append(staging_record(seq, uuid.uuid4(), values))
+                if len(chunk) >= chunk_size:
+                    inserted, updated = await load_chunk(session, chunk, UPSERT_CHANGED)
+                    progress.inserted += inserted
+                    progress.updated += updated
+                    chunk = []
+                    progress.report()
+
+            if chunk:
+                inserted, updated = await load_chunk(session, chunk, UPSERT_CHANGED)
+                progress.inserted += inserted
+                progress.updated += updated
+            progress.report(force=True)
+
+            if dry_run:
+                print(f"🧪 Dry run: {progress.places} places mapped, nothing written")
+                return
+
+            if prune:
+                removed = await prune_missing(session, seen)
+                print(f"🗑️  Removed {removed} places no longer in the extract")
+
+            # Bulk writes bypass the per-place hooks; rebuild derived tables once
+            await rebuild_place_stats(session)
+            await bump_dataset_version(session)
+            await session.commit()
+
+    print(f"✅ Inserted {progress.inserted} and updated {progress.updated} places")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest places from an OSM extract")
+    parser.add_argument("source", type=Path)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--prune", action="store_true",
+        help="Delete OSM places that are no longer in the extract")
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Read and map the extract without writing")
+    args = parser.parse_args()
+
+    if not args.source.exists():
+        print(f"❌ Extract not found: {args.source}")
+        sys.exit(1)
+
+    print("🌍 Starting OSM ingestion...")
+    print("-" * 40)
+
+    asyncio.run(ingest_osm(
+        args.source,
+        args.workers,
+        args.chunk_size,
+        args.prune,
+        args.dry_run,
+    ))
+
+    print("-" * 40)
+    print("🎉 Ingestion complete!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Recompute accessibility_score and accessibility_status for every place.
+
+Run after changing ACCESSIBILITY_SCORE_WEIGHTS or the scoring rules.
+Places are rescored in id-ordered chunks, one set-based UPDATE and one
+commit per chunk, and only rows whose score or status changes are
+written. Explicit statuses (status_explicit: set by an admin or an OSM
+wheelchair=* verdict) keep their status and only get a new score.
+
+Usage:
+    python -m scripts.rescore_places
+    python -m scripts.rescore_places --chunk-size 20000
+    python -m scripts.rescore_places --dry-run
+
+    Or with docker:
+    docker-compose exec backend python -m scripts.rescore_places
+"""
+from app.database import AsyncSessionLocal
+from app.models.place import Place
+from app.services.conditional import bump_dataset_version
+from app.services.place_stats import rebuild_place_stats
+from app.services.scoring import score_expression, status_expression
+from sqlalchemy import and_, case, func, or_, select, update
+import argparse
+import asyncio
+import time
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def rescore_chunk(last_id, chunk_size: int):
+    """
+    Statements for the next chunk after last_id: its upper id bound and
+    size, and the UPDATE rescoring (last_id, upper] that returns the
+    changed ids.
+    """
+    chunk = select(Place.id).order_by(Place.id).limit(chunk_size)
+    if last_id is not None:
+        chunk = chunk.where(Place.id > last_id)
+    chunk = chunk.subquery()
+    bounds_query = select(func.max(chunk.c.id), func.count())
+
+    bounds = Place.id <= select(func.max(chunk.c.id)).scalar_subquery()
+    if last_id is not None:
+        bounds = and_(Place.id > last_id, bounds)
+
+    scored = (
+        select(Place.id, score_expression().label("score"))
+        .where(bounds)
+        .subquery()
+    )
+    status = case(
+        (Place.status_explicit, Place.accessibility_status),
+        else_=status_expression(scored.c.score),
+    )
+
+    rescore = (
+        update(Place)
+        .where(Place.id == scored.c.id)
+        .where(or_(
+            Place.accessibility_score != scored.c.score,
+            Place.accessibility_status.is_distinct_from(status),
+        ))
+        .values(accessibility_score=scored.c.score, accessibility_status=status)
+        .returning(Place.id)
+        .execution_options(synchronize_session=False)
+    )
+    return bounds_query, rescore
+
+
+async def rescore_places(chunk_size: int, dry_run: bool):
+    started = time.monotonic()
+    scanned = 0
+    changed = 0
+    last_id = None
+
+    async with AsyncSessionLocal() as session:
+        total = (await session.execute(select(func.count(Place.id)))).scalar()
+        print(f"📊 Rescoring {total} places in chunks of {chunk_size}")
+
+        while True:
+            bounds, rescore = rescore_chunk(last_id, chunk_size)
+            upper_id, size = (await session.execute(bounds)).one()
+            if upper_id is None:
+                break
+
+            result = await session.execute(rescore)
+            changed += len(result.all())
+            scanned += size
+
+            if dry_run:
+                await session.rollback()
+            else:
+                await session.commit()
+            last_id = upper_id
+
+            rate = scanned / (time.monotonic() - started)
+            print(f"🔢 {scanned}/{total} places ({rate:,.0f}/s) | {changed} changed")
+
+        if dry_run:
+            print(f"🧪 Dry run: {changed} places would change, nothing written")
+            return
+
+        if changed:
+            # Status changes move places between stats buckets
+            await rebuild_place_stats(session)
+            await bump_dataset_version(session)
+            await session.commit()
+
+    print(f"✅ Rescored {changed} of {scanned} places")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute accessibility scores")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Count the places that would change without writing")
+    args = parser.parse_args()
+
+    print("🧮 Starting rescoring...")
+    print("-" * 40)
+
+    asyncio.run(rescore_places(args.chunk_size, args.dry_run))
+
+    print("-" * 40)
+    print("🎉 Rescoring complete!")
+
+
+if __name__ == "__main__":
+    main()
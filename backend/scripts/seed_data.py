@@ -15,6 +15,8 @@ from app.models.place import (
     DataSource,
 )
 from app.database import AsyncSessionLocal, engine, Base
+from app.services.conditional import bump_dataset_version
+from app.services.place_stats import rebuild_place_stats
 from sqlalchemy import select
 import asyncio
 import json
@@ -136,6 +138,9 @@ async def seed_places():
             session.add(place)
             imported += 1
 
+        await session.flush()
+        await rebuild_place_stats(session)
+        await bump_dataset_version(session)
         await session.commit()
 
         print(f"✅ Imported {imported} places")
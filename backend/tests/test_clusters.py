@@ -0,0 +1,35 @@
+import asyncio
+
+from app.models.place import AccessibilityStatus
+from app.services.clusters import ClusterIndex, load_blocks
+
+
+class FakeSession:
+    """Returns fixed (cell_x, cell_y, status, count, sum_lat, sum_lon) rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def execute(self, query):
+        return iter(self.rows)
+
+
+def test_load_blocks_counts_null_status_as_unknown(monkeypatch):
+    index = ClusterIndex(grid_size=4, max_zoom=4, ttl=60, max_blocks=10)
+    monkeypatch.setattr("app.services.clusters.cluster_index", index)
+
+    zoom = 2
+    cell = index.cell_for(zoom, 72.87, 19.07)
+    block = index.block_for(zoom, cell)
+    rows = [
+        (*cell, AccessibilityStatus.accessible, 2, 38.1, 145.7),
+        (*cell, None, 1, 19.0, 72.9),
+        (*cell, AccessibilityStatus.unknown, 1, 19.1, 72.8),
+    ]
+
+    blocks = asyncio.run(load_blocks(FakeSession(rows), zoom, [block]))
+
+    aggregate = blocks[block][cell]
+    assert aggregate.count == 4
+    assert aggregate.by_status == {"accessible": 2, "unknown": 2}
+    assert index.get_block(block) is blocks[block]
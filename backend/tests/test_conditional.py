@@ -0,0 +1,85 @@
+import asyncio
+from datetime import datetime, timezone
+
+from starlette.requests import Request
+
+from app.services import conditional
+from app.services.replica import place_replica
+
+DATABASE_AT = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+REPLICA_AT = datetime(2026, 10, 17, 11, 0, tzinfo=timezone.utc)
+
+
+def request_for(path: str, if_none_match: str = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": headers,
+    })
+
+
+def validators(monkeypatch, request, replica):
+    async def read_dataset_version(db):
+        return 8, DATABASE_AT
+
+    monkeypatch.setattr(conditional, "read_dataset_version", read_dataset_version)
+    monkeypatch.setattr(place_replica, "version", 7)
+    monkeypatch.setattr(place_replica, "updated_at", REPLICA_AT)
+    return asyncio.run(conditional.dataset_validators(request, None, replica=replica))
+
+
+def test_sql_served_routes_use_the_database_version(monkeypatch):
+    result = validators(monkeypatch, request_for("/api/places/1"), replica=False)
+    assert result.etag.startswith('"8-')
+    assert result.last_modified == DATABASE_AT
+
+
+def test_replica_served_routes_use_the_replica_version(monkeypatch):
+    result = validators(monkeypatch, request_for("/api/places/stats"), replica=True)
+    assert result.etag.startswith('"7-')
+    assert result.last_modified == REPLICA_AT
+
+
+def test_lagging_replica_etag_does_not_match_database_changes(monkeypatch):
+    stale = validators(monkeypatch, request_for("/api/places/1"), replica=True)
+    request = request_for("/api/places/1", if_none_match=stale.etag)
+    assert not validators(monkeypatch, request, replica=False).is_fresh(request)
+
+
+def fixed_validators(**headers):
+    request = Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/places/1",
+        "query_string": b"",
+        "headers": [(name.replace("_", "-").encode(), value.encode())
+                    for name, value in headers.items()],
+    })
+    return conditional.Validators(etag='"8-abc"', last_modified=DATABASE_AT), request
+
+
+def test_if_none_match_uses_weak_comparison():
+    for header in ['"8-abc"', 'W/"8-abc"', '"7-abc", W/"8-abc"', "*"]:
+        validators, request = fixed_validators(if_none_match=header)
+        assert validators.is_fresh(request), header
+
+    validators, request = fixed_validators(if_none_match='W/"7-abc"')
+    assert not validators.is_fresh(request)
+
+
+def test_if_modified_since_uses_the_sent_last_modified():
+    validators, _ = fixed_validators()
+    place_updated_at = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    validators = validators._replace(last_modified=place_updated_at)
+
+    _, request = fixed_validators(
+        if_modified_since=validators.headers()["Last-Modified"])
+    assert validators.is_fresh(request)
+
+    _, request = fixed_validators(if_modified_since="Tue, 30 Sep 2026 00:00:00 GMT")
+    assert not validators.is_fresh(request)
@@ -0,0 +1,51 @@
+import asyncio
+
+from app.models.place import ContributionStatus
+from app.services.contribution_counts import COUNT_SLOTS, apply_status_changes
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+
+def written_rows(deltas):
+    db = RecordingSession()
+    asyncio.run(apply_status_changes(db, deltas))
+    if not db.statements:
+        return []
+    params = db.statements[0].compile().params
+    count = len([name for name in params if name.startswith("status_m")])
+    return [
+        (params[f"status_m{i}"], params[f"slot_m{i}"], params[f"count_m{i}"])
+        for i in range(count)
+    ]
+
+
+def test_changes_share_one_slot_in_status_order():
+    rows = written_rows({
+        ContributionStatus.pending: -1,
+        ContributionStatus.approved: 1,
+        ContributionStatus.rejected: 0,
+    })
+    assert [(status, count) for status, _, count in rows] == [
+        (ContributionStatus.approved, 1),
+        (ContributionStatus.pending, -1),
+    ]
+    assert len({slot for _, slot, _ in rows}) == 1
+    assert 0 <= rows[0][1] < COUNT_SLOTS
+
+
+def test_writers_spread_over_slots():
+    slots = {
+        written_rows({ContributionStatus.pending: 1})[0][1]
+        for _ in range(200)
+    }
+    assert len(slots) > COUNT_SLOTS // 2
+
+
+def test_no_changes_write_nothing():
+    assert written_rows({ContributionStatus.pending: 0}) == []
@@ -0,0 +1,33 @@
+import pytest
+
+from app.schemas.place import AccessibilityStatus, PlaceFilters
+from app.services.count_cache import CachedCount, CountCache
+from app.services.place_filters import filters_cache_key
+
+
+def test_filters_cache_key_ignores_order_and_duplicates():
+    first = PlaceFilters(
+        category=["park", "hospital"],
+        accessibility_status=[AccessibilityStatus.accessible],
+        search="Chhatrapati",
+    )
+    second = PlaceFilters(
+        category=["hospital", "park", "park"],
+        accessibility_status=[AccessibilityStatus.accessible],
+        search="छत्रपति",
+    )
+    assert filters_cache_key(first) == filters_cache_key(second)
+    assert filters_cache_key(PlaceFilters()) == filters_cache_key(PlaceFilters(category=[]))
+    assert filters_cache_key(first) != filters_cache_key(PlaceFilters(category=["park"]))
+
+
+@pytest.mark.parametrize("invalidate_first", [False, True])
+def test_count_cache_generation(invalidate_first):
+    cache = CountCache(ttl=60, max_entries=10)
+    generation = cache.generation
+    if invalidate_first:
+        cache.invalidate()
+    cache.set("exact:key", CachedCount(total=5, estimated=False), generation)
+
+    expected = None if invalidate_first else CachedCount(total=5, estimated=False)
+    assert cache.get("exact:key") == expected
@@ -0,0 +1,42 @@
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.config import settings
+from app.services.duplicates import find_duplicate_candidates
+from app.services.search import build_search_key
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})))
+        return []
+
+
+def contribution(name="Chatrapati Shivaji Terminus"):
+    return SimpleNamespace(name=name, name_local=None, longitude=72.8355, latitude=18.9398)
+
+
+def test_threshold_set_for_transaction_before_query():
+    db = RecordingSession()
+    asyncio.run(find_duplicate_candidates(db, contribution()))
+
+    threshold, query = db.statements
+    assert "set_config('pg_trgm.word_similarity_threshold', " \
+        f"'{settings.duplicate_min_similarity}', true)" in threshold
+    key = build_search_key("Chatrapati Shivaji Terminus", None, None)
+    # the default dialect escapes % for pyformat
+    assert f"places.search_key %%> '{key}'" in query
+    assert "word_similarity(" not in query.split("WHERE")[1].split("ORDER BY")[0]
+    assert "ORDER BY word_similarity(" in query
+
+
+def test_empty_name_skips_the_query():
+    db = RecordingSession()
+    assert asyncio.run(find_duplicate_candidates(db, contribution(name=""))) == []
+    assert db.statements == []
@@ -0,0 +1,79 @@
+from app.models.place import RestroomAccessibility
+from app.services.features import (
+    BOOLEAN_FEATURES,
+    FEATURE_BITS,
+    RESTROOM,
+    RESTROOM_FULL,
+    VALID_MASKS,
+    allowed_masks,
+    feature_bits,
+    feature_mask,
+)
+
+
+def test_valid_masks_exclude_full_restroom_without_restroom():
+    # 6 independent booleans x 3 restroom levels
+    assert len(VALID_MASKS) == 192
+    assert all(mask & RESTROOM for mask in VALID_MASKS if mask & RESTROOM_FULL)
+
+
+def test_feature_mask_of_dict_and_object():
+    values = {
+        "ramp_present": True,
+        "tactile_paving": True,
+        "audio_signage": False,
+        "accessible_restroom": RestroomAccessibility.full,
+    }
+    expected = (
+        FEATURE_BITS["ramp_present"]
+        | FEATURE_BITS["tactile_paving"]
+        | RESTROOM
+        | RESTROOM_FULL
+    )
+    assert feature_mask(values) == expected
+
+    class Row:
+        ramp_present = True
+        step_free_entrance = None
+        accessible_restroom = RestroomAccessibility.partial
+
+    assert feature_mask(Row()) == FEATURE_BITS["ramp_present"] | RESTROOM
+    assert feature_mask({}) == 0
+
+
+def test_feature_masks_are_valid():
+    for restroom in (None, *RestroomAccessibility):
+        values = {name: True for name in BOOLEAN_FEATURES}
+        values["accessible_restroom"] = restroom
+        assert feature_mask(values) in VALID_MASKS
+
+
+def test_allowed_masks_without_constraints():
+    assert allowed_masks() is None
+
+
+def test_allowed_masks_required_features():
+    required = feature_bits(["ramp_present", "step_free_entrance", "tactile_paving"])
+    masks = allowed_masks(required=required)
+    # 3 free booleans x 3 restroom levels
+    assert len(masks) == 24
+    assert all(mask & required == required for mask in masks)
+
+
+def test_allowed_masks_forbidden_and_restrooms():
+    masks = allowed_masks(
+        forbidden=FEATURE_BITS["ramp_present"],
+        restrooms=[RestroomAccessibility.full],
+    )
+    assert len(masks) == 32
+    assert all(not mask & FEATURE_BITS["ramp_present"] for mask in masks)
+    assert all(mask & RESTROOM_FULL for mask in masks)
+
+    assert allowed_masks(required=RESTROOM_FULL, forbidden=RESTROOM) == []
+
+
+def test_feature_bits_accepts_enum_members():
+    from app.schemas.place import PlaceFeature
+
+    assert feature_bits([PlaceFeature.ramp_present, "braille_signage"]) == (
+        FEATURE_BITS["ramp_present"] | FEATURE_BITS["braille_signage"])
@@ -0,0 +1,115 @@
+import json
+import struct
+from itertools import accumulate
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.models.place import AccessibilityStatus
+from app.services.markers import (
+    COORDINATE_SCALE,
+    MARKERS_MAGIC,
+    MARKERS_VERSION,
+    STATUSES,
+    MarkerColumns,
+    delta_encode,
+)
+
+
+def delta_decode(values: list[int]) -> list[float]:
+    return [value / COORDINATE_SCALE for value in accumulate(values)]
+
+
+def test_delta_encode_round_trips():
+    latitudes = [19.076090, 19.076123, 18.520430, -12.5, 0.0, 28.613939]
+    encoded = delta_encode(latitudes)
+    assert all(isinstance(value, int) for value in encoded)
+    assert encoded[0] == 19076090
+    assert encoded[1] == 33
+    assert delta_decode(encoded) == [round(value, 6) for value in latitudes]
+
+
+def test_delta_encode_rounds_to_micro_degrees():
+    assert delta_encode([1.0000004, 1.0000006]) == [1000000, 1]
+    assert delta_encode([]) == []
+
+
+def marker_rows():
+    return [
+        (uuid4(), 19.07609, 72.877426, AccessibilityStatus.accessible, "hospital", 3),
+        (uuid4(), 18.52043, 73.856743, AccessibilityStatus.unknown, "park", 0),
+        (uuid4(), 28.613939, 77.209021, AccessibilityStatus.accessible, "hospital", 192),
+    ]
+
+
+def test_marker_columns_json():
+    rows = marker_rows()
+    payload = MarkerColumns(rows).to_json(delta=True)
+
+    assert payload["count"] == 3
+    assert payload["encoding"] == "delta"
+    assert payload["categories"] == ["hospital", "park"]
+    assert payload["category_code"] == [0, 1, 0]
+    assert [STATUSES[code] for code in payload["status_code"]] == [
+        row[3].value for row in rows]
+    assert payload["features"] == [3, 0, 192]
+    assert delta_decode(payload["lat"]) == [row[1] for row in rows]
+    assert delta_decode(payload["lon"]) == [row[2] for row in rows]
+
+
+def decode_binary(payload: bytes) -> dict:
+    magic, version, _, count, tables_length = struct.unpack_from("<4sHHII", payload)
+    offset = struct.calcsize("<4sHHII")
+    tables = json.loads(payload[offset:offset + tables_length])
+    offset += tables_length
+
+    decoded = {"magic": magic, "version": version, "count": count, **tables}
+    decoded["ids"] = [
+        UUID(bytes=payload[offset + 16 * i:offset + 16 * (i + 1)]) for i in range(count)]
+    offset += 16 * count
+
+    for name, code in [
+        ("lat", "f"), ("lon", "f"), ("category_code", "H"),
+        ("status_code", "B"), ("features", "B"),
+    ]:
+        size = struct.calcsize(code)
+        # Typed arrays need offsets that are a multiple of the element size
+        assert offset % size == 0
+        decoded[name] = list(struct.unpack_from(f"<{count}{code}", payload, offset))
+        offset += size * count
+
+    assert offset == len(payload)
+    return decoded
+
+
+def test_marker_columns_binary_round_trips():
+    rows = marker_rows()
+    decoded = decode_binary(MarkerColumns(rows).to_binary())
+
+    assert decoded["magic"] == MARKERS_MAGIC
+    assert decoded["version"] == MARKERS_VERSION
+    assert decoded["count"] == 3
+    assert decoded["statuses"] == STATUSES
+    assert decoded["categories"] == ["hospital", "park"]
+    assert decoded["ids"] == [row[0] for row in rows]
+    assert decoded["lat"] == pytest.approx([row[1] for row in rows], abs=1e-5)
+    assert decoded["lon"] == pytest.approx([row[2] for row in rows], abs=1e-5)
+    assert decoded["category_code"] == [0, 1, 0]
+    assert [STATUSES[code] for code in decoded["status_code"]] == [
+        row[3].value for row in rows]
+    assert decoded["features"] == [3, 0, 192]
+
+
+def test_marker_columns_binary_without_markers():
+    decoded = decode_binary(MarkerColumns([]).to_binary())
+    assert decoded["count"] == 0
+    assert decoded["categories"] == []
+
+
+def test_null_status_is_coded_as_unknown():
+    rows = [*marker_rows(), (uuid4(), 19.0, 72.8, None, "park", 0)]
+    columns = MarkerColumns(rows)
+    unknown = STATUSES.index(AccessibilityStatus.unknown.value)
+
+    assert columns.to_json(delta=True)["status_code"][-1] == unknown
+    assert decode_binary(columns.to_binary())["status_code"][-1] == unknown
@@ -0,0 +1,86 @@
+import pytest
+
+from app.models.place import AccessibilityStatus, DataSource, RestroomAccessibility
+from app.services.osm import osm_place_values
+
+
+def element(**tags):
+    tags = {"amenity": "hospital", "name": "City Hospital", **tags}
+    return ("n", 42, 19.0760, 72.8777, tags)
+
+
+def test_unrelated_objects_are_skipped():
+    assert osm_place_values(("n", 1, 0.0, 0.0, {"amenity": "bench", "name": "Bench"})) is None
+    assert osm_place_values(("n", 1, 0.0, 0.0, {"amenity": "hospital"})) is None
+
+
+def test_basic_mapping():
+    values = osm_place_values(element(**{"name:hi": "सिटी अस्पताल", "addr:city": "Mumbai"}))
+    assert values["legacy_id"] == "osm:n42"
+    assert values["category"] == "hospital"
+    assert values["name_local"] == "सिटी अस्पताल"
+    assert values["address"] == "Mumbai"
+    assert values["source"] == DataSource.osm
+    assert values["accessibility_status"] == AccessibilityStatus.unknown
+
+
+@pytest.mark.parametrize("tags, step_free, status", [
+    # Explicit verdicts win over the feature score
+    ({"wheelchair": "no"}, False, AccessibilityStatus.not_accessible),
+    ({"wheelchair": "no", "ramp": "yes"}, False, AccessibilityStatus.not_accessible),
+    ({"wheelchair": "limited"}, False, AccessibilityStatus.partially_accessible),
+    ({"wheelchair": "limited", "step_count": "0"}, True,
+     AccessibilityStatus.partially_accessible),
+    # wheelchair=yes implies a step-free entrance unless steps are counted
+    ({"wheelchair": "yes"}, True, None),
+    ({"wheelchair": "yes", "entrance:step_count": "2"}, False, None),
+    ({"entrance:step_count": "0"}, True, None),
+    ({"step_count": "3"}, False, None),
+    ({"entrance:wheelchair": "yes"}, True, None),
+    ({"entrance:wheelchair": "no", "wheelchair": "yes"}, False, None),
+    # Objects mapped as their own entrance
+    ({"entrance": "main", "door": "automatic"}, True, None),
+    ({"entrance": "main", "door": "sliding"}, True, None),
+    ({"entrance": "main", "door": "hinged"}, False, None),
+    ({"entrance": "main", "door": "automatic", "step_count": "1"}, False, None),
+    ({"door": "automatic"}, False, None),
+    ({}, False, None),
+])
+def test_wheelchair_and_entrance_tags(tags, step_free, status):
+    values = osm_place_values(element(**tags))
+    assert values["step_free_entrance"] is step_free
+    if status is not None:
+        assert values["accessibility_status"] == status
+
+
+def test_step_free_entrance_scores():
+    values = osm_place_values(element(wheelchair="yes"))
+    assert values["accessibility_score"] > 0
+    assert values["accessibility_status"] != AccessibilityStatus.unknown
+
+
+@pytest.mark.parametrize("tags, restroom", [
+    ({"toilets:wheelchair": "yes"}, RestroomAccessibility.full),
+    ({"toilets:wheelchair": "limited"}, RestroomAccessibility.partial),
+    ({"toilets:wheelchair": "no"}, RestroomAccessibility.none),
+    ({"wheelchair": "yes"}, RestroomAccessibility.none),
+])
+def test_restroom_tags(tags, restroom):
+    assert osm_place_values(element(**tags))["accessible_restroom"] == restroom
+
+
+def test_wheelchair_on_a_toilets_node_describes_the_toilet():
+    tags = {"amenity": "toilets", "name": "Public Toilet", "wheelchair": "limited"}
+    values = osm_place_values(("n", 7, 19.0, 72.8, tags))
+    assert values["accessible_restroom"] == RestroomAccessibility.partial
+    assert values["accessibility_status"] == AccessibilityStatus.partially_accessible
+
+
+@pytest.mark.parametrize("tags, explicit", [
+    ({"wheelchair": "no"}, True),
+    ({"wheelchair": "limited"}, True),
+    ({"wheelchair": "yes"}, False),
+    ({}, False),
+])
+def test_wheelchair_verdicts_are_flagged_explicit(tags, explicit):
+    assert osm_place_values(element(**tags))["status_explicit"] is explicit
@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.models.place import AccessibilityStatus
+from app.services.place_events import PlaceSnapshot
+from app.services.place_stats import stats_deltas
+
+
+def place(status, category="park"):
+    return SimpleNamespace(
+        id=uuid4(),
+        category=category,
+        accessibility_status=status,
+        latitude=19.07,
+        longitude=72.87,
+    )
+
+
+def test_snapshot_reads_enum_and_string_statuses():
+    snapshot = PlaceSnapshot.of(place(AccessibilityStatus.accessible))
+    assert snapshot.accessibility_status == "accessible"
+    snapshot = PlaceSnapshot.of(place("not_accessible"))
+    assert snapshot.accessibility_status == "not_accessible"
+
+
+def test_snapshot_counts_null_status_as_unknown():
+    assert PlaceSnapshot.of(place(None)).accessibility_status == "unknown"
+
+
+def test_stats_deltas_for_status_change_from_null():
+    before = PlaceSnapshot.of(place(None))
+    after = before._replace(accessibility_status="accessible")
+
+    inserted = PlaceSnapshot.of(place(None, "cafe"))
+
+    assert stats_deltas([(before, after), (None, inserted)]) == {
+        ("unknown", "park"): -1,
+        ("accessible", "park"): 1,
+        ("unknown", "cafe"): 1,
+    }
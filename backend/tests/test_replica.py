@@ -0,0 +1,158 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+from app.models.place import (
+    AccessibilityStatus,
+    DataSource,
+    LevelSetting,
+    RestroomAccessibility,
+)
+from app.schemas.place import PlaceFilters
+from app.services.change_feed import (
+    IDS_PER_NOTIFICATION,
+    notification_payloads,
+    parse_notification,
+)
+from app.services.replica import PlaceReplica, ReplicaData, ReplicaFilter
+from app.services.serialization import PLACE_FIELDS, dumps
+
+UPDATED_AT = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+
+def place_row(place_id, latitude=19.07, longitude=72.87, category="park"):
+    return SimpleNamespace(
+        id=place_id,
+        latitude=latitude,
+        longitude=longitude,
+        accessibility_status=AccessibilityStatus.accessible,
+        category=category,
+        features=0,
+        accessibility_score=80,
+        name="Gateway Garden",
+        name_local="गेटवे उद्यान",
+        address=None,
+        ramp_present=True,
+        step_free_entrance=False,
+        accessible_restroom=RestroomAccessibility.partial,
+        tactile_paving=False,
+        audio_signage=False,
+        braille_signage=False,
+        lighting_level=LevelSetting.medium,
+        noise_level=LevelSetting.low,
+        staff_assistance_available=True,
+        notes=None,
+        legacy_id=None,
+        photo_url=None,
+        source=DataSource.osm,
+        created_at=UPDATED_AT,
+        updated_at=UPDATED_AT,
+    )
+
+
+def replica_with(rows, version=5):
+    """A replica at `version` that re-reads places from `rows`"""
+    replica = PlaceReplica(cell_degrees=0.1, sync_seconds=1, max_staleness=5)
+    replica.data = ReplicaData(replica.cell_degrees)
+    replica.version = version
+
+    async def read_places(ids):
+        return [row for row in rows.values() if row.id in ids]
+
+    replica._read_places = read_places
+    return replica
+
+
+def test_notification_payloads_are_split_into_numbered_parts():
+    ids = [uuid4() for _ in range(IDS_PER_NOTIFICATION * 2 + 1)]
+    notifications = [
+        parse_notification(payload)
+        for payload in notification_payloads(6, UPDATED_AT, ids)
+    ]
+    assert [(n.part, n.parts) for n in notifications] == [(0, 3), (1, 3), (2, 3)]
+    assert {place_id for n in notifications for place_id in n.ids} == set(ids)
+
+    (reload,) = notification_payloads(7, UPDATED_AT)
+    assert parse_notification(reload).ids is None
+
+
+def test_version_split_across_two_payloads_is_fully_applied():
+    ids = [uuid4() for _ in range(IDS_PER_NOTIFICATION * 2)]
+    rows = {place_id: place_row(place_id) for place_id in ids}
+    replica = replica_with(rows)
+    first, second = notification_payloads(6, UPDATED_AT, ids)
+
+    # The second part arrives in a later sync iteration
+    asyncio.run(replica._apply([first]))
+    assert len(replica.data) == IDS_PER_NOTIFICATION
+    assert replica.version == 5
+
+    asyncio.run(replica._apply([second]))
+    assert len(replica.data) == len(ids)
+    assert replica.version == 6
+    assert replica.updated_at == UPDATED_AT
+
+
+def test_later_version_waits_for_an_incomplete_one():
+    ids = [uuid4() for _ in range(IDS_PER_NOTIFICATION + 1)]
+    other = uuid4()
+    rows = {place_id: place_row(place_id) for place_id in [*ids, other]}
+    replica = replica_with(rows)
+    first, second = notification_payloads(6, UPDATED_AT, ids)
+    (next_version,) = notification_payloads(7, UPDATED_AT, [other])
+
+    asyncio.run(replica._apply([first, next_version]))
+    assert replica.version == 5
+
+    asyncio.run(replica._apply([second]))
+    assert replica.version == 7
+    assert len(replica.data) == len(ids) + 1
+
+
+def test_applied_versions_are_skipped_and_deletes_applied():
+    kept, deleted = uuid4(), uuid4()
+    rows = {kept: place_row(kept), deleted: place_row(deleted)}
+    replica = replica_with(rows)
+    asyncio.run(replica._apply(notification_payloads(6, UPDATED_AT, [kept, deleted])))
+
+    del rows[deleted]
+    rows[kept] = place_row(kept, category="cafe")
+    asyncio.run(replica._apply(notification_payloads(5, UPDATED_AT, [kept, deleted])))
+    assert len(replica.data) == 2
+
+    asyncio.run(replica._apply(notification_payloads(7, UPDATED_AT, [kept, deleted])))
+    assert len(replica.data) == 1
+    assert replica.data.stats() == [("accessible", "cafe", 1)]
+    assert replica.version == 7
+
+
+def test_replica_nearby_orders_by_distance():
+    data = ReplicaData(cell_degrees=0.1)
+    near, far, outside = uuid4(), uuid4(), uuid4()
+    data.upsert(place_row(near, 19.0701, 72.8701))
+    data.upsert(place_row(far, 19.08, 72.88))
+    data.upsert(place_row(outside, 19.5, 73.5))
+
+    matches = data.nearby(19.07, 72.87, 5000, ReplicaFilter.of(PlaceFilters()), None, 10)
+    assert [place["id"] for place, _ in matches] == [near, far]
+    assert matches[0][1] < matches[1][1] < 5000
+
+    after = (matches[0][1], near)
+    matches = data.nearby(19.07, 72.87, 5000, ReplicaFilter.of(PlaceFilters()), after, 10)
+    assert [place["id"] for place, _ in matches] == [far]
+
+
+def test_replica_places_render_like_the_stored_row():
+    data = ReplicaData(cell_degrees=0.1)
+    # Trailing zero bytes are dropped by numpy "S16" items
+    row = place_row(UUID("12345678-1234-5678-1234-567812340000"))
+    data.upsert(row)
+
+    (place,) = data.bbox(72.8, 19.0, 72.9, 19.1, ReplicaFilter.of(PlaceFilters()), 10)
+    assert place["id"] == row.id
+    assert dumps(place) == dumps({field: getattr(row, field) for field in PLACE_FIELDS})
+
+    (place,) = data.bbox(
+        72.8, 19.0, 72.9, 19.1, ReplicaFilter.of(PlaceFilters()), 10, ("id", "name"))
+    assert place == {"id": row.id, "name": "Gateway Garden"}
@@ -0,0 +1,13 @@
+from sqlalchemy.dialects import postgresql
+
+from scripts.rescore_places import rescore_chunk
+
+
+def test_rescore_keeps_explicit_statuses():
+    _, rescore = rescore_chunk(None, 100)
+    sql = str(rescore.compile(dialect=postgresql.dialect()))
+
+    # Explicit rows keep their status in both the SET and the change check
+    kept = "CASE WHEN places.status_explicit THEN places.accessibility_status ELSE"
+    assert sql.count(kept) == 2
+    assert "accessibility_score=anon_1.score" in sql
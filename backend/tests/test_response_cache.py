@@ -0,0 +1,61 @@
+from starlette.requests import Request
+
+from app.services.response_cache import ResponseCache, cache_key
+
+
+def request_for(path: str, query: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query.encode(),
+        "headers": [],
+    })
+
+
+def test_cache_key_orders_query_parameters():
+    first = cache_key(request_for("/api/places/stats", "b=2&a=1&a=0"))
+    second = cache_key(request_for("/api/places/stats", "a=0&b=2&a=1"))
+    assert first == second == "/api/places/stats?a=0&a=1&b=2"
+    assert cache_key(request_for("/api/places/stats", "")) == "/api/places/stats?"
+
+
+def test_response_cache_invalidates_by_tag():
+    cache = ResponseCache(ttl=60, max_entries=10)
+    cache.set("stats", {"total": 1}, ["stats"], cache.generation)
+    cache.set("place-a", {"id": "a"}, ["place:a"], cache.generation)
+
+    cache.invalidate("place:a")
+    assert cache.get("place-a") is None
+    assert cache.get("stats") == {"total": 1}
+
+
+def test_response_cache_drops_values_loaded_before_an_invalidation():
+    cache = ResponseCache(ttl=60, max_entries=10)
+    generation = cache.generation
+    cache.invalidate("stats")
+    cache.set("stats", {"total": 1}, ["stats"], generation)
+    assert cache.get("stats") is None
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache(ttl=60, max_entries=2)
+    cache.set("a", 1, [], cache.generation)
+    cache.set("b", 2, [], cache.generation)
+    assert cache.get("a") == 1
+    cache.set("c", 3, ["tag"], cache.generation)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_response_cache_expires_entries(monkeypatch):
+    cache = ResponseCache(ttl=10, max_entries=10)
+    now = 1000.0
+    monkeypatch.setattr("app.services.response_cache.time.monotonic", lambda: now)
+    cache.set("stats", 1, ["stats"], cache.generation)
+
+    now += 11
+    assert cache.get("stats") is None
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,69 @@
+from app.services.search import (
+    build_search_key,
+    normalize_search_text,
+    search_condition,
+    search_distance,
+    transliterate,
+)
+
+
+def test_transliterate_devanagari():
+    assert transliterate("छत्रपति") == "chhatrapati"
+    assert transliterate("ताज महल") == "taaj mahal"
+
+
+def test_transliterate_leaves_latin_and_maps_digits():
+    assert transliterate("Station ५") == "Station 5"
+    assert transliterate("Pune") == "Pune"
+
+
+def test_transliterate_other_indic_scripts():
+    # Bengali shares the Devanagari table through the ISCII layout
+    assert normalize_search_text("কলকাতা") == normalize_search_text("Kalakata")
+
+
+def test_spelling_variants_share_a_key():
+    variants = ["Chhatrapati", "Chatrapati", "Chhatrapatī", "छत्रपति"]
+    assert {normalize_search_text(name) for name in variants} == {"catrapati"}
+
+
+def test_latin_and_devanagari_names_share_a_key():
+    pairs = [
+        ("Shivaji", "शिवाजी"),
+        ("Mumbai", "मुंबई"),
+        ("Mumbai", "मुम्बई"),
+        ("Dilli", "दिल्ली"),
+        ("Ganesh", "गणेश"),
+        ("Taj Mahal", "ताज महल"),
+    ]
+    for latin, local in pairs:
+        assert normalize_search_text(latin) == normalize_search_text(local)
+
+
+def test_normalize_splits_words_and_drops_punctuation():
+    assert normalize_search_text("  Pune, Railway-Station! ") == "pune railvay station"
+    assert normalize_search_text("") == ""
+    assert normalize_search_text(None) == ""
+
+
+def test_build_search_key_skips_empty_parts():
+    key = build_search_key("Chhatrapati Shivaji", "छत्रपति शिवाजी", None)
+    assert key == "catrapati sivaji catrapati sivaji"
+    assert build_search_key(None, "", None) == ""
+
+
+def test_search_condition_without_key_matches_nothing():
+    from app.models.place import Place
+
+    assert str(search_condition(Place.search_key, "!!!")) == "false"
+
+
+def test_search_distance_orders_by_the_knn_operator():
+    from sqlalchemy.dialects import postgresql
+
+    from app.models.place import Place
+
+    expression = search_distance(Place.search_key, "छत्रपति")
+    sql = str(expression.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert sql == "places.search_key <->> 'catrapati'"
@@ -0,0 +1,58 @@
+import asyncio
+import logging
+
+from app.services import submission_buffer as buffer_module
+from app.services.submission_buffer import SubmissionBuffer
+
+
+class FakeSession:
+    def __init__(self, store):
+        self.store = store
+        self.rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, rows=None):
+        if rows is None:
+            return
+        if any(row.get("bad") for row in rows):
+            raise ValueError("violates check constraint")
+        self.rows.extend(rows)
+
+    async def commit(self):
+        self.store.extend(self.rows)
+
+
+def flush(monkeypatch, batch):
+    committed = []
+    monkeypatch.setattr(buffer_module, "AsyncSessionLocal", lambda: FakeSession(committed))
+    monkeypatch.setattr(buffer_module, "RETRY_DELAYS", ())
+    buffer = SubmissionBuffer(max_size=10, batch_size=10, flush_seconds=0.1)
+    asyncio.run(buffer._flush(batch))
+    return buffer, committed
+
+
+def test_batch_inserted_at_once(monkeypatch):
+    buffer, committed = flush(monkeypatch, [{"id": 1}, {"id": 2}])
+    assert [row["id"] for row in committed] == [1, 2]
+    assert buffer.stats()["dropped"] == 0
+
+
+def test_failed_batch_drops_only_the_bad_row(monkeypatch, caplog):
+    batch = [{"id": 1}, {"id": 2, "bad": True}, {"id": 3}]
+    with caplog.at_level(logging.ERROR):
+        buffer, committed = flush(monkeypatch, batch)
+
+    assert [row["id"] for row in committed] == [1, 3]
+    assert buffer.stats()["dropped"] == 1
+    assert [record.levelno for record in caplog.records] == [logging.ERROR]
+    assert "Dropped buffered contribution 2" in caplog.records[0].getMessage()
+
+
+def test_stats_before_start():
+    buffer = SubmissionBuffer(max_size=10, batch_size=10, flush_seconds=0.1)
+    assert buffer.stats() == {"running": False, "queued": 0, "max_size": 10, "dropped": 0}
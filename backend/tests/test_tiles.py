@@ -0,0 +1,33 @@
+from app.services.tiles import TileCache, tiles_for
+
+
+def test_interior_point_is_in_one_tile():
+    assert tiles_for(72.8777, 19.076, 0) == {(0, 0)}
+    assert tiles_for(72.8777, 19.076, 10) == {(719, 456)}
+
+
+def test_point_on_an_edge_is_in_both_tiles():
+    # Longitude 0 and the equator split zoom 1 into four tiles
+    assert tiles_for(0.0, 10.0, 1) == {(0, 0), (1, 0)}
+    assert tiles_for(10.0, 0.0, 1) == {(1, 0), (1, 1)}
+    assert tiles_for(0.0, 0.0, 1) == {(0, 0), (0, 1), (1, 0), (1, 1)}
+
+
+def test_world_edges_stay_in_range():
+    assert tiles_for(-180.0, 89.9, 2) == {(0, 0)}
+    assert tiles_for(180.0, -89.9, 2) == {(3, 3)}
+
+
+def test_invalidate_point_drops_neighbouring_edge_tiles():
+    cache = TileCache(ttl=60, max_bytes=1000, max_zoom=1)
+    for key in [(0, 0, 0), (1, 0, 0), (1, 1, 0), (1, 0, 1), (1, 1, 1)]:
+        cache.set(key, b"tile", cache.generation)
+
+    cache.invalidate_point(0.0, 10.0)
+
+    assert cache.get((0, 0, 0)) is None
+    assert cache.get((1, 0, 0)) is None
+    assert cache.get((1, 1, 0)) is None
+    assert cache.get((1, 0, 1)) == b"tile"
+    assert cache.get((1, 1, 1)) == b"tile"
+    assert cache.size == 8